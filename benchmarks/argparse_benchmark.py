@@ -0,0 +1,369 @@
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable, Sequence
+import contextlib
+from dataclasses import dataclass
+import gc
+from importlib import import_module
+import io
+import os
+import random
+import shlex
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+
+from cliargparser import Command, CompiledParser
+from cliargparser.argparse_compat import UnmappedArgument, import_argparse_parser
+from cliargparser.validation import ValidationSummary, validate_corpus
+
+
+_WORDS = ("alpha", "beta", "gamma", "delta", "main", "release", "prod", "eu-west")
+
+
+@dataclass(frozen=True, slots=True)
+class ParserMeasurement:
+    name: str
+    invocations: int
+    errors: int
+
+    # Best of the timed rounds over the whole corpus.
+    seconds: float
+
+    # Per-invocation latency percentiles.
+    p50_ns: int
+    p90_ns: int
+    p99_ns: int
+
+    # Peak traced allocation while parsing the whole corpus once.
+    peak_memory: int
+
+    @property
+    def throughput(self) -> float:
+        return self.invocations / self.seconds if self.seconds else float("inf")
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkReport:
+    baseline: ParserMeasurement
+    measurements: tuple[ParserMeasurement, ...]
+    unmapped: tuple[UnmappedArgument, ...]
+
+    # Best of the timed rounds of `validate_corpus` over the corpus as a file.
+    validation: ValidationSummary
+
+    def format(self) -> str:
+        lines = [
+            (
+                f"{'parser':<24}{'inv/s':>12}{'relative':>10}"
+                f"{'p50 us':>9}{'p90 us':>9}{'p99 us':>9}{'peak KiB':>10}{'errors':>8}"
+            )
+        ]
+        for measurement in (self.baseline, *self.measurements):
+            relative = measurement.throughput / self.baseline.throughput
+            lines.append(
+                f"{measurement.name:<24}"
+                f"{measurement.throughput:>12,.0f}"
+                f"{relative:>9.2f}x"
+                f"{measurement.p50_ns / 1000:>9.1f}"
+                f"{measurement.p90_ns / 1000:>9.1f}"
+                f"{measurement.p99_ns / 1000:>9.1f}"
+                f"{measurement.peak_memory / 1024:>10.1f}"
+                f"{measurement.errors:>8}"
+            )
+
+        validation = self.validation
+        lines.append("")
+        lines.append(
+            f"corpus validation: {validation.throughput:,.0f} lines/s, "
+            f"{validation.byte_count / validation.seconds / (1 << 20):.1f} MiB/s "
+            f"({validation.invalid_lines} invalid of {validation.lines})"
+        )
+
+        if self.unmapped:
+            lines.append("")
+            lines.append(f"Unmapped ({len(self.unmapped)}):")
+            lines.extend(f"  {unmapped}" for unmapped in self.unmapped)
+
+        return "\n".join(lines)
+
+
+def run_benchmark(
+    parser: argparse.ArgumentParser,
+    *,
+    corpus: Sequence[Sequence[str]] | None = None,
+    corpus_size: int = 10_000,
+    seed: int = 0,
+    rounds: int = 5,
+) -> BenchmarkReport:
+    imported = import_argparse_parser(parser)
+    compiled_parser = CompiledParser(imported.command)
+
+    if corpus is None:
+        corpus = generate_corpus(parser, corpus_size, seed=seed)
+
+    arguments = [list(argv) for argv in corpus]
+
+    return BenchmarkReport(
+        baseline=_measure("argparse", parser.parse_args, arguments, rounds),
+        measurements=(
+            _measure(
+                "cliargparser", imported.command.parse_arguments, arguments, rounds
+            ),
+            _measure(
+                "cliargparser (compiled)",
+                compiled_parser.parse_arguments,
+                arguments,
+                rounds,
+            ),
+        ),
+        unmapped=imported.unmapped,
+        validation=_measure_validation(imported.command, arguments, rounds),
+    )
+
+
+def generate_corpus(
+    parser: argparse.ArgumentParser, size: int, *, seed: int = 0
+) -> list[list[str]]:
+    rng = random.Random(seed)
+    return [_generate_arguments(parser, rng) for _ in range(size)]
+
+
+def _generate_arguments(
+    parser: argparse.ArgumentParser, rng: random.Random
+) -> list[str]:
+    arguments: list[str] = []
+
+    while True:
+        # At most one option of each mutually exclusive group, exactly one if
+        # the group is required.
+        chosen: set[int] = set()
+        excluded: set[int] = set()
+        for group in parser._mutually_exclusive_groups:
+            candidates = [
+                action
+                for action in group._group_actions
+                if action.option_strings and _is_generated(action)
+            ]
+            if candidates and (group.required or rng.random() < 0.5):
+                chosen.add(id(rng.choice(candidates)))
+
+            excluded.update(
+                id(action) for action in group._group_actions
+                if id(action) not in chosen
+            )
+
+        subparsers_action: argparse._SubParsersAction[Any] | None = None
+        operand_arguments: list[str] = []
+        for action in parser._actions:
+            if isinstance(action, argparse._SubParsersAction):
+                subparsers_action = action
+            elif id(action) in excluded or not _is_generated(action):
+                continue
+            elif not action.option_strings:
+                operand_arguments.extend(_generate_operand(action, rng))
+            elif id(action) in chosen or action.required or rng.random() < 0.5:
+                arguments.extend(_generate_option(action, rng))
+
+        # Options never take following tokens as variable-count values, so
+        # operands can safely come after them.
+        arguments.extend(operand_arguments)
+
+        if subparsers_action is None:
+            return arguments
+
+        name = rng.choice(list(subparsers_action.choices))
+        arguments.append(name)
+        parser = subparsers_action.choices[name]
+
+
+def _is_generated(action: argparse.Action) -> bool:
+    # Only what `import_argparse_parser` maps, so both parsers see valid input.
+    if isinstance(action, (argparse._HelpAction, argparse._VersionAction)):
+        return False
+    elif action.nargs in (argparse.REMAINDER, argparse.PARSER):
+        return False
+
+    return not action.option_strings or bool(_spellings(action))
+
+
+def _spellings(action: argparse.Action) -> list[str]:
+    return [
+        option_string
+        for option_string in action.option_strings
+        if option_string.startswith("--") or len(option_string) == 2
+    ]
+
+
+def _generate_option(action: argparse.Action, rng: random.Random) -> list[str]:
+    spelling = rng.choice(_spellings(action))
+
+    nargs = action.nargs
+    if nargs == 0:
+        return [spelling]
+
+    if nargs in (argparse.OPTIONAL, argparse.ZERO_OR_MORE, argparse.ONE_OR_MORE):
+        # Attached, so the value count is unambiguous for both parsers.
+        value = _generate_value(action, rng)
+        if spelling.startswith("--"):
+            return [f"{spelling}={value}"]
+
+        return [f"{spelling}{value}"]
+
+    count = nargs if isinstance(nargs, int) else 1
+    return [spelling, *(_generate_value(action, rng) for _ in range(count))]
+
+
+def _generate_operand(action: argparse.Action, rng: random.Random) -> list[str]:
+    nargs = action.nargs
+    if nargs in (argparse.ZERO_OR_MORE, argparse.ONE_OR_MORE):
+        count = rng.randint(1, 2)
+    elif isinstance(nargs, int):
+        count = nargs
+    else:
+        count = 1
+
+    return [_generate_value(action, rng) for _ in range(count)]
+
+
+def _generate_value(action: argparse.Action, rng: random.Random) -> str:
+    if action.choices:
+        return str(rng.choice(list(action.choices)))
+    elif action.type in (int, "int"):
+        return str(rng.randrange(1000))
+    elif action.type in (float, "float"):
+        return f"{rng.uniform(0, 100):.3f}"
+
+    return rng.choice(_WORDS)
+
+
+def _measure(
+    name: str,
+    parse: Callable[[list[str]], Any],
+    corpus: list[list[str]],
+    rounds: int,
+) -> ParserMeasurement:
+    # `argparse` reports errors on stderr and exits.
+    with contextlib.redirect_stderr(io.StringIO()):
+        errors = 0
+        for arguments in corpus:
+            try:
+                parse(arguments)
+            except (Exception, SystemExit):
+                errors += 1
+
+        best = float("inf")
+        for _ in range(rounds):
+            gc.collect()
+            start = time.perf_counter()
+            for arguments in corpus:
+                try:
+                    parse(arguments)
+                except (Exception, SystemExit):
+                    pass
+            best = min(best, time.perf_counter() - start)
+
+        latencies: list[int] = []
+        for arguments in corpus:
+            start_ns = time.perf_counter_ns()
+            try:
+                parse(arguments)
+            except (Exception, SystemExit):
+                pass
+            latencies.append(time.perf_counter_ns() - start_ns)
+
+        gc.collect()
+        tracemalloc.start()
+        try:
+            for arguments in corpus:
+                try:
+                    parse(arguments)
+                except (Exception, SystemExit):
+                    pass
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    latencies.sort()
+    return ParserMeasurement(
+        name=name,
+        invocations=len(corpus),
+        errors=errors,
+        seconds=best,
+        p50_ns=_percentile(latencies, 0.50),
+        p90_ns=_percentile(latencies, 0.90),
+        p99_ns=_percentile(latencies, 0.99),
+        peak_memory=peak_memory,
+    )
+
+
+def _measure_validation(
+    command: Command, corpus: list[list[str]], rounds: int
+) -> ValidationSummary:
+    file_descriptor, path = tempfile.mkstemp(suffix=".txt")
+    try:
+        with open(file_descriptor, "w", encoding="utf-8") as file:
+            file.writelines(shlex.join(arguments) + "\n" for arguments in corpus)
+
+        return min(
+            (validate_corpus(command, path) for _ in range(rounds)),
+            key=lambda summary: summary.seconds,
+        )
+    finally:
+        os.unlink(path)
+
+
+def _percentile(sorted_values: list[int], fraction: float) -> int:
+    if not sorted_values:
+        return 0
+
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * fraction))
+    return sorted_values[index]
+
+
+def _load_parser(target: str) -> argparse.ArgumentParser:
+    module_name, _, attribute = target.partition(":")
+
+    value: Any = import_module(module_name)
+    for part in filter(None, attribute.split(".")):
+        value = getattr(value, part)
+
+    if not isinstance(value, argparse.ArgumentParser):
+        value = value()
+
+    if not isinstance(value, argparse.ArgumentParser):
+        raise TypeError(
+            f"{target!r} did not provide an argparse.ArgumentParser "
+            f"(got: {type(value).__name__})"
+        )
+
+    return value
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    command_line = argparse.ArgumentParser(
+        prog="python benchmarks/argparse_benchmark.py",
+        description="Compare an argparse parser with its cliargparser import.",
+    )
+    command_line.add_argument("target", help="`module:attribute` of the parser")
+    command_line.add_argument("--corpus-size", type=int, default=10_000)
+    command_line.add_argument("--seed", type=int, default=0)
+    command_line.add_argument("--rounds", type=int, default=5)
+    arguments = command_line.parse_args(argv)
+
+    report = run_benchmark(
+        _load_parser(arguments.target),
+        corpus_size=arguments.corpus_size,
+        seed=arguments.seed,
+        rounds=arguments.rounds,
+    )
+    sys.stdout.write(report.format() + "\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
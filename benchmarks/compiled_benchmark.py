@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from functools import partial
+import gc
+import string
+import sys
+import time
+from typing import Any
+
+from cliargparser import ArgumentParser, Command, CompiledParser
+from cliargparser.actions import count_presence_action, store_true_action
+from cliargparser.enums import NArgs, ParseMode
+
+
+# Options and subcommands of the large tree, which plugins can reach.
+LARGE_TREE_OPTIONS = 400
+LARGE_TREE_SUBCOMMANDS = 50
+
+_CASES = {
+    "flags": ("small", ["-vv", "-q", "--verbose"]),
+    "options": ("small", ["--config", "a.toml", "--level", "3", "--opt7=x"]),
+    "subcommands": (
+        "small",
+        [
+            "-vv", "--config", "a.toml", "--level", "3",
+            "deploy", "--region", "eu", "-f", "run", "a", "b", "c",
+        ],
+    ),
+    "large_tree": (
+        "large",
+        [
+            "--option399", "a", "--option200=b", "-zZyY", "--flag-Z",
+            "--option0", "c", "command49", "--region", "eu",
+        ],
+    ),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledMeasurement:
+    name: str
+    token_count: int
+
+    # Best of the timed rounds, per parse.
+    interpreted_seconds: float
+    compiled_seconds: float
+
+    @property
+    def speedup(self) -> float:
+        return self.interpreted_seconds / self.compiled_seconds
+
+
+def run_compiled_benchmark(
+    *, parses: int = 20_000, rounds: int = 5
+) -> tuple[CompiledMeasurement, ...]:
+    commands = {"small": _command(), "large": _large_command()}
+    interpreted_parsers = {
+        tree: partial(ArgumentParser.parse_arguments, command=command)
+        for tree, command in commands.items()
+    }
+    compiled_parsers = {
+        tree: CompiledParser(command) for tree, command in commands.items()
+    }
+
+    return tuple(
+        CompiledMeasurement(
+            name=name,
+            token_count=len(arguments),
+            interpreted_seconds=_best_of(
+                interpreted_parsers[tree], arguments, parses, rounds
+            ),
+            compiled_seconds=_best_of(
+                compiled_parsers[tree].parse_arguments, arguments, parses, rounds
+            ),
+        )
+        for name, (tree, arguments) in _CASES.items()
+    )
+
+
+def format_measurements(measurements: Sequence[CompiledMeasurement]) -> str:
+    lines = [
+        (
+            f"{'case':<13}{'tokens':>7}{'interpreted us':>16}"
+            f"{'compiled us':>13}{'speedup':>9}"
+        )
+    ]
+    for measurement in measurements:
+        lines.append(
+            f"{measurement.name:<13}{measurement.token_count:>7}"
+            f"{measurement.interpreted_seconds * 1e6:>16.2f}"
+            f"{measurement.compiled_seconds * 1e6:>13.2f}"
+            f"{measurement.speedup:>8.2f}x"
+        )
+
+    return "\n".join(lines)
+
+
+def _command() -> Command:
+    command = Command("tool")
+    command.option("verbose", "v", action=count_presence_action)
+    command.option("quiet", "q", action=store_true_action)
+    command.option("config", "c")
+    command.option("level", type_converter=int)
+    for index in range(10):
+        command.option(f"opt{index}")
+
+    deploy = command.subcommand("deploy")
+    deploy.option("region")
+    deploy.option("force", "f", action=store_true_action)
+
+    run = deploy.subcommand("run", parse_mode=ParseMode.OPERAND)
+    run.operand("files", nargs=NArgs.ONE_OR_MORE)
+
+    return command
+
+
+def _large_command() -> Command:
+    command = Command("tool")
+    for index in range(LARGE_TREE_OPTIONS):
+        command.option(f"option{index}")
+    for char in string.ascii_letters:
+        command.option(f"flag-{char}", char, action=count_presence_action)
+
+    for index in range(LARGE_TREE_SUBCOMMANDS):
+        command.subcommand(f"command{index}").option("region")
+
+    return command
+
+
+def _best_of(
+    parse: Callable[[list[str]], Any],
+    arguments: list[str],
+    parses: int,
+    rounds: int,
+) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        gc.collect()
+        start = time.perf_counter()
+        for _ in range(parses):
+            parse(arguments)
+        best = min(best, time.perf_counter() - start)
+
+    return best / parses
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    command_line = argparse.ArgumentParser(
+        prog="python benchmarks/compiled_benchmark.py",
+        description="Compare the interpreted and compiled parsers.",
+    )
+    command_line.add_argument("--parses", type=int, default=20_000)
+    command_line.add_argument("--rounds", type=int, default=5)
+    arguments = command_line.parse_args(argv)
+
+    measurements = run_compiled_benchmark(
+        parses=arguments.parses, rounds=arguments.rounds
+    )
+    sys.stdout.write(format_measurements(measurements) + "\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+import gc
+import os
+from pathlib import Path
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+
+from cliargparser import Command, CompiledParser
+from cliargparser.actions import extend_value_action, store_sequence_action
+from cliargparser.converters import (
+    convert_existing_paths,
+    convert_floats,
+    convert_ints,
+    convert_paths,
+)
+from cliargparser.enums import NArgs, ParseMode
+from cliargparser.hints import BatchConverter
+
+
+@dataclass(frozen=True, slots=True)
+class _Case:
+    name: str
+    type_converter: Callable[[str], Any]
+    batch_converter: BatchConverter
+    generate: Callable[[random.Random], str]
+
+
+@dataclass(frozen=True, slots=True)
+class ConverterMeasurement:
+    name: str
+    parser: str
+    value_count: int
+
+    # Best of the timed rounds for one invocation carrying every value.
+    per_value_seconds: float
+    batch_seconds: float
+
+    # Memory still allocated while the parsed namespace is held.
+    per_value_bytes: int
+    batch_bytes: int
+
+    @property
+    def speedup(self) -> float:
+        return self.per_value_seconds / self.batch_seconds
+
+
+def run_converter_benchmark(
+    *, value_count: int = 100_000, rounds: int = 5, seed: int = 0
+) -> tuple[ConverterMeasurement, ...]:
+    rng = random.Random(seed)
+
+    measurements: list[ConverterMeasurement] = []
+    with tempfile.TemporaryDirectory() as directory:
+        files = _create_files(directory, min(value_count, 10_000))
+
+        for case in _cases(files):
+            arguments = [case.generate(rng) for _ in range(value_count)]
+
+            per_value = _operand_command(
+                type_converter=case.type_converter, action=extend_value_action
+            )
+            batch = _operand_command(
+                batch_converter=case.batch_converter, action=store_sequence_action
+            )
+
+            for parser, parse_per_value, parse_batch in (
+                ("interpreted", per_value.parse_arguments, batch.parse_arguments),
+                (
+                    "compiled",
+                    CompiledParser(per_value).parse_arguments,
+                    CompiledParser(batch).parse_arguments,
+                ),
+            ):
+                measurements.append(
+                    ConverterMeasurement(
+                        name=case.name,
+                        parser=parser,
+                        value_count=value_count,
+                        per_value_seconds=_best_of(
+                            parse_per_value, arguments, rounds
+                        ),
+                        batch_seconds=_best_of(parse_batch, arguments, rounds),
+                        per_value_bytes=_retained_bytes(parse_per_value, arguments),
+                        batch_bytes=_retained_bytes(parse_batch, arguments),
+                    )
+                )
+
+    return tuple(measurements)
+
+
+def format_measurements(measurements: Sequence[ConverterMeasurement]) -> str:
+    lines = [
+        (
+            f"{'converter':<15}{'parser':<13}{'values':>9}"
+            f"{'per-value ms':>14}{'batch ms':>10}{'speedup':>9}"
+            f"{'per-value KiB':>15}{'batch KiB':>11}"
+        )
+    ]
+    for measurement in measurements:
+        lines.append(
+            f"{measurement.name:<15}{measurement.parser:<13}"
+            f"{measurement.value_count:>9,}"
+            f"{measurement.per_value_seconds * 1000:>14.2f}"
+            f"{measurement.batch_seconds * 1000:>10.2f}"
+            f"{measurement.speedup:>8.2f}x"
+            f"{measurement.per_value_bytes / 1024:>15,.0f}"
+            f"{measurement.batch_bytes / 1024:>11,.0f}"
+        )
+
+    return "\n".join(lines)
+
+
+def _cases(files: Sequence[str]) -> tuple[_Case, ...]:
+    return (
+        _Case("int", int, convert_ints, lambda rng: str(rng.randrange(10**9))),
+        _Case(
+            "float",
+            float,
+            convert_floats,
+            lambda rng: f"{rng.uniform(0, 1e6):.4f}",
+        ),
+        _Case(
+            "path",
+            Path,
+            convert_paths,
+            lambda rng: f"data/{rng.randrange(1000)}/part-{rng.randrange(10**6)}.csv",
+        ),
+        _Case(
+            "existing path",
+            _existing_path,
+            convert_existing_paths,
+            lambda rng: rng.choice(files),
+        ),
+    )
+
+
+def _existing_path(value: str) -> Path:
+    path = Path(value)
+    if not path.exists():
+        raise FileNotFoundError(value)
+
+    return path
+
+
+def _create_files(directory: str, count: int) -> list[str]:
+    files: list[str] = []
+    for index in range(count):
+        parent = os.path.join(directory, f"part-{index % 100}")
+        os.makedirs(parent, exist_ok=True)
+
+        file = os.path.join(parent, f"{index}.csv")
+        with open(file, "w"):
+            pass
+        files.append(file)
+
+    return files
+
+
+def _operand_command(**keywords: Any) -> Command:
+    command = Command("benchmark", parse_mode=ParseMode.OPERAND)
+    command.operand("values", nargs=NArgs.ONE_OR_MORE, **keywords)
+    return command
+
+
+def _best_of(
+    parse: Callable[[list[str]], Any], arguments: list[str], rounds: int
+) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        gc.collect()
+        start = time.perf_counter()
+        parse(arguments)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def _retained_bytes(parse: Callable[[list[str]], Any], arguments: list[str]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        namespace = parse(arguments)
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del namespace
+    return retained
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    command_line = argparse.ArgumentParser(
+        prog="python benchmarks/converter_benchmark.py",
+        description="Compare per-value and batch converters on a long operand.",
+    )
+    command_line.add_argument("--values", type=int, default=100_000)
+    command_line.add_argument("--rounds", type=int, default=5)
+    command_line.add_argument("--seed", type=int, default=0)
+    arguments = command_line.parse_args(argv)
+
+    measurements = run_converter_benchmark(
+        value_count=arguments.values, rounds=arguments.rounds, seed=arguments.seed
+    )
+    sys.stdout.write(format_measurements(measurements) + "\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
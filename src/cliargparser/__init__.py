@@ -1,5 +1,48 @@
-from .argument_parser import ArgumentParser
-from .models.arguments import Command
+from importlib import import_module
 
 
-__all__ = ["ArgumentParser", "Command"]
+# Not imported from `typing`, which would cost more than this module itself.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .argument_parser import ArgumentParser
+    from .compiled_parser import CompiledParser
+    from .incremental_parser import IncrementalParser
+    from .models.arguments import Command
+    from .parse_cache import ParseCache
+    from .recording import InvocationRecorder
+
+
+__all__ = [
+    "ArgumentParser",
+    "Command",
+    "CompiledParser",
+    "IncrementalParser",
+    "InvocationRecorder",
+    "ParseCache",
+]
+
+# Submodules are imported on first attribute access to keep `import
+# cliargparser` cheap for short-lived CLIs.
+_LAZY_ATTRIBUTES = {
+    "ArgumentParser": ".argument_parser",
+    "Command": ".models.arguments.command",
+    "CompiledParser": ".compiled_parser",
+    "IncrementalParser": ".incremental_parser",
+    "InvocationRecorder": ".recording",
+    "ParseCache": ".parse_cache",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
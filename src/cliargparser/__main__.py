@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable, Sequence
+import json
+import os
+import sys
+from typing import Any, TextIO
+
+from .plugins import load_plugin
+from .recording import read_corpus
+from .replay import (
+    DEFAULT_THRESHOLD,
+    ReplayComparison,
+    format_report,
+    load_baseline,
+    run_replay,
+    save_baseline,
+)
+from .validation import (
+    DEFAULT_CHUNK_SIZE,
+    LineError,
+    ValidationSummary,
+    validate_corpus,
+)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    command_line = argparse.ArgumentParser(prog="python -m cliargparser")
+    subparsers = command_line.add_subparsers(dest="subcommand", required=True)
+
+    validate = subparsers.add_parser(
+        "validate",
+        description="Parse every line of a corpus file against a command tree.",
+    )
+    validate.add_argument("target", help="`module:attribute` of the root command")
+    validate.add_argument("corpus", help="file with one command line per line")
+    validate.add_argument("--format", choices=("text", "jsonl"), default="text")
+    validate.add_argument(
+        "--jobs",
+        type=_int_at_least(0),
+        default=1,
+        help="worker processes; 0 uses every CPU",
+    )
+    validate.add_argument(
+        "--chunk-size", type=_int_at_least(1), default=DEFAULT_CHUNK_SIZE
+    )
+    validate.add_argument(
+        "--all-issues",
+        action="store_true",
+        help="report every issue on a line instead of only the first",
+    )
+
+    replay = subparsers.add_parser(
+        "replay",
+        description=(
+            "Time a recorded invocation corpus against a command tree and "
+            "compare it with a baseline."
+        ),
+    )
+    replay.add_argument("target", help="`module:attribute` of the root command")
+    replay.add_argument("corpus", help="corpus written by `InvocationRecorder`")
+    replay.add_argument("--rounds", type=int, default=5)
+    replay.add_argument(
+        "--compiled", action="store_true", help="replay through `CompiledParser`"
+    )
+    replay.add_argument(
+        "--baseline",
+        help="report to compare with; exits with 1 when throughput regresses",
+    )
+    replay.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="allowed throughput drop as a fraction of the baseline",
+    )
+    replay.add_argument("--save-baseline", help="write this run's report here")
+
+    arguments = command_line.parse_args(argv)
+    if arguments.subcommand == "replay":
+        return _replay(arguments, sys.stdout)
+
+    return _validate(arguments, sys.stdout)
+
+
+def _int_at_least(minimum: int) -> Callable[[str], int]:
+    # Rejected by `argparse` with a usage message, not a traceback from
+    # `validate_corpus`.
+    def convert(value: str) -> int:
+        try:
+            number = int(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(
+                f"invalid int value: {value!r}"
+            ) from None
+
+        if number < minimum:
+            raise argparse.ArgumentTypeError(
+                f"must be at least {minimum} (got: {number})"
+            )
+
+        return number
+
+    return convert
+
+
+def _validate(arguments: argparse.Namespace, output: TextIO) -> int:
+    jobs = arguments.jobs or os.cpu_count() or 1
+
+    summary = validate_corpus(
+        arguments.target,
+        arguments.corpus,
+        jobs=jobs,
+        chunk_size=arguments.chunk_size,
+        collect_all=arguments.all_issues,
+        on_error=lambda error: output.write(_format_error(error, arguments)),
+    )
+    output.write(_format_summary(summary, arguments))
+
+    return 1 if summary.invalid_lines else 0
+
+
+def _replay(arguments: argparse.Namespace, output: TextIO) -> int:
+    command = load_plugin(arguments.target)
+
+    parse = None
+    if arguments.compiled:
+        from .compiled_parser import CompiledParser
+
+        parse = CompiledParser(command).parse_arguments
+
+    report = run_replay(
+        command, read_corpus(arguments.corpus), rounds=arguments.rounds, parse=parse
+    )
+
+    comparison = None
+    if arguments.baseline is not None:
+        comparison = ReplayComparison(
+            report=report,
+            baseline=load_baseline(arguments.baseline),
+            threshold=arguments.threshold,
+        )
+
+    if arguments.save_baseline is not None:
+        save_baseline(report, arguments.save_baseline)
+
+    output.write(format_report(report, comparison) + "\n")
+
+    return 1 if comparison is not None and comparison.regressed else 0
+
+
+def _format_error(error: LineError, arguments: argparse.Namespace) -> str:
+    if arguments.format == "jsonl":
+        return _json_line(
+            {
+                "line": error.line_number,
+                "kind": error.kind,
+                "message": error.message,
+                "token": error.token,
+                "position": error.position,
+            }
+        )
+
+    location = "" if error.position is None else f" (token {error.position + 1})"
+    return (
+        f"{arguments.corpus}:{error.line_number}: "
+        f"{error.kind}: {error.message}{location}\n"
+    )
+
+
+def _format_summary(
+    summary: ValidationSummary, arguments: argparse.Namespace
+) -> str:
+    if arguments.format == "jsonl":
+        return _json_line(
+            {
+                "summary": {
+                    "lines": summary.lines,
+                    "valid_lines": summary.valid_lines,
+                    "invalid_lines": summary.invalid_lines,
+                    "blank_lines": summary.blank_lines,
+                    "errors": summary.errors,
+                    "bytes": summary.byte_count,
+                    "seconds": summary.seconds,
+                    "lines_per_second": summary.throughput,
+                }
+            }
+        )
+
+    mebibytes_per_second = (
+        summary.byte_count / summary.seconds / (1 << 20) if summary.seconds else 0.0
+    )
+    return (
+        f"{summary.lines:,} lines: {summary.valid_lines:,} valid, "
+        f"{summary.invalid_lines:,} invalid, {summary.blank_lines:,} blank; "
+        f"{summary.errors:,} errors in {summary.seconds:.2f} s "
+        f"({summary.throughput:,.0f} lines/s, {mebibytes_per_second:.1f} MiB/s)\n"
+    )
+
+
+def _json_line(value: dict[str, Any]) -> str:
+    return json.dumps(value, separators=(",", ":")) + "\n"
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -12,6 +12,19 @@ def store_value_action[T](
     return values[0] if values else None
 
 
+def store_values_action[T](
+    argument: Option | Operand, values: Sequence[T], current_value: Any = None
+) -> list[T]:
+    return list(values)
+
+
+def store_sequence_action[S: Sequence[Any]](
+    argument: Option | Operand, values: S, current_value: Any = None
+) -> S:
+    # Keeps what a batch converter returned, such as an `array.array`.
+    return values
+
+
 def store_present_action(
     argument: Option, values: Sequence[Any], current_value: Any = None
 ) -> Any:
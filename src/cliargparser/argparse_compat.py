@@ -0,0 +1,400 @@
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from .actions import (
+    append_present_action,
+    append_value_action,
+    count_presence_action,
+    extend_value_action,
+    store_false_action,
+    store_present_action,
+    store_true_action,
+    store_value_action,
+    store_values_action,
+)
+from .enums import NArgs, ParseMode
+from .exceptions import (
+    ArgumentConflictError,
+    OperandAfterNonDeterministicOperandError,
+)
+from .hints import Action
+from .models import MutexOptionGroup
+from .models.arguments import Command, Operand, Option
+
+
+# `argparse` has no public API for reading a parser back, so its private
+# action classes and attributes are used throughout.
+_FLAG_ACTIONS: dict[type[argparse.Action], Action[Option]] = {
+    argparse._StoreTrueAction: store_true_action,
+    argparse._StoreFalseAction: store_false_action,
+    argparse._StoreConstAction: store_present_action,
+    argparse._AppendConstAction: append_present_action,
+    argparse._CountAction: count_presence_action,
+}
+
+_NARGS: dict[str, NArgs] = {
+    argparse.OPTIONAL: NArgs.OPTIONAL,
+    argparse.ZERO_OR_MORE: NArgs.ZERO_OR_MORE,
+    argparse.ONE_OR_MORE: NArgs.ONE_OR_MORE,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class UnmappedArgument:
+    # Names of the commands leading to the argument, starting at the root.
+    command_path: tuple[str, ...]
+
+    argument: str
+    reason: str
+
+    def __str__(self) -> str:
+        return f"{' '.join(self.command_path)}: {self.argument}: {self.reason}"
+
+
+@dataclass(frozen=True, slots=True)
+class ArgparseImport:
+    command: Command
+
+    # Everything that was dropped or only approximated.
+    unmapped: tuple[UnmappedArgument, ...]
+
+
+def import_argparse_parser(
+    parser: argparse.ArgumentParser, *, name: str | None = None
+) -> ArgparseImport:
+    importer = _Importer()
+    command = importer.import_parser(
+        parser, parser.prog if name is None else name, (), ()
+    )
+
+    return ArgparseImport(command=command, unmapped=tuple(importer.unmapped))
+
+
+class _Importer:
+    __slots__ = ("unmapped",)
+
+    def __init__(self) -> None:
+        self.unmapped: list[UnmappedArgument] = []
+
+    def import_parser(
+        self,
+        parser: argparse.ArgumentParser,
+        name: str,
+        aliases: tuple[str, ...],
+        parent_path: tuple[str, ...],
+    ) -> Command:
+        path = (*parent_path, name)
+
+        subparsers_actions = [
+            action
+            for action in parser._actions
+            if isinstance(action, argparse._SubParsersAction)
+        ]
+        positional_actions = [
+            action
+            for action in parser._actions
+            if not action.option_strings
+            and not isinstance(action, argparse._SubParsersAction)
+        ]
+
+        command = Command(
+            name,
+            aliases=aliases,
+            parse_mode=(
+                ParseMode.OPERAND
+                if positional_actions and not subparsers_actions
+                else ParseMode.COMMAND
+            ),
+            subcommand_required=any(action.required for action in subparsers_actions),
+        )
+
+        self._check_parser(parser, path)
+
+        options_by_action: dict[int, list[Option]] = {}
+        for action in parser._actions:
+            if isinstance(action, argparse._SubParsersAction):
+                self._import_subparsers(command, action, path)
+            elif action.option_strings:
+                try:
+                    options_by_action[id(action)] = self._import_option(
+                        command, parser, action, path
+                    )
+                except ArgumentConflictError as error:
+                    self._report(path, "/".join(action.option_strings), str(error))
+            elif subparsers_actions:
+                self._report(
+                    path,
+                    action.dest,
+                    "operands cannot be combined with subcommands",
+                )
+            else:
+                self._import_operand(command, parser, action, path)
+
+        for group in parser._mutually_exclusive_groups:
+            mutex_option_group = MutexOptionGroup(required=group.required)
+            for action in group._group_actions:
+                if not action.option_strings:
+                    self._report(
+                        path,
+                        action.dest,
+                        "operands cannot be mutually exclusive with options",
+                    )
+
+                for option in options_by_action.get(id(action), ()):
+                    mutex_option_group.add_option(option)
+
+            command.add_mutex_option_group(mutex_option_group)
+            self._report(
+                path,
+                " ".join(
+                    "/".join(action.option_strings) or action.dest
+                    for action in group._group_actions
+                ),
+                "mutual exclusion is recorded but not enforced",
+            )
+
+        return command
+
+    def _check_parser(
+        self, parser: argparse.ArgumentParser, path: tuple[str, ...]
+    ) -> None:
+        if parser.prefix_chars != "-":
+            self._report(
+                path,
+                "prefix_chars",
+                f"only '-' is supported (got: {parser.prefix_chars!r})",
+            )
+
+        if parser.fromfile_prefix_chars:
+            self._report(path, "fromfile_prefix_chars", "not supported")
+
+        if parser.allow_abbrev and any(
+            option_string.startswith("--")
+            for action in parser._actions
+            for option_string in action.option_strings
+        ):
+            self._report(
+                path, "allow_abbrev", "abbreviated long options are not accepted"
+            )
+
+    def _import_subparsers(
+        self,
+        command: Command,
+        action: argparse._SubParsersAction[Any],
+        path: tuple[str, ...],
+    ) -> None:
+        # Aliases map to the same parser, after the name they were added with.
+        names_by_parser: dict[int, tuple[argparse.ArgumentParser, list[str]]] = {}
+        for name, subparser in action.choices.items():
+            names_by_parser.setdefault(id(subparser), (subparser, []))[1].append(name)
+
+        for subparser, (name, *aliases) in names_by_parser.values():
+            command.add_subcommand(
+                self.import_parser(subparser, name, tuple(aliases), path)
+            )
+
+        if action.dest is not argparse.SUPPRESS:
+            self._report(
+                path,
+                action.dest,
+                "the chosen subcommand is stored as a nested namespace, not a name",
+            )
+
+        if action.required:
+            self._report(path, "subcommands", "required is recorded but not enforced")
+
+    def _import_option(
+        self,
+        command: Command,
+        parser: argparse.ArgumentParser,
+        action: argparse.Action,
+        path: tuple[str, ...],
+    ) -> list[Option]:
+        argument = "/".join(action.option_strings)
+
+        long_names: list[str] = []
+        short_names: list[str] = []
+        for option_string in action.option_strings:
+            if option_string.startswith("--") and len(option_string) > 2:
+                long_names.append(option_string[2:])
+            elif option_string.startswith("-") and len(option_string) == 2:
+                short_names.append(option_string[1])
+            else:
+                self._report(
+                    path, option_string, "only `--name` and `-x` spellings exist"
+                )
+
+        if not long_names and not short_names:
+            return []
+
+        if action.required:
+            self._report(path, argument, "required is recorded but not enforced")
+
+        flag_action = _FLAG_ACTIONS.get(type(action))
+        mapped = None
+        if flag_action is None and not isinstance(
+            action, argparse.BooleanOptionalAction
+        ):
+            mapped = self._map_values_action(action, argument, path)
+            if mapped is None:
+                return []
+
+        keywords: dict[str, Any] = {
+            "long_names": long_names,
+            "short_names": short_names,
+            "store_name": action.dest,
+            "default": self._default(action, argument, path),
+            "required": action.required,
+        }
+
+        if isinstance(action, argparse.BooleanOptionalAction):
+            negative_names = [name for name in long_names if name.startswith("no-")]
+            keywords["long_names"] = [
+                name for name in long_names if name not in negative_names
+            ]
+
+            options = [command.option(action=store_true_action, **keywords)]
+            if negative_names:
+                options.append(
+                    command.option(
+                        negative_names,
+                        store_name=action.dest,
+                        action=store_false_action,
+                    )
+                )
+
+            return options
+
+        if flag_action is not None:
+            return [
+                command.option(action=flag_action, present=action.const, **keywords)
+            ]
+
+        assert mapped is not None
+        option_action, nargs = mapped
+        return [
+            command.option(
+                action=option_action,
+                nargs=nargs,
+                type_converter=self._type_converter(parser, action),
+                choices=self._choices(action, argument, path),
+                **keywords,
+            )
+        ]
+
+    def _import_operand(
+        self,
+        command: Command,
+        parser: argparse.ArgumentParser,
+        action: argparse.Action,
+        path: tuple[str, ...],
+    ) -> Operand | None:
+        mapped = self._map_values_action(action, action.dest, path)
+        if mapped is None:
+            return None
+
+        operand_action, nargs = mapped
+        if isinstance(nargs, int) and nargs > 1:
+            self._report(
+                path,
+                action.dest,
+                f"an operand with nargs={nargs} takes up to {nargs + 1} tokens",
+            )
+
+        try:
+            return command.operand(
+                action.dest,
+                action=operand_action,
+                nargs=nargs,
+                default=self._default(action, action.dest, path),
+                type_converter=self._type_converter(parser, action),
+                choices=self._choices(action, action.dest, path),
+            )
+        except OperandAfterNonDeterministicOperandError:
+            self._report(
+                path,
+                action.dest,
+                "operands cannot follow an operand with a variable count",
+            )
+            return None
+        except ArgumentConflictError as error:
+            self._report(path, action.dest, str(error))
+            return None
+
+    def _map_values_action(
+        self, action: argparse.Action, argument: str, path: tuple[str, ...]
+    ) -> tuple[Action[Any], int | NArgs] | None:
+        nargs = action.nargs
+        if nargs in (argparse.REMAINDER, argparse.PARSER):
+            self._report(path, argument, f"nargs={nargs!r} is not supported")
+            return None
+
+        if isinstance(action, argparse._StoreAction):
+            if nargs is None:
+                return store_value_action, 1
+            elif nargs == argparse.OPTIONAL:
+                if action.const is not None:
+                    self._report(
+                        path, argument, "const is not stored when no value is given"
+                    )
+
+                return store_value_action, NArgs.OPTIONAL
+
+            # `argparse` stores a list for any explicit count.
+            return store_values_action, self._nargs(nargs)
+        elif isinstance(action, argparse._AppendAction):
+            if nargs is None:
+                return extend_value_action, 1
+
+            return append_value_action, self._nargs(nargs)
+        elif isinstance(action, argparse._ExtendAction):
+            return extend_value_action, 1 if nargs is None else self._nargs(nargs)
+
+        self._report(
+            path, argument, f"action {type(action).__name__!r} is not supported"
+        )
+        return None
+
+    def _default(
+        self, action: argparse.Action, argument: str, path: tuple[str, ...]
+    ) -> Any:
+        if action.default is argparse.SUPPRESS:
+            self._report(path, argument, "default=SUPPRESS is stored as None")
+            return None
+
+        return action.default
+
+    def _choices(
+        self, action: argparse.Action, argument: str, path: tuple[str, ...]
+    ) -> tuple[Any, ...] | None:
+        if action.choices is None:
+            return None
+
+        self._report(path, argument, "choices are recorded but not enforced")
+        return tuple(action.choices)
+
+    @staticmethod
+    def _nargs(nargs: int | str) -> int | NArgs:
+        return nargs if isinstance(nargs, int) else _NARGS[nargs]
+
+    @staticmethod
+    def _type_converter(
+        parser: argparse.ArgumentParser, action: argparse.Action
+    ) -> Callable[[str], Any] | None:
+        if action.type is None:
+            return None
+
+        # Resolves types registered by name, such as `type="int"`.
+        type_converter: Callable[[str], Any] = parser._registry_get(
+            "type", action.type, action.type
+        )
+        return type_converter
+
+    def _report(self, path: tuple[str, ...], argument: str, reason: str) -> None:
+        self.unmapped.append(
+            UnmappedArgument(command_path=path, argument=argument, reason=reason)
+        )
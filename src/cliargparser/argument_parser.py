@@ -1,51 +1,221 @@
-from collections.abc import Callable, Iterable
-import shlex
-from typing import Any, assert_never
+from collections.abc import Callable, Iterable, Sequence
+import copy
+from functools import cache
+from typing import TYPE_CHECKING, Any, assert_never
 
-from .enums import NArgs, OptionPrefix, OptionToken, ParseMode, ParsingSentinel
+from .enums import NArgs, ParseLimit, ParseMode
 from .exceptions import (
     ExtraOperandError,
+    InvalidArgumentValueError,
     MissingOperandArgumentsError,
     MissingOptionArgumentsError,
-    OptionInGroupTakesArgumentsError,
     OptionTakesNoArgumentError,
+    ParseLimitError,
+    ParserError,
     UnknownCommandError,
     UnknownLongOptionError,
+    UnknownOptionError,
     UnknownShortOptionError,
     UnknownShortOptionInGroupError,
 )
 from .models import Namespace, ParseContext, TokenStream
-from .models.arguments import Command, Option
+from .models.arguments import Command, Operand, Option
+from .syntax import TokenSyntax, syntax_for
+
+
+if TYPE_CHECKING:
+    from .models import ParseIssue, ParseLimits, ParseResult, RouteResult
+
+
+# Limits checked after the offending token was consumed.
+_CONSUMED_TOKEN_LIMITS = frozenset(
+    (ParseLimit.SUBCOMMAND_DEPTH, ParseLimit.CLUSTER_LENGTH)
+)
+
+# What decoders and converters raise for values they reject, as with the
+# `type` of an `argparse` argument.
+_CONVERSION_ERRORS = (TypeError, ValueError)
 
 
 class ArgumentParser:
     @classmethod
     def parse_arguments(
-        cls, arguments: str | Iterable[str], command: Command
+        cls,
+        arguments: str | bytes | Iterable[str | bytes],
+        command: Command,
+        *,
+        limits: ParseLimits | None = None,
+        lazy_defaults: bool = True,
     ) -> Namespace:
-        if isinstance(arguments, str):
-            arguments = shlex.split(arguments)
-
-        token_stream = TokenStream(arguments)
+        token_stream = TokenStream(cls._split_arguments(arguments, limits), limits)
         namespace = Namespace()
 
         context = ParseContext(
             command=command,
             namespace=namespace,
             token_stream=token_stream,
+            command_path=[command],
+            namespace_path=[namespace],
+            limits=limits,
+        )
+        cls._parse_tokens(context)
+
+        if lazy_defaults and Command._lazy_defaults_registered:
+            from .defaults import apply_lazy_defaults
+
+            apply_lazy_defaults(command, namespace)
+
+        return namespace
+
+    @classmethod
+    def try_parse_arguments(
+        cls,
+        arguments: str | bytes | Iterable[str | bytes],
+        command: Command,
+        *,
+        collect_all: bool = False,
+        limits: ParseLimits | None = None,
+        lazy_defaults: bool = True,
+    ) -> ParseResult:
+        issue_type, result_type = _parse_result_types()
+        namespace = Namespace()
+        issues: list[ParseIssue] = []
+
+        token_stream = None
+        try:
+            token_stream = TokenStream(cls._split_arguments(arguments, limits), limits)
+            context = ParseContext(
+                command=command,
+                namespace=namespace,
+                token_stream=token_stream,
+                command_path=[command],
+                namespace_path=[namespace],
+                issues=issues,
+                collect_all_issues=collect_all,
+                limits=limits,
+            )
+            cls._parse_tokens(context)
+        except ParseLimitError as error:
+            # Always ends the parse, even when collecting every issue.
+            position = 0 if token_stream is None else token_stream.position
+            if error.limit in _CONSUMED_TOKEN_LIMITS:
+                position -= 1
+
+            issues.append(
+                issue_type(error, "" if error.token is None else error.token, position)
+            )
+
+        if issues:
+            return result_type(namespace=None, issues=tuple(issues))
+
+        if lazy_defaults and Command._lazy_defaults_registered:
+            from .defaults import apply_lazy_defaults
+
+            apply_lazy_defaults(command, namespace)
+
+        return result_type(namespace=namespace, issues=())
+
+    @classmethod
+    def route_arguments(
+        cls,
+        arguments: str | bytes | Iterable[str | bytes],
+        command: Command,
+        *,
+        limits: ParseLimits | None = None,
+    ) -> RouteResult:
+        # Walks only as far as the subcommand path goes. Option values are
+        # skipped by `nargs` without being converted, and nothing is stored;
+        # only errors that leave the path unknown are raised.
+        token_stream = TokenStream(cls._split_arguments(arguments, limits), limits)
+        max_depth = None if limits is None else limits.max_subcommand_depth
+
+        command_path = [command]
+        end_of_options = False
+        while command.parse_mode is ParseMode.COMMAND and command.has_subcommands:
+            token = token_stream.consume()
+            if token is None:
+                break
+
+            syntax = syntax_for(token)
+            if not end_of_options:
+                if token == syntax.end_of_options:
+                    end_of_options = True
+                    continue
+                elif token.startswith(syntax.long_prefix):
+                    cls._skip_long_option(token, command, token_stream, limits, syntax)
+                    continue
+                elif token.startswith(syntax.short_prefix):
+                    cls._skip_short_option(
+                        token, command, token_stream, limits, syntax
+                    )
+                    continue
+
+            if max_depth is not None and len(command_path) > max_depth:
+                raise ParseLimitError(ParseLimit.SUBCOMMAND_DEPTH, max_depth, token)
+
+            subcommand = command.get_subcommand(token)
+            if subcommand is None:
+                raise UnknownCommandError(token)
+
+            command = subcommand
+            command_path.append(command)
+
+        position = token_stream.position
+        from .models import RouteResult
+
+        return RouteResult(
+            command_path=tuple(command_path),
+            remaining=list(token_stream),
+            position=position,
+            end_of_options=end_of_options,
         )
 
+    @staticmethod
+    def _split_arguments(
+        arguments: str | bytes | Iterable[str | bytes],
+        limits: ParseLimits | None = None,
+    ) -> Iterable[str | bytes]:
+        if (
+            limits is not None
+            and limits.max_input_length is not None
+            and isinstance(arguments, (str, bytes))
+            and len(arguments) > limits.max_input_length
+        ):
+            raise ParseLimitError(ParseLimit.INPUT_LENGTH, limits.max_input_length)
+
+        if isinstance(arguments, str):
+            import shlex  # Only needed for string input; kept off the import path.
+
+            if limits is not None:
+                # Split lazily, so a token limit stops the lexer early.
+                lexer = shlex.shlex(arguments, posix=True)
+                lexer.whitespace_split = True
+                lexer.commenters = ""
+                return lexer
+
+            return shlex.split(arguments)
+        elif isinstance(arguments, bytes):
+            # NUL-separated, as in `/proc/<pid>/cmdline`.
+            return arguments.removesuffix(b"\0").split(b"\0") if arguments else ()
+
+        return arguments
+
+    @classmethod
+    def _parse_tokens(cls, context: ParseContext) -> None:
+        token_stream = context.token_stream
         while (token := token_stream.consume()) is not None:
-            if not context.end_of_options and token == ParsingSentinel.END_OF_OPTIONS:
+            syntax = syntax_for(token)
+
+            if not context.end_of_options and token == syntax.end_of_options:
                 context.end_of_options = True
                 continue
 
             if not context.end_of_options:
-                if token.startswith(OptionPrefix.LONG):
-                    cls._parse_long_option(token, context)
+                if token.startswith(syntax.long_prefix):
+                    cls._parse_long_option(token, context, syntax)
                     continue
-                elif token.startswith(OptionPrefix.SHORT):
-                    cls._parse_short_option(token, context)
+                elif token.startswith(syntax.short_prefix):
+                    cls._parse_short_option(token, context, syntax)
                     continue
 
             if context.command.parse_mode is ParseMode.COMMAND:
@@ -57,170 +227,518 @@ class ArgumentParser:
             else:
                 assert_never(context.command.parse_mode)
 
-        return namespace
-
     @classmethod
-    def _parse_long_option(cls, token: str, context: ParseContext) -> None:
-        explicit_argument: str | None
-        name, sep, explicit_argument = (
-            token
-            .removeprefix(OptionPrefix.LONG)
-            .partition(OptionToken.EXPLICIT_ARGUMENT)
-        )
-        if not sep:
-            explicit_argument = None
-
-        option_name_with_prefix = f"{OptionPrefix.LONG}{name}"
-
-        option = context.command.get_option(name)
-        if not option:
-            raise UnknownLongOptionError(name)
-
+    def _parse_long_option(
+        cls, token: str | bytes, context: ParseContext, syntax: TokenSyntax[Any]
+    ) -> None:
+        resolved = cls._resolve_long_option(token, context, syntax)
+        if resolved is None:
+            return
+
+        option, explicit_argument = resolved
         values = cls._consume_and_validate_option_arguments(
             option=option,
             context=context,
             explicit_argument=explicit_argument,
             token=token,
-            option_name_with_prefix=option_name_with_prefix
         )
+        if values is None:
+            return
 
-        context.namespace[option.store_name] = option.action(
-            option, values, context.namespace.get(option.store_name)
-        )
+        cls._apply_option_action(option, values, context)
 
     @classmethod
-    def _parse_short_option(cls, token: str, context: ParseContext) -> None:
-        option_token_without_prefix, *_ = (
-            token
-            .removeprefix(OptionPrefix.SHORT)
-            .partition(OptionToken.EXPLICIT_ARGUMENT)
-        )
-        if len(option_token_without_prefix) > 1:
-            cls._parse_short_option_group(option_token_without_prefix, context)
+    def _resolve_long_option(
+        cls, token: str | bytes, context: ParseContext, syntax: TokenSyntax[Any]
+    ) -> tuple[Option, str | bytes | None] | None:
+        # Look the whole token up first so the common `--name` form costs no
+        # slicing; only `--name=value` splits the token.
+        option = context.command.get_long_option(token)
+        if option is not None:
+            return option, None
+
+        separator_index = token.find(syntax.explicit_argument)
+        if separator_index != -1:
+            option = context.command.get_long_option(token[:separator_index])
+            if option is not None:
+                return option, token[separator_index + 1:]
+
+            name = token[len(syntax.long_prefix):separator_index]
         else:
-            cls._parse_single_short_option(token, context)
+            name = token[len(syntax.long_prefix):]
 
-    @classmethod
-    def _parse_single_short_option(cls, token: str, context: ParseContext) -> None:
-        explicit_argument: str | None
-        name, sep, explicit_argument = (
-            token
-            .removeprefix(OptionPrefix.SHORT)
-            .partition(OptionToken.EXPLICIT_ARGUMENT)
-        )
-        if not sep:
-            explicit_argument = None
+        cls._report_error(context, UnknownLongOptionError(name), token)
+        return None
 
-        option_name_with_prefix = f"{OptionPrefix.SHORT}{name}"
+    @classmethod
+    def _parse_short_option(
+        cls, token: str | bytes, context: ParseContext, syntax: TokenSyntax[Any]
+    ) -> None:
+        index = cls._parse_short_option_cluster(token, context, syntax)
+        if not index:
+            return
 
-        option = context.command.get_option(name)
-        if not option:
-            raise UnknownShortOptionError(name)
+        option = context.command.get_short_option(token[index])
+        assert option is not None
 
         values = cls._consume_and_validate_option_arguments(
             option=option,
             context=context,
-            explicit_argument=explicit_argument,
+            explicit_argument=cls._cluster_explicit_argument(token, index, syntax),
             token=token,
-            option_name_with_prefix=option_name_with_prefix
         )
+        if values is None:
+            return
 
-        context.namespace[option.store_name] = option.action(
-            option, values, context.namespace.get(option.store_name)
-        )
+        cls._apply_option_action(option, values, context)
 
     @classmethod
-    def _parse_short_option_group(cls, group: str, context: ParseContext) -> None:
-        for option_token in group:
-            option = context.command.get_option(option_token)
-            if not option:
-                raise UnknownShortOptionInGroupError(option_token, group)
+    def _parse_short_option_cluster(
+        cls, token: str | bytes, context: ParseContext, syntax: TokenSyntax[Any]
+    ) -> int:
+        # POSIX clustering: flags apply left to right, and the first
+        # argument-taking option takes the rest of the cluster as its explicit
+        # argument (`-ofile`, `-o=file`), or the following tokens when the
+        # cluster ends with it (`-xvf archive`).
+        #
+        # Returns the index of that option in `token`, or 0 if there is none.
+        # The cluster is walked in place so that flags allocate nothing.
+        get_short_option = context.command.get_short_option
+        length = len(token)
+
+        index = len(syntax.short_prefix)
+
+        end = length
+        limits = context.limits
+        if limits is not None and limits.max_cluster_length is not None:
+            end = min(length, index + limits.max_cluster_length)
+
+        if index == length:
+            # A bare `-` names no option.
+            error = cls._unknown_short_option_error(token, index, syntax)
+            cls._report_error(context, error, token)
+            return 0
+
+        while index < end:
+            option = get_short_option(token[index])
+            if option is None:
+                error = cls._unknown_short_option_error(token, index, syntax)
+                cls._report_error(context, error, token)
+                return 0
 
             if option.takes_arguments:
-                raise OptionInGroupTakesArgumentsError(option_token, group)
+                return index
+
+            if token.startswith(syntax.explicit_argument, index + 1):
+                cls._report_error(
+                    context,
+                    OptionTakesNoArgumentError(
+                        syntax.short_prefix + token[index:index + 1], token[index + 2:]
+                    ),
+                    token,
+                )
+                return 0
 
-            context.namespace[option.store_name] = option.action(
-                option, (), context.namespace.get(option.store_name)
+            cls._apply_option_action(option, (), context)
+
+            index += 1
+
+        if end < length:
+            assert limits is not None and limits.max_cluster_length is not None
+            raise ParseLimitError(
+                ParseLimit.CLUSTER_LENGTH, limits.max_cluster_length, token
             )
 
+        return 0
+
+    @staticmethod
+    def _cluster_explicit_argument(
+        token: str | bytes, index: int, syntax: TokenSyntax[Any]
+    ) -> str | bytes | None:
+        start = index + 1
+        if start == len(token):
+            return None
+
+        if token.startswith(syntax.explicit_argument, start):
+            start += len(syntax.explicit_argument)
+
+        return token[start:]
+
+    @staticmethod
+    def _unknown_short_option_error(
+        token: str | bytes, index: int, syntax: TokenSyntax[Any]
+    ) -> UnknownOptionError:
+        name = token[index:index + 1]
+        group, *_ = (
+            token
+            .removeprefix(syntax.short_prefix)
+            .partition(syntax.explicit_argument)
+        )
+        if len(group) > 1:
+            return UnknownShortOptionInGroupError(name, group)
+
+        return UnknownShortOptionError(name)
+
     @classmethod
     def _consume_and_validate_option_arguments(
         cls,
         option: Option,
         context: ParseContext,
         *,
-        explicit_argument: str | None = None,
-        token: str,
-        option_name_with_prefix: str,
-    ) -> list[str]:
-        if not option.takes_arguments and explicit_argument is not None:
-            raise OptionTakesNoArgumentError(option_name_with_prefix, explicit_argument)
-
-        values: list[Any]
+        explicit_argument: str | bytes | None = None,
+        token: str | bytes,
+    ) -> Sequence[Any] | None:
+        # Returns `None` when an error was recorded instead of raised.
+        position = context.token_stream.position - 1
+
+        values: list[Any] | None
         if option.takes_arguments:
             if explicit_argument is not None:
-                values = [explicit_argument]
+                try:
+                    values = [cls._decode(explicit_argument, option.decoder)]
+                except _CONVERSION_ERRORS as error:
+                    cls._report_invalid_value(
+                        context, option, explicit_argument, error, token, position
+                    )
+                    return None
             else:
-                values = cls._consume_arguments(
-                    option.nargs, context, type_converter=option.type_converter
-                )
+                values = cls._consume_arguments(option.nargs, context, argument=option)
+                if values is None:
+                    return None
+        elif explicit_argument is not None:
+            option_name, *_ = token.partition(syntax_for(token).explicit_argument)
+            cls._report_error(
+                context,
+                OptionTakesNoArgumentError(option_name, explicit_argument),
+                token,
+                position,
+            )
+            return None
         else:
-            values = []
+            return ()
 
         if not cls._is_nargs_satisfied(option.nargs, len(values)):
-            raise MissingOptionArgumentsError(
-                token, option.nargs, len(values)
+            cls._report_error(
+                context,
+                MissingOptionArgumentsError(token, option.nargs, len(values)),
+                token,
+                position,
             )
+            return None
+
+        if option.batch_converter is not None:
+            return cls._batch_convert(option, values, context, token, position)
 
         return values
 
-    @staticmethod
-    def _parse_command(token: str, context: ParseContext) -> None:
+    @classmethod
+    def _parse_command(cls, token: str | bytes, context: ParseContext) -> None:
+        limits = context.limits
+        if (
+            limits is not None
+            and limits.max_subcommand_depth is not None
+            and len(context.command_path) > limits.max_subcommand_depth
+        ):
+            raise ParseLimitError(
+                ParseLimit.SUBCOMMAND_DEPTH, limits.max_subcommand_depth, token
+            )
+
         command = context.command.get_subcommand(token)
         if not command:
-            raise UnknownCommandError(token)
+            cls._report_error(context, UnknownCommandError(token), token)
+            return
 
         context.command = command
+        context.command_path.append(command)
+
+        namespace = context.namespace
+        if context.journal is not None:
+            context.journal.append(
+                (namespace, command.name, command.name in namespace, None)
+            )
 
         command_namespace = Namespace()
-        context.namespace[command.name] = command_namespace
+        namespace[command.name] = command_namespace
         context.namespace = command_namespace
+        context.namespace_path.append(command_namespace)
 
     @classmethod
-    def _parse_operand(cls, token: str, context: ParseContext) -> None:
+    def _parse_operand(cls, token: str | bytes, context: ParseContext) -> None:
         try:
             operand = context.command.get_operand_by_index(context.operand_index)
         except IndexError:
-            raise ExtraOperandError(token) from None
+            operand = None
+
+        if operand is None:
+            cls._report_error(context, ExtraOperandError(token), token)
+            return
+
+        position = context.token_stream.position - 1
+
+        values: list[Any] | None
+        try:
+            values = [cls._decode(token, operand.decoder)]
+        except _CONVERSION_ERRORS as error:
+            cls._report_invalid_value(context, operand, token, error, token, position)
+            values = None
 
-        values: list[Any] = [token]
         if operand.takes_arguments:
+            # Consumed even after an invalid value, so that they are not
+            # parsed as the following operands.
             operand_args = cls._consume_arguments(
-                operand.nargs, context, type_converter=operand.type_converter
+                operand.nargs, context, argument=operand, consumed=1
             )
-            values.extend(operand_args)
+            if values is not None and operand_args is not None:
+                values.extend(operand_args)
+            else:
+                values = None
+
+        if values is None:
+            # An invalid value was already recorded.
+            pass
+        elif not cls._is_nargs_satisfied(operand.nargs, len(values)):
+            cls._report_error(
+                context,
+                MissingOperandArgumentsError(operand.name, operand.nargs, len(values)),
+                token,
+                position,
+            )
+        elif operand.batch_converter is None:
+            cls._apply_operand_action(operand, values, context)
+        else:
+            converted = cls._batch_convert(operand, values, context, token, position)
+            if converted is not None:
+                cls._apply_operand_action(operand, converted, context)
+
+        context.operand_index += 1
+
+    @classmethod
+    def _skip_long_option(
+        cls,
+        token: str | bytes,
+        command: Command,
+        token_stream: TokenStream,
+        limits: ParseLimits | None,
+        syntax: TokenSyntax[Any],
+    ) -> None:
+        option = command.get_long_option(token)
+        if option is not None:
+            if option.takes_arguments:
+                cls._skip_arguments(option.nargs, token_stream, limits)
+            return
+
+        # `--name=value` carries its own value.
+        separator_index = token.find(syntax.explicit_argument)
+        if separator_index != -1:
+            if command.get_long_option(token[:separator_index]) is not None:
+                return
 
-        if not cls._is_nargs_satisfied(operand.nargs, len(values)):
-            raise MissingOperandArgumentsError(
-                operand.name, operand.nargs, len(values)
+            raise UnknownLongOptionError(
+                token[len(syntax.long_prefix):separator_index]
             )
 
-        context.namespace[operand.name] = operand.action(
-            operand, values, context.namespace.get(operand.name)
+        raise UnknownLongOptionError(token[len(syntax.long_prefix):])
+
+    @classmethod
+    def _skip_short_option(
+        cls,
+        token: str | bytes,
+        command: Command,
+        token_stream: TokenStream,
+        limits: ParseLimits | None,
+        syntax: TokenSyntax[Any],
+    ) -> None:
+        length = len(token)
+        index = len(syntax.short_prefix)
+
+        end = length
+        if limits is not None and limits.max_cluster_length is not None:
+            end = min(length, index + limits.max_cluster_length)
+
+        if index == length:
+            raise cls._unknown_short_option_error(token, index, syntax)
+
+        while index < end:
+            option = command.get_short_option(token[index])
+            if option is None:
+                raise cls._unknown_short_option_error(token, index, syntax)
+
+            if option.takes_arguments:
+                # Only a trailing option takes the following tokens.
+                if index + 1 == length:
+                    cls._skip_arguments(option.nargs, token_stream, limits)
+                return
+
+            if token.startswith(syntax.explicit_argument, index + 1):
+                return
+
+            index += 1
+
+        if end < length:
+            assert limits is not None and limits.max_cluster_length is not None
+            raise ParseLimitError(
+                ParseLimit.CLUSTER_LENGTH, limits.max_cluster_length, token
+            )
+
+    @staticmethod
+    def _skip_arguments(
+        nargs: int | NArgs, token_stream: TokenStream, limits: ParseLimits | None
+    ) -> None:
+        # Mirrors `_consume_arguments`, which only runs before `--`.
+        max_values = None if limits is None else limits.max_values
+
+        count = 0
+        while (token := token_stream.peek()) is not None:
+            if token.startswith(syntax_for(token).short_prefix):
+                break
+
+            if isinstance(nargs, int):
+                if count >= nargs:
+                    break
+            elif nargs is NArgs.OPTIONAL and count:
+                break
+
+            if max_values is not None and count >= max_values:
+                raise ParseLimitError(ParseLimit.VALUE_COUNT, max_values, token)
+
+            token_stream.consume()
+            count += 1
+
+    @staticmethod
+    def _report_error(
+        context: ParseContext,
+        error: ParserError,
+        token: str | bytes,
+        position: int | None = None,
+    ) -> None:
+        issues = context.issues
+        if issues is None:
+            raise error
+
+        if position is None:
+            position = context.token_stream.position - 1
+
+        issues.append(_parse_result_types()[0](error, token, position))
+
+        if not context.collect_all_issues:
+            context.token_stream.discard()
+
+    @classmethod
+    def _report_invalid_value(
+        cls,
+        context: ParseContext,
+        argument: Option | Operand,
+        value: Any,
+        error: Exception,
+        token: str | bytes,
+        position: int,
+    ) -> None:
+        # Outside of `try_parse_arguments`, what the converter raised is
+        # raised unchanged.
+        if context.issues is None:
+            raise error
+
+        cls._report_error(
+            context, InvalidArgumentValueError(argument, value, error), token, position
         )
 
-        context.operand_index += 1
+    @classmethod
+    def _batch_convert(
+        cls,
+        argument: Option | Operand,
+        values: list[Any],
+        context: ParseContext,
+        token: str | bytes,
+        position: int,
+    ) -> Sequence[Any] | None:
+        assert argument.batch_converter is not None
+        try:
+            return argument.batch_converter(values)
+        except _CONVERSION_ERRORS as error:
+            cls._report_invalid_value(context, argument, values, error, token, position)
+            return None
+
+    @classmethod
+    def _apply_option_action(
+        cls, option: Option, values: Sequence[Any], context: ParseContext
+    ) -> None:
+        if option.inherited:
+            namespace = cls._owner_namespace(
+                context.command.get_option_owner(option),
+                context.command_path,
+                context.namespace_path,
+            )
+
+        else:
+            namespace = context.namespace
+
+        key = option.store_name
+        current_value = cls._current_value(namespace, key, context)
+        namespace[key] = option.action(option, values, current_value)
+
+    @classmethod
+    def _apply_operand_action(
+        cls, operand: Operand, values: Sequence[Any], context: ParseContext
+    ) -> None:
+        namespace = context.namespace
+
+        key = operand.name
+        current_value = cls._current_value(namespace, key, context)
+        namespace[key] = operand.action(operand, values, current_value)
+
+    @staticmethod
+    def _owner_namespace(
+        owner: Command,
+        command_path: Sequence[Command],
+        namespace_path: Sequence[Namespace],
+    ) -> Namespace:
+        # Inherited options are stored at the level of the command defining
+        # them, wherever they appear below it.
+        for command, namespace in zip(
+            reversed(command_path), reversed(namespace_path), strict=True
+        ):
+            if command is owner:
+                return namespace
+
+        return namespace_path[-1]
+
+    @staticmethod
+    def _current_value(
+        namespace: Namespace, key: str, context: ParseContext
+    ) -> Any:
+        current_value = namespace.get(key)
+        if context.journal is not None:
+            # Actions may mutate `current_value` in place, so keep a copy.
+            context.journal.append(
+                (namespace, key, key in namespace, copy.copy(current_value))
+            )
+
+        return current_value
 
     @staticmethod
     def _consume_arguments(
         nargs: int | NArgs,
         context: ParseContext,
         *,
-        type_converter: Callable[[str], Any]
-    ) -> list[Any]:
+        argument: Option | Operand,
+        consumed: int = 0,
+    ) -> list[Any] | None:
+        # Returns `None` when an invalid value was recorded instead of raised.
+        max_values = None if context.limits is None else context.limits.max_values
+
+        type_converter = argument.type_converter
+        decoder = argument.decoder
+
+        # `str()` of a `str` token is the identity; skip the call.
+        convert = type_converter is not str
+
+        valid = True
         values: list[Any] = []
         while (token := context.token_stream.peek()) is not None:
-            if not context.end_of_options and token.startswith(OptionPrefix.SHORT):
+            if (
+                not context.end_of_options
+                and token.startswith(syntax_for(token).short_prefix)
+            ):
                 break
 
             if isinstance(nargs, int):
@@ -229,11 +747,39 @@ class ArgumentParser:
             elif nargs is NArgs.OPTIONAL and values:
                 break
 
-            values.append(type_converter(token))
+            # Before converting, so an oversized run never gets stored.
+            if max_values is not None and consumed + len(values) >= max_values:
+                raise ParseLimitError(ParseLimit.VALUE_COUNT, max_values, token)
+
+            try:
+                if isinstance(token, str):
+                    values.append(type_converter(token) if convert else token)
+                elif convert:
+                    values.append(type_converter(decoder(token)))
+                else:
+                    # The decoder alone decides the value, `bytes` included.
+                    values.append(decoder(token))
+            except _CONVERSION_ERRORS as error:
+                ArgumentParser._report_invalid_value(
+                    context,
+                    argument,
+                    token,
+                    error,
+                    token,
+                    context.token_stream.position,
+                )
+
+                # Kept in place of the value, so that `nargs` still counts it.
+                valid = False
+                values.append(token)
 
             context.token_stream.consume()
 
-        return values
+        return values if valid else None
+
+    @staticmethod
+    def _decode(token: str | bytes, decoder: Callable[[bytes], Any]) -> Any:
+        return token if isinstance(token, str) else decoder(token)
 
     @staticmethod
     def _is_nargs_satisfied(nargs: int | NArgs, count: int) -> bool:
@@ -243,4 +789,13 @@ class ArgumentParser:
 
             return True
 
-        return count >= nargs
\ No newline at end of file
+        return count >= nargs
+
+
+# Imported on first use rather than with the parser: building its dataclasses
+# would add about a millisecond to every CLI's startup.
+@cache
+def _parse_result_types() -> tuple[type[ParseIssue], type[ParseResult]]:
+    from .models.parse_result import ParseIssue, ParseResult
+
+    return ParseIssue, ParseResult
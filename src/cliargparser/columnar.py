@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from .actions import count_presence_action, store_value_action
+from .argument_parser import ArgumentParser
+from .defaults import apply_lazy_defaults
+from .models import Namespace, ParseContext, TokenStream
+from .models.arguments import Command, Option
+
+
+type Column = list[Any] | array[Any]
+
+# Scalar columns of these types are packed into an `array.array`, for the root
+# command only: a subcommand's columns hold `None` for rows that did not enter
+# it. A column keeps its type in every chunk.
+_TYPECODES: dict[Callable[[str], Any], str] = {int: "q", float: "d"}
+
+DEFAULT_CHUNK_SIZE = 65536
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnChunk:
+    row_count: int
+
+    # Fully qualified store name (`deploy.region`) -> one value per row.
+    columns: dict[str, Column]
+
+
+def parse_columns(
+    command: Command,
+    invocations: Iterable[str | bytes | Iterable[str | bytes]],
+    *,
+    command_path_column: str = "command_path",
+    skip_errors: bool = False,
+) -> ColumnChunk:
+    builder = _ColumnBuilder(command, command_path_column)
+    for arguments in invocations:
+        builder.add_row(arguments, skip_errors=skip_errors)
+
+    return builder.flush()
+
+
+def iter_column_chunks(
+    command: Command,
+    invocations: Iterable[str | bytes | Iterable[str | bytes]],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    command_path_column: str = "command_path",
+    skip_errors: bool = False,
+) -> Iterator[ColumnChunk]:
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive (got: {chunk_size})")
+
+    builder = _ColumnBuilder(command, command_path_column)
+    for arguments in invocations:
+        builder.add_row(arguments, skip_errors=skip_errors)
+
+        if builder.row_count == chunk_size:
+            yield builder.flush()
+
+    if builder.row_count:
+        yield builder.flush()
+
+
+class _ColumnSpec:
+    __slots__ = ("default", "entered", "rows", "typecode", "values")
+
+    def __init__(
+        self, default: Any, typecode: str | None, entered: list[int] | None
+    ) -> None:
+        self.default = default
+        self.typecode = typecode
+
+        # Rows that entered the command the column belongs to, shared by its
+        # columns; `None` for the root command, which every row enters.
+        self.entered = entered
+
+        # Only the cells that were set; every other row gets `default`.
+        self.rows: list[int] = []
+        self.values: list[Any] = []
+
+    def build(self, row_count: int) -> Column:
+        entered = self.entered
+        if entered is not None and len(entered) < row_count:
+            # Rows outside the command get `None` rather than its defaults.
+            column: list[Any] = [None] * row_count
+            for row in entered:
+                column[row] = self.default
+
+            return self._fill(column)
+
+        if self.typecode is not None:
+            try:
+                return self._fill(array(self.typecode, (self.default,)) * row_count)
+            except (TypeError, OverflowError):
+                # A value the array cannot hold: the column is a list from
+                # now on, so that later chunks agree with this one.
+                self.typecode = None
+
+        return self._fill([self.default] * row_count)
+
+    def _fill[C: Column](self, column: C) -> C:
+        for row, value in zip(self.rows, self.values, strict=True):
+            column[row] = value
+
+        return column
+
+
+class _ColumnBuilder:
+    __slots__ = (
+        "_command_path_column",
+        "_command_paths",
+        "_declared_prefixes",
+        "_entered_rows",
+        "_qualified_names",
+        "_specs",
+        "command",
+        "row_count",
+    )
+
+    def __init__(self, command: Command, command_path_column: str) -> None:
+        self.command = command
+        self.row_count = 0
+
+        self._command_path_column = command_path_column
+        self._command_paths: list[str] = []
+
+        self._specs: dict[str, _ColumnSpec] = {}
+        self._declared_prefixes: set[str] = set()
+
+        # Subcommand prefix -> rows that entered that subcommand.
+        self._entered_rows: dict[str, list[int]] = {}
+
+        # prefix -> store name -> `prefix + store name`, so that rows do not
+        # build a new string per value.
+        self._qualified_names: dict[str, dict[str, str]] = {}
+
+        self._declare(command, "", ())
+
+        if command_path_column in self._specs:
+            raise ValueError(
+                f"command_path_column {command_path_column!r} collides with "
+                "a store name"
+            )
+
+    def add_row(
+        self, arguments: str | bytes | Iterable[str | bytes], *, skip_errors: bool
+    ) -> None:
+        namespace = Namespace()
+        context = ParseContext(
+            command=self.command,
+            namespace=namespace,
+            token_stream=TokenStream(ArgumentParser._split_arguments(arguments)),
+            command_path=[self.command],
+            namespace_path=[namespace],
+            issues=[] if skip_errors else None,
+        )
+
+        ArgumentParser._parse_tokens(context)
+        if context.issues:
+            return
+
+        if Command._lazy_defaults_registered:
+            apply_lazy_defaults(self.command, namespace)
+
+        row = self.row_count
+        command_path = context.command_path
+        namespace_path = context.namespace_path
+        last_level = len(namespace_path) - 1
+
+        prefix = ""
+        for level, namespace in enumerate(namespace_path):
+            if prefix not in self._declared_prefixes:
+                # A subcommand loaded while parsing this row.
+                self._declare(command_path[level], prefix, ())
+
+            if prefix:
+                self._entered_rows[prefix].append(row)
+
+            subcommand_namespace = (
+                namespace_path[level + 1] if level < last_level else None
+            )
+            qualified_names = self._qualified_names[prefix]
+
+            for key, value in namespace.items():
+                if value is subcommand_namespace:
+                    continue
+
+                name = qualified_names.get(key)
+                if name is None:
+                    name = qualified_names[key] = prefix + key
+
+                spec = self._specs.get(name)
+                if spec is None:
+                    spec = self._specs[name] = _ColumnSpec(
+                        None, None, self._entered_rows.get(prefix)
+                    )
+
+                spec.rows.append(row)
+                spec.values.append(value)
+
+            if level < last_level:
+                prefix = f"{prefix}{command_path[level + 1].name}."
+
+        self._command_paths.append(" ".join(command.name for command in command_path))
+        self.row_count += 1
+
+    def flush(self) -> ColumnChunk:
+        row_count = self.row_count
+
+        columns: dict[str, Column] = {}
+        for name, spec in self._specs.items():
+            columns[name] = spec.build(row_count)
+            spec.rows.clear()
+            spec.values.clear()
+
+        for rows in self._entered_rows.values():
+            rows.clear()
+
+        columns[self._command_path_column] = self._command_paths
+        self._command_paths = []
+        self.row_count = 0
+
+        return ColumnChunk(row_count=row_count, columns=columns)
+
+    def _declare(
+        self, command: Command, prefix: str, ancestors: tuple[Command, ...]
+    ) -> None:
+        if prefix in self._declared_prefixes or command in ancestors:
+            return
+
+        self._declared_prefixes.add(prefix)
+        self._qualified_names.setdefault(prefix, {})
+        entered = self._entered_rows.setdefault(prefix, []) if prefix else None
+
+        for option in command.options:
+            self._specs.setdefault(
+                prefix + option.store_name,
+                _ColumnSpec(
+                    option.default, None if prefix else _typecode(option), entered
+                ),
+            )
+
+        for operand in command.operands:
+            self._specs.setdefault(
+                prefix + operand.name, _ColumnSpec(operand.default, None, entered)
+            )
+
+        # Lazy subcommands are declared when a row first loads them.
+        for subcommand in command.subcommands:
+            self._declare(
+                subcommand, f"{prefix}{subcommand.name}.", (*ancestors, command)
+            )
+
+
+def _typecode(option: Option) -> str | None:
+    if option.action is store_value_action and option.nargs == 1:
+        kind = option.type_converter
+    elif option.action is count_presence_action:
+        kind = int
+    else:
+        return None
+
+    typecode = _TYPECODES.get(kind)
+    if typecode is None or type(option.default) is not kind:
+        return None
+
+    return typecode
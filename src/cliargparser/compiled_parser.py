@@ -0,0 +1,637 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+import hashlib
+from typing import Any
+
+from .actions import (
+    append_present_action,
+    append_value_action,
+    count_presence_action,
+    extend_value_action,
+    store_false_action,
+    store_present_action,
+    store_sequence_action,
+    store_true_action,
+    store_value_action,
+    store_values_action,
+)
+from .argument_parser import ArgumentParser
+from .defaults import apply_lazy_defaults
+from .enums import NArgs, OptionPrefix, OptionToken, ParseMode, ParsingSentinel
+from .exceptions import (
+    ExtraOperandError,
+    MissingOperandArgumentsError,
+    MissingOptionArgumentsError,
+    OptionTakesNoArgumentError,
+    UnknownCommandError,
+    UnknownLongOptionError,
+)
+from .models import Namespace, ParseContext, TokenStream
+from .models.arguments import Command, LazySubcommand, Operand, Option
+from .syntax import STR_SYNTAX
+
+
+def _resume_interpreted(
+    command: Command,
+    tokens: list[str],
+    index: int,
+    end_of_options: bool,
+    namespace: Namespace,
+    commands: list[Command],
+    namespaces: list[Namespace],
+) -> None:
+    context = ParseContext(
+        command=command,
+        namespace=namespace,
+        token_stream=TokenStream(tokens[index:]),
+        end_of_options=end_of_options,
+        command_path=commands,
+        namespace_path=namespaces,
+    )
+    ArgumentParser._parse_tokens(context)
+
+
+# Digest of the generated source -> factory taking the tree's objects and
+# returning `parse`, least recently used first. Trees with the same shape
+# share one compiled factory.
+_FACTORY_CACHE_SIZE = 64
+_factory_cache: dict[bytes, Callable[..., Callable[[Any], Namespace]]] = {}
+
+_GLOBALS: dict[str, Any] = {
+    "ArgumentParser": ArgumentParser,
+    "ExtraOperandError": ExtraOperandError,
+    "MissingOperandArgumentsError": MissingOperandArgumentsError,
+    "MissingOptionArgumentsError": MissingOptionArgumentsError,
+    "NArgs": NArgs,
+    "Namespace": Namespace,
+    "OptionTakesNoArgumentError": OptionTakesNoArgumentError,
+    "STR_SYNTAX": STR_SYNTAX,
+    "UnknownCommandError": UnknownCommandError,
+    "UnknownLongOptionError": UnknownLongOptionError,
+    "owner_namespace": ArgumentParser._owner_namespace,
+    "resume_interpreted": _resume_interpreted,
+    "unknown_short_option_error": ArgumentParser._unknown_short_option_error,
+}
+
+
+def _compile_factory(source: str) -> Callable[..., Callable[[Any], Namespace]]:
+    key = hashlib.blake2b(source.encode(), digest_size=16).digest()
+
+    factory = _factory_cache.pop(key, None)
+    if factory is None:
+        code = compile(source, "<cliargparser.compiled>", "exec")
+        namespace: dict[str, Any] = {}
+        exec(code, _GLOBALS, namespace)
+        factory = namespace["__create_fn__"]
+
+        if len(_factory_cache) >= _FACTORY_CACHE_SIZE:
+            del _factory_cache[next(iter(_factory_cache))]
+
+    _factory_cache[key] = factory
+    return factory
+
+
+class CompiledParser:
+    __slots__ = ("_mutation_count", "_parse", "command", "source")
+
+    def __init__(self, command: Command) -> None:
+        self.command = command
+        self._compile()
+
+    def _compile(self) -> None:
+        # Taken first, so a mutation while generating is never missed.
+        self._mutation_count = self.command._mutation_count
+
+        generator = _SourceGenerator(self.command)
+        self.source = generator.generate()
+        self._parse = _compile_factory(self.source)(*generator.constants)
+
+    def parse_arguments(
+        self,
+        arguments: str | bytes | Iterable[str | bytes],
+        *,
+        lazy_defaults: bool = True,
+    ) -> Namespace:
+        # Regenerated once the tree has changed, which includes loading a
+        # lazy subcommand: it is then compiled instead of interpreted.
+        if self._mutation_count != self.command._mutation_count:
+            self._compile()
+
+        namespace = self._parse(arguments)
+
+        if lazy_defaults and Command._lazy_defaults_registered:
+            apply_lazy_defaults(self.command, namespace)
+
+        return namespace
+
+
+class _SourceGenerator:
+    __slots__ = ("_command_functions", "_constant_names", "_lines", "constants", "root")
+
+    def __init__(self, root: Command) -> None:
+        self.root = root
+        self.constants: list[Any] = []
+
+        self._constant_names: dict[int, str] = {}
+        self._command_functions: dict[int, str] = {}
+        self._lines: list[str] = []
+
+    def generate(self) -> str:
+        root_name = self._constant(self.root)
+        root_function = self._function_name(self.root)
+
+        body = self._lines
+        self._emit_command(self.root)
+
+        self._lines = []
+        self._line(0, f"def __create_fn__({', '.join(self._constant_names.values())}):")
+        self._lines.extend(body)
+        self._line(1, "def parse(arguments):")
+        self._line(2, "if isinstance(arguments, str):")
+        self._line(3, "import shlex")
+        self._line(3, "tokens = shlex.split(arguments)")
+        self._line(2, "elif isinstance(arguments, bytes):")
+        # Lazy defaults are applied by `CompiledParser.parse_arguments`.
+        self._line(
+            3,
+            f"return ArgumentParser.parse_arguments(arguments, {root_name}, "
+            "lazy_defaults=False)"
+        )
+        self._line(2, "else:")
+        self._line(3, "tokens = list(arguments)")
+        # The generated code assumes exact `str` tokens; anything else goes
+        # through the interpreter.
+        self._line(3, "for token in tokens:")
+        self._line(4, "if token.__class__ is not str:")
+        self._line(
+            5,
+            f"return ArgumentParser.parse_arguments(tokens, {root_name}, "
+            "lazy_defaults=False)"
+        )
+        self._line(2, "namespace = Namespace()")
+        self._line(
+            2,
+            f"{root_function}"
+            f"(tokens, 0, len(tokens), False, namespace, [{root_name}], [namespace])"
+        )
+        self._line(2, "return namespace")
+        self._line(1, "return parse")
+
+        return "\n".join(self._lines) + "\n"
+
+    def _line(self, depth: int, text: str) -> None:
+        self._lines.append("    " * depth + text)
+
+    def _constant(self, value: Any) -> str:
+        name = self._constant_names.get(id(value))
+        if name is None:
+            name = f"_k{len(self.constants)}"
+            self._constant_names[id(value)] = name
+            self.constants.append(value)
+
+        return name
+
+    def _function_name(self, command: Command) -> str:
+        return f"_command_{self._constant(command).removeprefix('_k')}"
+
+    def _emit_command(self, command: Command) -> None:
+        name = self._function_name(command)
+        if id(command) in self._command_functions:
+            return
+
+        self._command_functions[id(command)] = name
+        subcommands = _spellings_by_option(command._subcommands_by_name)
+
+        self._line(
+            1,
+            f"def {name}"
+            "(tokens, index, length, end_of_options, namespace, commands, namespaces):"
+        )
+        if command.parse_mode is ParseMode.OPERAND:
+            self._line(2, "operand_index = 0")
+        self._line(2, "while index < length:")
+        self._line(3, "token = tokens[index]")
+        self._line(3, "index += 1")
+        self._line(3, "if not end_of_options:")
+        self._line(4, f"if token == {str(ParsingSentinel.END_OF_OPTIONS)!r}:")
+        self._line(5, "end_of_options = True")
+        self._line(5, "continue")
+        self._line(4, f"if token.startswith({str(OptionPrefix.LONG)!r}):")
+        self._emit_long_options(command, 5)
+        self._line(5, "continue")
+        self._line(4, f"if token.startswith({str(OptionPrefix.SHORT)!r}):")
+        self._emit_short_option_cluster(command, 5)
+        self._line(5, "continue")
+
+        if command.parse_mode is ParseMode.COMMAND:
+            self._emit_subcommand_dispatch(command, subcommands, 3)
+        else:
+            self._emit_operand_dispatch(command, 3)
+
+        for subcommand, _ in subcommands:
+            if isinstance(subcommand, Command):
+                self._emit_command(subcommand)
+
+    def _emit_long_options(self, command: Command, depth: int) -> None:
+        spellings = _spellings_by_option(command._long_options_by_token)
+        separator = str(OptionToken.EXPLICIT_ARGUMENT)
+        prefix_length = len(OptionPrefix.LONG)
+
+        depth = self._emit_dispatch(
+            "token",
+            spellings,
+            depth,
+            lambda option, depth: self._emit_option(
+                command, option, depth, explicit=False
+            ),
+        )
+
+        self._line(depth, f"separator_index = token.find({separator!r})")
+        self._line(depth, "if separator_index == -1:")
+        self._line(depth + 1, f"raise UnknownLongOptionError(token[{prefix_length}:])")
+        self._line(depth, "spelling = token[:separator_index]")
+        self._line(depth, "explicit_argument = token[separator_index + 1:]")
+
+        depth = self._emit_dispatch(
+            "spelling",
+            spellings,
+            depth,
+            lambda option, depth: self._emit_option(
+                command, option, depth, explicit=True
+            ),
+        )
+
+        self._line(
+            depth,
+            f"raise UnknownLongOptionError(token[{prefix_length}:separator_index])"
+        )
+
+    def _emit_short_option_cluster(self, command: Command, depth: int) -> None:
+        short_options = _spellings_by_option(command._short_options_by_char)
+        separator = str(OptionToken.EXPLICIT_ARGUMENT)
+
+        self._line(depth, f"cluster_index = {len(OptionPrefix.SHORT)}")
+        self._line(depth, "cluster_length = len(token)")
+        self._line(depth, f"if cluster_length == {len(OptionPrefix.SHORT)}:")
+        self._line(
+            depth + 1,
+            f"raise unknown_short_option_error(token, {len(OptionPrefix.SHORT)}, "
+            "STR_SYNTAX)"
+        )
+        self._line(depth, "while cluster_index < cluster_length:")
+        self._line(depth + 1, "char = token[cluster_index]")
+
+        def emit_short_option(option: Option, depth: int) -> None:
+            if not option.takes_arguments:
+                self._line(
+                    depth, f"if token.startswith({separator!r}, cluster_index + 1):"
+                )
+                self._line(
+                    depth + 1,
+                    "raise OptionTakesNoArgumentError("
+                    f"{str(OptionPrefix.SHORT)!r} + char, token[cluster_index + 2:])"
+                )
+                self._emit_action(
+                    option,
+                    option.store_name,
+                    "()",
+                    depth,
+                    self._option_namespace(command, option, depth),
+                )
+                self._line(depth, "cluster_index += 1")
+                return
+
+            self._line(depth, "if cluster_index + 1 == cluster_length:")
+            self._emit_option(command, option, depth + 1, explicit=False)
+            self._line(depth, "else:")
+            self._line(depth + 1, "start = cluster_index + 1")
+            self._line(depth + 1, f"if token.startswith({separator!r}, start):")
+            self._line(depth + 2, f"start += {len(separator)}")
+            self._line(depth + 1, "explicit_argument = token[start:]")
+            self._emit_option(command, option, depth + 1, explicit=True)
+            self._line(depth, "break")
+
+        depth = self._emit_dispatch("char", short_options, depth + 1, emit_short_option)
+
+        self._line(
+            depth, "raise unknown_short_option_error(token, cluster_index, STR_SYNTAX)"
+        )
+
+    def _emit_dispatch[T](
+        self,
+        variable: str,
+        branches: list[tuple[T, list[str]]],
+        depth: int,
+        emit_branch: Callable[[T, int], None],
+    ) -> int:
+        # Spellings are looked up in a dict for the number of their branch,
+        # which is then found by bisection: a chain of comparisons would cost
+        # every token one per spelling. Returns the depth at which to emit
+        # what runs when nothing matched.
+        if not branches:
+            return depth
+
+        numbers = {
+            name: number for number, (_, names) in enumerate(branches) for name in names
+        }
+        self._line(depth, f"branch = {self._constant(numbers)}.get({variable})")
+        self._line(depth, "if branch is not None:")
+        self._emit_branches(branches, 0, len(branches), depth + 1, emit_branch)
+        self._line(depth, "else:")
+
+        return depth + 1
+
+    def _emit_branches[T](
+        self,
+        branches: list[tuple[T, list[str]]],
+        start: int,
+        stop: int,
+        depth: int,
+        emit_branch: Callable[[T, int], None],
+    ) -> None:
+        if stop - start == 1:
+            emit_branch(branches[start][0], depth)
+            return
+
+        middle = (start + stop) // 2
+        self._line(depth, f"if branch < {middle}:")
+        self._emit_branches(branches, start, middle, depth + 1, emit_branch)
+        self._line(depth, "else:")
+        self._emit_branches(branches, middle, stop, depth + 1, emit_branch)
+
+    def _emit_option(
+        self, command: Command, option: Option, depth: int, *, explicit: bool
+    ) -> None:
+        if not option.takes_arguments:
+            if explicit:
+                self._line(
+                    depth,
+                    "raise OptionTakesNoArgumentError(spelling, explicit_argument)"
+                )
+                return
+
+            self._emit_action(
+                option,
+                option.store_name,
+                "()",
+                depth,
+                self._option_namespace(command, option, depth),
+            )
+            return
+
+        nargs = option.nargs
+
+        if explicit:
+            self._line(depth, "values = [explicit_argument]")
+        elif (
+            nargs == 1
+            and option.action is store_value_action
+            and option.batch_converter is None
+        ):
+            # The common `--name value` case needs no intermediate list.
+            self._line(
+                depth,
+                "if index < length and (end_of_options or not "
+                f"tokens[index].startswith({str(OptionPrefix.SHORT)!r})):"
+            )
+            value = self._convert(option, "tokens[index]")
+            namespace = self._option_namespace(command, option, depth + 1)
+            self._line(depth + 1, f"{namespace}[{option.store_name!r}] = {value}")
+            self._line(depth + 1, "index += 1")
+            self._line(depth, "else:")
+            self._line(
+                depth + 1, "raise MissingOptionArgumentsError(token, 1, 0)"
+            )
+            return
+        else:
+            self._line(depth, "values = []")
+            self._emit_consume_arguments(option, "values", depth)
+
+        self._emit_nargs_check(
+            nargs,
+            depth,
+            f"MissingOptionArgumentsError(token, {_nargs_literal(nargs)}, len(values))",
+        )
+        self._emit_batch_conversion(option, depth)
+        self._emit_action(
+            option,
+            option.store_name,
+            "values",
+            depth,
+            self._option_namespace(command, option, depth),
+        )
+
+    def _option_namespace(self, command: Command, option: Option, depth: int) -> str:
+        owner = command.get_option_owner(option)
+        if owner is command:
+            return "namespace"
+
+        self._line(
+            depth,
+            f"target_namespace = owner_namespace({self._constant(owner)}, "
+            "commands, namespaces)"
+        )
+        return "target_namespace"
+
+    def _emit_subcommand_dispatch(
+        self,
+        command: Command,
+        subcommands: list[tuple[Command | LazySubcommand, list[str]]],
+        depth: int,
+    ) -> None:
+        def emit_subcommand(subcommand: Command | LazySubcommand, depth: int) -> None:
+            if isinstance(subcommand, LazySubcommand):
+                # Not loaded yet: let the interpreter load it and finish.
+                self._line(
+                    depth,
+                    f"return resume_interpreted({self._constant(command)}, tokens, "
+                    "index - 1, end_of_options, namespace, commands, namespaces)"
+                )
+                return
+
+            self._line(depth, "command_namespace = Namespace()")
+            self._line(depth, f"namespace[{subcommand.name!r}] = command_namespace")
+            self._line(depth, f"commands.append({self._constant(subcommand)})")
+            self._line(depth, "namespaces.append(command_namespace)")
+            self._line(
+                depth,
+                f"return {self._function_name(subcommand)}(tokens, index, length, "
+                "end_of_options, command_namespace, commands, namespaces)"
+            )
+
+        depth = self._emit_dispatch("token", subcommands, depth, emit_subcommand)
+        self._line(depth, "raise UnknownCommandError(token)")
+
+    def _emit_operand_dispatch(self, command: Command, depth: int) -> None:
+        if not command.operands:
+            self._line(depth, "raise ExtraOperandError(token)")
+            return
+
+        keyword = "if"
+        for index, operand in enumerate(command.operands):
+            self._line(depth, f"{keyword} operand_index == {index}:")
+            self._emit_operand(operand, depth + 1)
+            keyword = "elif"
+
+        self._line(depth, "else:")
+        self._line(depth + 1, "raise ExtraOperandError(token)")
+        self._line(depth, "operand_index += 1")
+
+    def _emit_operand(self, operand: Operand, depth: int) -> None:
+        self._line(depth, "values = [token]")
+        if operand.takes_arguments:
+            self._line(depth, "operand_arguments = []")
+            self._emit_consume_arguments(operand, "operand_arguments", depth)
+            self._line(depth, "values.extend(operand_arguments)")
+
+        self._emit_nargs_check(
+            operand.nargs,
+            depth,
+            f"MissingOperandArgumentsError({operand.name!r}, "
+            f"{_nargs_literal(operand.nargs)}, len(values))",
+        )
+        self._emit_batch_conversion(operand, depth)
+        self._emit_action(operand, operand.name, "values", depth)
+
+    def _emit_consume_arguments(
+        self, argument: Option | Operand, target: str, depth: int
+    ) -> None:
+        nargs = argument.nargs
+
+        if argument.type_converter is str and nargs is not NArgs.OPTIONAL:
+            self._emit_slice_arguments(argument, target, depth)
+            return
+
+        condition = "index < length"
+        if isinstance(nargs, int):
+            condition += f" and len({target}) < {nargs}"
+        elif nargs is NArgs.OPTIONAL:
+            condition += f" and not {target}"
+
+        self._line(depth, f"while {condition}:")
+        self._line(depth + 1, "argument = tokens[index]")
+        self._line(
+            depth + 1,
+            "if not end_of_options and "
+            f"argument.startswith({str(OptionPrefix.SHORT)!r}):"
+        )
+        self._line(depth + 2, "break")
+        self._line(depth + 1, f"{target}.append({self._convert(argument, 'argument')})")
+        self._line(depth + 1, "index += 1")
+
+    def _emit_slice_arguments(
+        self, argument: Option | Operand, target: str, depth: int
+    ) -> None:
+        # Nothing to convert per value: find where the run of values ends,
+        # then take it as one slice.
+        nargs = argument.nargs
+        limit = (
+            f"min(length, index + {nargs} - len({target}))"
+            if isinstance(nargs, int)
+            else "length"
+        )
+
+        self._line(depth, "if end_of_options:")
+        self._line(depth + 1, f"end = {limit}")
+        self._line(depth, "else:")
+        self._line(depth + 1, "end = index")
+        self._line(
+            depth + 1,
+            f"while end < {limit} and not "
+            f"tokens[end].startswith({str(OptionPrefix.SHORT)!r}):"
+        )
+        self._line(depth + 2, "end += 1")
+        self._line(depth, f"{target} += tokens[index:end]")
+        self._line(depth, "index = end")
+
+    def _emit_nargs_check(self, nargs: int | NArgs, depth: int, error: str) -> None:
+        if isinstance(nargs, int):
+            self._line(depth, f"if len(values) < {nargs}:")
+        elif nargs is NArgs.ONE_OR_MORE:
+            self._line(depth, "if not values:")
+        else:
+            return
+
+        self._line(depth + 1, f"raise {error}")
+
+    def _emit_batch_conversion(self, argument: Option | Operand, depth: int) -> None:
+        if argument.batch_converter is not None:
+            self._line(
+                depth, f"values = {self._constant(argument)}.batch_converter(values)"
+            )
+
+    def _emit_action(
+        self,
+        argument: Option | Operand,
+        key: str,
+        values: str,
+        depth: int,
+        namespace: str = "namespace",
+    ) -> None:
+        action = argument.action
+        target = f"{namespace}[{key!r}]"
+
+        if action is store_value_action:
+            self._line(depth, f"{target} = {values}[0] if {values} else None")
+        elif action is store_values_action:
+            self._line(depth, f"{target} = list({values})")
+        elif action is store_sequence_action:
+            self._line(depth, f"{target} = {values}")
+        elif action is store_true_action:
+            self._line(depth, f"{target} = True")
+        elif action is store_false_action:
+            self._line(depth, f"{target} = False")
+        elif action is store_present_action:
+            self._line(depth, f"{target} = {self._constant(argument)}.present")
+        elif action is count_presence_action:
+            self._line(depth, f"current_value = {namespace}.get({key!r})")
+            self._line(
+                depth, f"{target} = 1 if current_value is None else current_value + 1"
+            )
+        elif action in (
+            append_present_action, append_value_action, extend_value_action
+        ):
+            self._line(depth, f"current_value = {namespace}.get({key!r})")
+            self._line(depth, "if current_value is None:")
+            self._line(depth + 1, "current_value = []")
+            if action is append_present_action:
+                self._line(
+                    depth,
+                    f"current_value.append({self._constant(argument)}.present)"
+                )
+            elif action is append_value_action:
+                self._line(depth, f"if {values}:")
+                self._line(depth + 1, f"current_value.append({values})")
+            else:
+                self._line(depth, f"current_value.extend({values})")
+            self._line(depth, f"{target} = current_value")
+        else:
+            argument_name = self._constant(argument)
+            self._line(
+                depth,
+                f"{target} = {argument_name}.action"
+                f"({argument_name}, {values}, {namespace}.get({key!r}))"
+            )
+
+    def _convert(self, argument: Option | Operand, token: str) -> str:
+        # Tokens are exact `str` here, for which `str()` is the identity.
+        if argument.type_converter is str:
+            return token
+
+        return f"{self._constant(argument)}.type_converter({token})"
+
+
+def _spellings_by_option[T](
+    index: dict[str | bytes, T] | dict[str | int, T]
+) -> list[tuple[T, list[str]]]:
+    spellings: dict[int, tuple[T, list[str]]] = {}
+    for name, value in index.items():
+        if isinstance(name, str):
+            spellings.setdefault(id(value), (value, []))[1].append(name)
+
+    return list(spellings.values())
+
+
+def _nargs_literal(nargs: int | NArgs) -> str:
+    return str(nargs) if isinstance(nargs, int) else f"NArgs.{nargs.name}"
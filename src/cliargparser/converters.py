@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from array import array
+import errno
+import os
+from pathlib import Path
+
+
+# Batch converters, for `batch_converter=`. Each converts every value of one
+# occurrence with a single call instead of one `type_converter` call each.
+# `convert_ints` and `convert_floats` pack values into arrays, which take a
+# fraction of the memory of a list of numbers but are no faster to build.
+
+
+def convert_ints(values: list[str]) -> array[int] | list[int]:
+    try:
+        return array("q", map(int, values))
+    except OverflowError:
+        return list(map(int, values))  # Beyond 64 bits; `int` has no limit.
+
+
+def convert_floats(values: list[str]) -> array[float]:
+    return array("d", map(float, values))
+
+
+def convert_paths(values: list[str]) -> list[Path]:
+    return list(map(Path, values))
+
+
+def convert_existing_paths(values: list[str]) -> list[Path]:
+    # One directory listing per distinct parent instead of one `stat` per
+    # path. Listings compare names exactly and leave symlinks out, so names
+    # missing from them are confirmed with `os.path.exists`.
+    listings: dict[str, frozenset[str]] = {}
+    for value in values:
+        directory, name = os.path.split(value)
+
+        names = listings.get(directory)
+        if names is None:
+            names = listings[directory] = _list_directory(directory)
+
+        if name not in names and not os.path.exists(value):
+            raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), value)
+
+    return list(map(Path, values))
+
+
+def _list_directory(directory: str) -> frozenset[str]:
+    try:
+        with os.scandir(directory or os.curdir) as entries:
+            return frozenset(
+                entry.name for entry in entries if not entry.is_symlink()
+            )
+    except OSError:
+        return frozenset()
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+import os
+from typing import Any
+
+from .exceptions import InvalidEnvironmentFlagError
+from .hints import DefaultFactory
+from .models import Namespace
+from .models.arguments import Command, Option
+from .models.parse_context import JournalEntry
+
+
+_TRUE_SPELLINGS = frozenset({"1", "true", "yes", "on"})
+_FALSE_SPELLINGS = frozenset({"0", "false", "no", "off"})
+
+
+@dataclass(frozen=True, slots=True)
+class KeyedDefault:
+    # One entry of the mapping `source` returns, such as a parsed config
+    # file. Options sharing a `source` call it once per parse.
+    source: DefaultFactory
+    key: str
+    fallback: Any = None
+
+    def __call__(self) -> Any:
+        return self.source().get(self.key, self.fallback)
+
+
+def apply_lazy_defaults(
+    command: Command,
+    namespace: Namespace,
+    *,
+    journal: list[JournalEntry] | None = None,
+) -> None:
+    # Only the commands on the parsed path are visited, and each factory is
+    # called at most once however many options share it.
+    results: dict[int, Any] = {}
+
+    while True:
+        for option in command._lazy_default_options:
+            if option.store_name not in namespace and not _mutex_sibling_given(
+                command, option, namespace
+            ):
+                _apply_lazy_default(option, namespace, results)
+
+                if journal is not None and option.store_name in namespace:
+                    journal.append((namespace, option.store_name, False, None))
+
+        entered = _entered_subcommand(command, namespace)
+        if entered is None:
+            return
+
+        command, namespace = entered
+
+
+def _apply_lazy_default(
+    option: Option, namespace: Namespace, results: dict[int, Any]
+) -> None:
+    if option.env_var is not None:
+        # Set but empty counts as unset.
+        value = os.environ.get(option.env_var)
+        if value and not option.takes_arguments:
+            # Options taking no arguments read a boolean; a false one counts
+            # as unset rather than as the option given.
+            spelling = value.strip().lower()
+            if spelling in _FALSE_SPELLINGS:
+                value = None
+            elif spelling not in _TRUE_SPELLINGS:
+                raise InvalidEnvironmentFlagError(option.env_var, value)
+
+        if value:
+            # Converted and stored as if given as `--name value`, or as a
+            # bare `--name` for options taking no arguments. (An explicit
+            # `--name=value` is only decoded, not passed to `type_converter`.)
+            values: list[Any] = [value] if option.takes_arguments else []
+            if option.batch_converter is not None:
+                converted = option.batch_converter(values)
+            elif option.type_converter is str:
+                converted = values
+            else:
+                converted = list(map(option.type_converter, values))
+
+            namespace[option.store_name] = option.action(option, converted, None)
+            return
+
+    if option.default_factory is not None:
+        namespace[option.store_name] = _call_factory(option.default_factory, results)
+
+
+def _call_factory(factory: DefaultFactory, results: dict[int, Any]) -> Any:
+    # Factories are kept alive by their options, so their ids are stable for
+    # the duration of one resolution.
+    key = id(factory)
+    if key in results:
+        return results[key]
+
+    if isinstance(factory, KeyedDefault):
+        source: Mapping[str, Any] = _call_factory(factory.source, results)
+        value = source.get(factory.key, factory.fallback)
+    else:
+        value = factory()
+
+    results[key] = value
+    return value
+
+
+def _mutex_sibling_given(
+    command: Command, option: Option, namespace: Namespace
+) -> bool:
+    for group in command._mutex_option_groups:
+        options = group.options
+        if any(other is option for other in options) and any(
+            other.store_name in namespace for other in options if other is not option
+        ):
+            return True
+
+    return False
+
+
+def _entered_subcommand(
+    command: Command, namespace: Namespace
+) -> tuple[Command, Namespace] | None:
+    if not command.has_subcommands:
+        return None
+
+    # Subcommand namespaces are stored under the subcommand's name, which no
+    # option or operand of `command` may share.
+    for key, value in namespace.items():
+        if isinstance(value, Namespace):
+            subcommand = command.get_subcommand(key)
+            if subcommand is not None:
+                return subcommand, value
+
+    return None
@@ -24,3 +24,24 @@ class NArgs(StrEnum):
 
     ZERO_OR_MORE = "*"
     ONE_OR_MORE = "+"
+
+
+class ParseIssueKind(StrEnum):
+    UNKNOWN_LONG_OPTION = "unknown_long_option"
+    UNKNOWN_SHORT_OPTION = "unknown_short_option"
+    OPTION_TAKES_NO_ARGUMENT = "option_takes_no_argument"
+    MISSING_OPTION_ARGUMENTS = "missing_option_arguments"
+    UNKNOWN_COMMAND = "unknown_command"
+    EXTRA_OPERAND = "extra_operand"
+    MISSING_OPERAND_ARGUMENTS = "missing_operand_arguments"
+    INVALID_VALUE = "invalid_value"
+    LIMIT_EXCEEDED = "limit_exceeded"
+
+
+class ParseLimit(StrEnum):
+    INPUT_LENGTH = "input_length"
+    TOKEN_COUNT = "token_count"
+    TOKEN_LENGTH = "token_length"
+    SUBCOMMAND_DEPTH = "subcommand_depth"
+    VALUE_COUNT = "value_count"
+    CLUSTER_LENGTH = "cluster_length"
@@ -1,33 +1,92 @@
-from .arguments import (
-    ExtraOperandError,
-    MissingArgumentsError,
-    MissingOperandArgumentsError,
-    MissingOptionArgumentsError,
-    OperandAfterNonDeterministicOperandError,
-    OptionInGroupTakesArgumentsError,
-    OptionTakesNoArgumentError,
-    UnknownCommandError,
-    UnknownLongOptionError,
-    UnknownOptionError,
-    UnknownShortOptionError,
-    UnknownShortOptionInGroupError,
-)
-from .parser import ParseModeError, ParserError
+from importlib import import_module
+
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .arguments import (
+        ArgumentConflictError,
+        ExtraOperandError,
+        InvalidArgumentValueError,
+        InvalidEnvironmentFlagError,
+        MissingArgumentsError,
+        MissingOperandArgumentsError,
+        MissingOptionArgumentsError,
+        OperandAfterNonDeterministicOperandError,
+        OptionConflictError,
+        OptionInGroupTakesArgumentsError,
+        OptionTakesNoArgumentError,
+        StoreNameConflictError,
+        SubcommandConflictError,
+        UnknownCommandError,
+        UnknownLongOptionError,
+        UnknownOptionError,
+        UnknownShortOptionError,
+        UnknownShortOptionInGroupError,
+    )
+    from .parser import ParseLimitError, ParseModeError, ParserError
 
 
 __all__ = [
+    "ArgumentConflictError",
     "ExtraOperandError",
+    "InvalidArgumentValueError",
+    "InvalidEnvironmentFlagError",
     "MissingArgumentsError",
     "MissingOperandArgumentsError",
     "MissingOptionArgumentsError",
     "OperandAfterNonDeterministicOperandError",
+    "OptionConflictError",
     "OptionInGroupTakesArgumentsError",
     "OptionTakesNoArgumentError",
+    "ParseLimitError",
     "ParseModeError",
     "ParserError",
+    "StoreNameConflictError",
+    "SubcommandConflictError",
     "UnknownCommandError",
     "UnknownLongOptionError",
     "UnknownOptionError",
     "UnknownShortOptionError",
     "UnknownShortOptionInGroupError",
-]
\ No newline at end of file
+]
+
+# Resolved straight to the defining module so only the exceptions actually
+# used get imported.
+_LAZY_ATTRIBUTES = {
+    "ArgumentConflictError": ".arguments.argument",
+    "ExtraOperandError": ".arguments.operand",
+    "InvalidArgumentValueError": ".arguments.argument",
+    "InvalidEnvironmentFlagError": ".arguments.option",
+    "MissingArgumentsError": ".arguments.argument",
+    "MissingOperandArgumentsError": ".arguments.operand",
+    "MissingOptionArgumentsError": ".arguments.option",
+    "OperandAfterNonDeterministicOperandError": ".arguments.operand",
+    "OptionConflictError": ".arguments.option",
+    "OptionInGroupTakesArgumentsError": ".arguments.option",
+    "OptionTakesNoArgumentError": ".arguments.option",
+    "ParseLimitError": ".parser",
+    "ParseModeError": ".parser",
+    "ParserError": ".parser",
+    "StoreNameConflictError": ".arguments.argument",
+    "SubcommandConflictError": ".arguments.command",
+    "UnknownCommandError": ".arguments.command",
+    "UnknownLongOptionError": ".arguments.option",
+    "UnknownOptionError": ".arguments.option",
+    "UnknownShortOptionError": ".arguments.option",
+    "UnknownShortOptionInGroupError": ".arguments.option",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
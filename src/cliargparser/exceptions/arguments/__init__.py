@@ -1,32 +1,86 @@
-from .argument import MissingArgumentsError
-from .command import UnknownCommandError
-from .operand import (
-    ExtraOperandError,
-    MissingOperandArgumentsError,
-    OperandAfterNonDeterministicOperandError,
-)
-from .option import (
-    MissingOptionArgumentsError,
-    OptionInGroupTakesArgumentsError,
-    OptionTakesNoArgumentError,
-    UnknownLongOptionError,
-    UnknownOptionError,
-    UnknownShortOptionError,
-    UnknownShortOptionInGroupError,
-)
+from importlib import import_module
+
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .argument import (
+        ArgumentConflictError,
+        InvalidArgumentValueError,
+        MissingArgumentsError,
+        StoreNameConflictError,
+    )
+    from .command import SubcommandConflictError, UnknownCommandError
+    from .operand import (
+        ExtraOperandError,
+        MissingOperandArgumentsError,
+        OperandAfterNonDeterministicOperandError,
+    )
+    from .option import (
+        InvalidEnvironmentFlagError,
+        MissingOptionArgumentsError,
+        OptionConflictError,
+        OptionInGroupTakesArgumentsError,
+        OptionTakesNoArgumentError,
+        UnknownLongOptionError,
+        UnknownOptionError,
+        UnknownShortOptionError,
+        UnknownShortOptionInGroupError,
+    )
 
 
 __all__ = [
+    "ArgumentConflictError",
     "ExtraOperandError",
+    "InvalidArgumentValueError",
+    "InvalidEnvironmentFlagError",
     "MissingArgumentsError",
     "MissingOperandArgumentsError",
     "MissingOptionArgumentsError",
     "OperandAfterNonDeterministicOperandError",
+    "OptionConflictError",
     "OptionInGroupTakesArgumentsError",
     "OptionTakesNoArgumentError",
+    "StoreNameConflictError",
+    "SubcommandConflictError",
     "UnknownCommandError",
     "UnknownLongOptionError",
     "UnknownOptionError",
     "UnknownShortOptionError",
     "UnknownShortOptionInGroupError",
-]
\ No newline at end of file
+]
+
+_LAZY_ATTRIBUTES = {
+    "ArgumentConflictError": ".argument",
+    "ExtraOperandError": ".operand",
+    "InvalidArgumentValueError": ".argument",
+    "InvalidEnvironmentFlagError": ".option",
+    "MissingArgumentsError": ".argument",
+    "MissingOperandArgumentsError": ".operand",
+    "MissingOptionArgumentsError": ".option",
+    "OperandAfterNonDeterministicOperandError": ".operand",
+    "OptionConflictError": ".option",
+    "OptionInGroupTakesArgumentsError": ".option",
+    "OptionTakesNoArgumentError": ".option",
+    "StoreNameConflictError": ".argument",
+    "SubcommandConflictError": ".command",
+    "UnknownCommandError": ".command",
+    "UnknownLongOptionError": ".option",
+    "UnknownOptionError": ".option",
+    "UnknownShortOptionError": ".option",
+    "UnknownShortOptionInGroupError": ".option",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
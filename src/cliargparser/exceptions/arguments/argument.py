@@ -1,5 +1,79 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from cliargparser.enums import OptionPrefix
+
 from ..parser import ParserError
 
 
+if TYPE_CHECKING:
+    from cliargparser.models.arguments import (
+        Command,
+        LazySubcommand,
+        Operand,
+        Option,
+    )
+
+
 class MissingArgumentsError(ParserError):
-    pass
\ No newline at end of file
+    pass
+
+
+class ArgumentConflictError(ParserError):
+    def __init__(
+        self,
+        name: str,
+        existing: Option | Operand | Command | LazySubcommand,
+        argument: Option | Operand | Command | LazySubcommand,
+    ) -> None:
+        self.name = name
+        self.existing = existing
+        self.argument = argument
+
+        super().__init__(self.name, self.existing, self.argument)
+
+
+class InvalidArgumentValueError(ParserError):
+    def __init__(
+        self, argument: Option | Operand, value: Any, error: Exception
+    ) -> None:
+        self.argument = argument
+        self.value = value
+
+        # What the decoder or converter raised.
+        self.error = error
+
+        super().__init__(self.argument, self.value, self.error)
+
+    def __str__(self) -> str:
+        return (
+            f"Invalid value for {describe_argument(self.argument)}: "
+            f"{self.value!r} ({self.error})"
+        )
+
+
+class StoreNameConflictError(ArgumentConflictError):
+    def __str__(self) -> str:
+        return (
+            f"Store name {self.name!r} of {describe_argument(self.argument)} "
+            f"is already used by {describe_argument(self.existing)}"
+        )
+
+
+def describe_argument(argument: Option | Operand | Command | LazySubcommand) -> str:
+    from cliargparser.models.arguments import Operand, Option
+
+    if isinstance(argument, Option):
+        spellings = [
+            *(
+                f"{OptionPrefix.LONG}{name}"
+                for name in (*argument.long_names, *argument.aliases)
+            ),
+            *(f"{OptionPrefix.SHORT}{name}" for name in argument.short_names),
+        ]
+        return f"option {'/'.join(spellings)}"
+    elif isinstance(argument, Operand):
+        return f"operand {argument.name!r}"
+
+    return f"subcommand {argument.name!r}"
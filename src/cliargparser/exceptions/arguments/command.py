@@ -1,11 +1,40 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
 from ..parser import ParserError
+from .argument import ArgumentConflictError
+
+
+if TYPE_CHECKING:
+    from cliargparser.models.arguments import Command, LazySubcommand
 
 
 class UnknownCommandError(ParserError):
-    def __init__(self, name: str) -> None:
+    def __init__(self, name: str | bytes) -> None:
         self.name = name
 
         super().__init__(self.name)
 
     def __str__(self) -> str:
-        return f"Unknown command: {self.name}"
+        return f"Unknown command: {os.fsdecode(self.name)}"
+
+
+class SubcommandConflictError(ArgumentConflictError):
+    existing: Command | LazySubcommand
+    argument: Command | LazySubcommand
+
+    def __init__(
+        self,
+        name: str,
+        existing: Command | LazySubcommand,
+        subcommand: Command | LazySubcommand,
+    ) -> None:
+        super().__init__(name, existing, subcommand)
+
+    def __str__(self) -> str:
+        return (
+            f"Name {self.name!r} of subcommand {self.argument.name!r} "
+            f"is already used by subcommand {self.existing.name!r}"
+        )
@@ -1,3 +1,4 @@
+import os
 from typing import TYPE_CHECKING
 
 from cliargparser.enums import NArgs
@@ -40,10 +41,10 @@ class MissingOperandArgumentsError(MissingArgumentsError):
 
 
 class ExtraOperandError(ParserError):
-    def __init__(self, token: str) -> None:
+    def __init__(self, token: str | bytes) -> None:
         self.token = token
 
         super().__init__(self.token)
 
     def __str__(self) -> str:
-        return f"Unexpected extra operand: {self.token}"
\ No newline at end of file
+        return f"Unexpected extra operand: {os.fsdecode(self.token)}"
\ No newline at end of file
@@ -1,7 +1,16 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
 from cliargparser.enums import NArgs, OptionPrefix
 
 from ..parser import ParserError
-from .argument import MissingArgumentsError
+from .argument import ArgumentConflictError, MissingArgumentsError, describe_argument
+
+
+if TYPE_CHECKING:
+    from cliargparser.models.arguments import Option
 
 
 class UnknownOptionError(ParserError):
@@ -9,27 +18,27 @@ class UnknownOptionError(ParserError):
 
 
 class UnknownLongOptionError(UnknownOptionError):
-    def __init__(self, name: str) -> None:
+    def __init__(self, name: str | bytes) -> None:
         self.name = name
 
         super().__init__(self.name)
 
     def __str__(self) -> str:
-        return f"Unknown long option: {OptionPrefix.LONG}{self.name}"
+        return f"Unknown long option: {OptionPrefix.LONG}{os.fsdecode(self.name)}"
 
 
 class UnknownShortOptionError(UnknownOptionError):
-    def __init__(self, name: str) -> None:
+    def __init__(self, name: str | bytes) -> None:
         self.name = name
 
         super().__init__(self.name)
 
     def __str__(self) -> str:
-        return f"Unknown short option: {OptionPrefix.SHORT}{self.name}"
+        return f"Unknown short option: {OptionPrefix.SHORT}{os.fsdecode(self.name)}"
 
 
 class UnknownShortOptionInGroupError(UnknownOptionError):
-    def __init__(self, name: str, group: str) -> None:
+    def __init__(self, name: str | bytes, group: str | bytes) -> None:
         self.name = name
         self.group = group
 
@@ -37,13 +46,13 @@ class UnknownShortOptionInGroupError(UnknownOptionError):
 
     def __str__(self) -> str:
         return (
-            f"Unknown short option {self.name!r} "
-            f"in group {self.group!r}"
+            f"Unknown short option {os.fsdecode(self.name)!r} "
+            f"in group {os.fsdecode(self.group)!r}"
         )
 
 
 class OptionTakesNoArgumentError(ParserError):
-    def __init__(self, token: str, value: str) -> None:
+    def __init__(self, token: str | bytes, value: str | bytes) -> None:
         self.token = token
         self.value = value
 
@@ -51,13 +60,29 @@ class OptionTakesNoArgumentError(ParserError):
 
     def __str__(self) -> str:
         return (
-            f"Option {self.token!r} takes no arguments, "
-            f"got an explicit argument: {self.value}"
+            f"Option {os.fsdecode(self.token)!r} takes no arguments, "
+            f"got an explicit argument: {os.fsdecode(self.value)}"
+        )
+
+
+class InvalidEnvironmentFlagError(ParserError):
+    def __init__(self, env_var: str, value: str) -> None:
+        self.env_var = env_var
+        self.value = value
+
+        super().__init__(self.env_var, self.value)
+
+    def __str__(self) -> str:
+        return (
+            f"Environment variable {self.env_var} must be a boolean "
+            f"(1/0, true/false, yes/no, on/off), got: {self.value!r}"
         )
 
 
 class MissingOptionArgumentsError(MissingArgumentsError):
-    def __init__(self, token: str, nargs: int | NArgs, received_nargs: int) -> None:
+    def __init__(
+        self, token: str | bytes, nargs: int | NArgs, received_nargs: int
+    ) -> None:
         self.token = token
         self.nargs = nargs
         self.received_nargs = received_nargs
@@ -67,7 +92,7 @@ class MissingOptionArgumentsError(MissingArgumentsError):
     def __str__(self) -> str:
         s = "s" if isinstance(self.nargs, int) and self.nargs != 1 else ""
         return (
-            f"Option {self.token!r} expected {self.nargs} argument{s}, "
+            f"Option {os.fsdecode(self.token)!r} expected {self.nargs} argument{s}, "
             f"got {self.received_nargs}"
         )
 
@@ -84,4 +109,17 @@ class OptionInGroupTakesArgumentsError(ParserError):
             f"Argument-taking option {self.name!r} "
             f"is not allowed in short option group {self.group!r}"
         )
-        
\ No newline at end of file
+
+
+class OptionConflictError(ArgumentConflictError):
+    existing: Option
+    argument: Option
+
+    def __init__(self, name: str, existing: Option, option: Option) -> None:
+        super().__init__(name, existing, option)
+
+    def __str__(self) -> str:
+        return (
+            f"Name {self.name!r} of {describe_argument(self.argument)} "
+            f"is already used by {describe_argument(self.existing)}"
+        )
@@ -1,6 +1,31 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from cliargparser.enums import ParseLimit
+
+
 class ParserError(Exception):
     pass
 
 
 class ParseModeError(ParserError):
-    pass
\ No newline at end of file
+    pass
+
+
+class ParseLimitError(ParserError):
+    def __init__(
+        self, limit: ParseLimit, maximum: int, token: str | bytes | None = None
+    ) -> None:
+        self.limit = limit
+        self.maximum = maximum
+
+        # The token being read when the limit was crossed, if any.
+        self.token = token
+
+        super().__init__(self.limit, self.maximum, self.token)
+
+    def __str__(self) -> str:
+        return f"Parse limit exceeded: {self.limit} is over {self.maximum}"
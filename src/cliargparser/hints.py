@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from typing import TYPE_CHECKING, Any, Protocol
 
 
@@ -17,3 +17,11 @@ class Action[
         values: Sequence[Any],
         current_value: Any = None
     ) -> Any: ...
+
+
+# Converts every value of one occurrence of an option or operand at once.
+type BatchConverter = Callable[[list[str]], Sequence[Any]]
+
+
+# Computes a default when its option is missing from the command line.
+type DefaultFactory = Callable[[], Any]
@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, assert_never
+
+from .argument_parser import ArgumentParser
+from .defaults import apply_lazy_defaults
+from .enums import NArgs, ParseMode
+from .exceptions import (
+    ExtraOperandError,
+    MissingOperandArgumentsError,
+    MissingOptionArgumentsError,
+)
+from .models import Namespace, ParseContext, TokenStream
+from .models.arguments import Command, Operand, Option
+from .syntax import TokenSyntax, syntax_for
+
+
+# Compared by identity: two checkpoints taken with nothing fed in between hold
+# equal values, but are still released and rolled back separately.
+@dataclass(frozen=True, slots=True, eq=False)
+class Checkpoint:
+    command: Command
+    namespace: Namespace
+    end_of_options: bool
+    operand_index: int
+    command_path_length: int
+    journal_length: int
+    pending: tuple[Option | Operand, str | bytes, tuple[Any, ...]] | None
+
+
+class IncrementalParser:
+    __slots__ = ("_checkpoints", "_context", "_namespace", "_pending")
+
+    def __init__(self, command: Command) -> None:
+        self._namespace = Namespace()
+        self._context = ParseContext(
+            command=command,
+            namespace=self._namespace,
+            token_stream=TokenStream(()),
+            command_path=[command],
+            namespace_path=[self._namespace],
+        )
+
+        # (argument, token, values) of the option or operand still collecting values.
+        self._pending: tuple[Option | Operand, str | bytes, list[Any]] | None = None
+
+        self._checkpoints: list[Checkpoint] = []
+
+    @property
+    def namespace(self) -> Namespace:
+        return self._namespace
+
+    @property
+    def command_path(self) -> tuple[Command, ...]:
+        return tuple(self._context.command_path)
+
+    @property
+    def pending_argument(self) -> Option | Operand | None:
+        return None if self._pending is None else self._pending[0]
+
+    @property
+    def pending_option(self) -> Option | None:
+        argument = self.pending_argument
+        return argument if isinstance(argument, Option) else None
+
+    @property
+    def operand_index(self) -> int:
+        return self._context.operand_index
+
+    @property
+    def end_of_options(self) -> bool:
+        return self._context.end_of_options
+
+    def feed(self, token: str | bytes) -> None:
+        context = self._context
+        syntax = syntax_for(token)
+
+        if self._pending is not None:
+            if context.end_of_options or not token.startswith(syntax.short_prefix):
+                self._feed_pending_argument(token)
+                return
+
+            self._resolve_pending()
+
+        if not context.end_of_options and token == syntax.end_of_options:
+            context.end_of_options = True
+            return
+
+        if not context.end_of_options:
+            if token.startswith(syntax.long_prefix):
+                self._feed_long_option(token, syntax)
+                return
+            elif token.startswith(syntax.short_prefix):
+                index = ArgumentParser._parse_short_option_cluster(
+                    token, context, syntax
+                )
+                if index:
+                    option = context.command.get_short_option(token[index])
+                    assert option is not None
+
+                    self._feed_option(
+                        token,
+                        option,
+                        ArgumentParser._cluster_explicit_argument(token, index, syntax),
+                    )
+                return
+
+        if context.command.parse_mode is ParseMode.COMMAND:
+            ArgumentParser._parse_command(token, context)
+        elif context.command.parse_mode is ParseMode.OPERAND:
+            self._feed_operand(token)
+        else:
+            assert_never(context.command.parse_mode)
+
+    def finish(self) -> Namespace:
+        if self._pending is not None:
+            self._resolve_pending()
+
+        # Journaled like any other write, so rolling back to a checkpoint
+        # taken before `finish` removes them again.
+        if Command._lazy_defaults_registered:
+            apply_lazy_defaults(
+                self._context.command_path[0],
+                self._namespace,
+                journal=self._context.journal,
+            )
+
+        return self._namespace
+
+    def checkpoint(self) -> Checkpoint:
+        context = self._context
+
+        if context.journal is None:
+            context.journal = []
+
+        pending = None
+        if self._pending is not None:
+            argument, token, values = self._pending
+            pending = (argument, token, tuple(values))
+
+        checkpoint = Checkpoint(
+            command=context.command,
+            namespace=context.namespace,
+            end_of_options=context.end_of_options,
+            operand_index=context.operand_index,
+            command_path_length=len(context.command_path),
+            journal_length=len(context.journal),
+            pending=pending,
+        )
+        self._checkpoints.append(checkpoint)
+
+        return checkpoint
+
+    def rollback(self, checkpoint: Checkpoint) -> None:
+        index = self._checkpoint_index(checkpoint)
+
+        # Later checkpoints describe states that no longer exist.
+        del self._checkpoints[index + 1:]
+
+        context = self._context
+        journal = context.journal
+        assert journal is not None
+
+        while len(journal) > checkpoint.journal_length:
+            namespace, key, had_key, previous_value = journal.pop()
+            if had_key:
+                namespace[key] = previous_value
+            else:
+                del namespace[key]
+
+        context.command = checkpoint.command
+        context.namespace = checkpoint.namespace
+        context.end_of_options = checkpoint.end_of_options
+        context.operand_index = checkpoint.operand_index
+        del context.command_path[checkpoint.command_path_length:]
+        del context.namespace_path[checkpoint.command_path_length:]
+
+        if checkpoint.pending is None:
+            self._pending = None
+        else:
+            argument, token, values = checkpoint.pending
+            self._pending = (argument, token, list(values))
+
+    def release(self, checkpoint: Checkpoint) -> None:
+        del self._checkpoints[self._checkpoint_index(checkpoint)]
+
+        if not self._checkpoints:
+            self._context.journal = None
+
+    def _checkpoint_index(self, checkpoint: Checkpoint) -> int:
+        for index, taken in enumerate(self._checkpoints):
+            if taken is checkpoint:
+                return index
+
+        raise ValueError("Unknown or discarded checkpoint")
+
+    def _feed_long_option(self, token: str | bytes, syntax: TokenSyntax[Any]) -> None:
+        resolved = ArgumentParser._resolve_long_option(token, self._context, syntax)
+        assert resolved is not None  # Errors are raised here, never recorded.
+
+        option, explicit_argument = resolved
+        self._feed_option(token, option, explicit_argument)
+
+    def _feed_option(
+        self,
+        token: str | bytes,
+        option: Option,
+        explicit_argument: str | bytes | None,
+    ) -> None:
+        if option.takes_arguments and explicit_argument is None:
+            self._pending = (option, token, [])
+            return
+
+        values = ArgumentParser._consume_and_validate_option_arguments(
+            option=option,
+            context=self._context,
+            explicit_argument=explicit_argument,
+            token=token,
+        )
+        assert values is not None
+
+        ArgumentParser._apply_option_action(option, values, self._context)
+
+    def _feed_operand(self, token: str | bytes) -> None:
+        context = self._context
+
+        try:
+            operand = context.command.get_operand_by_index(context.operand_index)
+        except IndexError:
+            raise ExtraOperandError(token) from None
+
+        self._pending = (
+            operand, token, [ArgumentParser._decode(token, operand.decoder)]
+        )
+        if not operand.takes_arguments:
+            self._resolve_pending()
+
+    def _feed_pending_argument(self, token: str | bytes) -> None:
+        assert self._pending is not None
+        argument, _, values = self._pending
+
+        value = ArgumentParser._decode(token, argument.decoder)
+        if argument.type_converter is not str:
+            value = argument.type_converter(value)
+        values.append(value)
+
+        # Like `ArgumentParser._parse_operand`, an operand's own token is not
+        # counted against the `nargs` tokens consumed after it.
+        consumed = len(values) - isinstance(argument, Operand)
+
+        nargs = argument.nargs
+        if isinstance(nargs, int):
+            if consumed >= nargs:
+                self._resolve_pending()
+        elif nargs is NArgs.OPTIONAL:
+            self._resolve_pending()
+
+    def _resolve_pending(self) -> None:
+        assert self._pending is not None
+        argument, token, values = self._pending
+        self._pending = None
+
+        context = self._context
+
+        if not ArgumentParser._is_nargs_satisfied(argument.nargs, len(values)):
+            if isinstance(argument, Option):
+                raise MissingOptionArgumentsError(token, argument.nargs, len(values))
+
+            raise MissingOperandArgumentsError(
+                argument.name, argument.nargs, len(values)
+            )
+
+        converted: Sequence[Any] = (
+            values
+            if argument.batch_converter is None
+            else argument.batch_converter(values)
+        )
+
+        if isinstance(argument, Option):
+            ArgumentParser._apply_option_action(argument, converted, context)
+        else:
+            ArgumentParser._apply_operand_action(argument, converted, context)
+            context.operand_index += 1
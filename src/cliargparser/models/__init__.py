@@ -1,7 +1,52 @@
-from .mutex_option_group import MutexOptionGroup
-from .namespace import Namespace
-from .parse_context import ParseContext
-from .token_stream import TokenStream
+from importlib import import_module
 
 
-__all__ = ["MutexOptionGroup", "Namespace", "ParseContext", "TokenStream"]
\ No newline at end of file
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .mutex_option_group import MutexOptionGroup
+    from .namespace import Namespace
+    from .parse_context import ParseContext
+    from .parse_limits import ParseLimits
+    from .parse_result import ParseIssue, ParseResult
+    from .route_result import RouteResult
+    from .token_stream import TokenStream
+
+
+__all__ = [
+    "MutexOptionGroup",
+    "Namespace",
+    "ParseContext",
+    "ParseIssue",
+    "ParseLimits",
+    "ParseResult",
+    "RouteResult",
+    "TokenStream",
+]
+
+# Resolved straight to the defining module, so importing `Command` does not
+# build every model.
+_LAZY_ATTRIBUTES = {
+    "MutexOptionGroup": ".mutex_option_group",
+    "Namespace": ".namespace",
+    "ParseContext": ".parse_context",
+    "ParseIssue": ".parse_result",
+    "ParseLimits": ".parse_limits",
+    "ParseResult": ".parse_result",
+    "RouteResult": ".route_result",
+    "TokenStream": ".token_stream",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -1,6 +1,34 @@
-from .command import Command
-from .operand import Operand
-from .option import Option
+from importlib import import_module
 
 
-__all__ = ["Command", "Operand", "Option"]
\ No newline at end of file
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .command import Command
+    from .lazy_subcommand import LazySubcommand
+    from .operand import Operand
+    from .option import Option
+
+
+__all__ = ["Command", "LazySubcommand", "Operand", "Option"]
+
+_LAZY_ATTRIBUTES = {
+    "Command": ".command",
+    "LazySubcommand": ".lazy_subcommand",
+    "Operand": ".operand",
+    "Option": ".option",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -5,16 +5,16 @@ import os
 import sys
 from typing import TYPE_CHECKING, Any
 
-from cliargparser.enums import NArgs, ParseMode
-from cliargparser.exceptions import (
-    OperandAfterNonDeterministicOperandError,
-    ParseModeError,
-)
-from cliargparser.hints import Action
+from cliargparser.enums import NArgs, OptionPrefix, ParseMode
+from cliargparser.hints import Action, BatchConverter, DefaultFactory
 
 
 if TYPE_CHECKING:
     from ..mutex_option_group import MutexOptionGroup
+    from ..parse_limits import ParseLimits
+    from ..parse_result import ParseResult
+    from ..route_result import RouteResult
+    from .lazy_subcommand import LazySubcommand
 
 from ..namespace import Namespace
 from .operand import Operand
@@ -23,10 +23,20 @@ from .option import Option
 
 class Command:
     __slots__ = (
+        "_inheritable_own_options",
+        "_inherited_options",
+        "_lazy_default_options",
+        "_long_options_by_token",
+        "_mutation_count",
         "_mutex_option_groups",
+        "_namespace_keys",
         "_operands",
         "_options",
+        "_options_by_name",
+        "_parents",
+        "_short_options_by_char",
         "_subcommands",
+        "_subcommands_by_name",
         "aliases",
         "name",
         "non_deterministic_operand",
@@ -34,6 +44,10 @@ class Command:
         "subcommand_required"
     )
 
+    # Set once any option with an environment variable or a default factory
+    # is registered, so parsers skip resolving them until then.
+    _lazy_defaults_registered = False
+
     def __init__(
         self,
         name: str | None = None,
@@ -47,12 +61,50 @@ class Command:
         self.parse_mode = parse_mode or ParseMode.COMMAND
         self.subcommand_required = subcommand_required
 
+        # Bumped by every registration on this command or any command below
+        # it, so that anything derived from the tree rooted here (such as
+        # cached parse results) can tell it is stale.
+        self._mutation_count = 0
+        self._parents: list[Command] = []
+
         self._options: list[Option] = []
+
+        # Own options with `inherited` set, so that adding a subcommand does
+        # not scan every option.
+        self._inheritable_own_options: list[Option] = []
+
+        # Own options with an environment variable or a default factory.
+        self._lazy_default_options: list[Option] = []
         self._mutex_option_groups: list[MutexOptionGroup] = []
 
         self._subcommands: list[Command] = []
         self._operands: list[Operand] = []
 
+        # Keyed by both `str` and `os.fsencode`-ed names so `bytes` tokens
+        # resolve without being decoded. First registration wins.
+        self._options_by_name: dict[str | bytes, Option] = {}
+        self._subcommands_by_name: dict[str | bytes, Command | LazySubcommand] = {}
+
+        # Keyed by the full `--name` spelling so a long option token can be
+        # looked up as-is, without stripping its prefix first.
+        self._long_options_by_token: dict[str | bytes, Option] = {}
+
+        # Short option cluster dispatch: keyed by the character for `str`
+        # tokens and by the byte value for `bytes` tokens.
+        self._short_options_by_char: dict[str | int, Option] = {}
+
+        # Inherited options of ancestors and the command defining each, keyed
+        # by `id` of the option. They are merged into the indexes above so
+        # descendants resolve them without walking up the tree.
+        self._inherited_options: dict[int, tuple[Option, Command]] = {}
+
+        # What writes each key of this command's namespace: store names of
+        # own options, operand names and subcommand names. Options may share
+        # a store name (`--color`/`--no-color`) unless their defaults differ.
+        self._namespace_keys: dict[
+            str, Option | Operand | Command | LazySubcommand
+        ] = {}
+
         self.non_deterministic_operand: Operand | None = None
 
     @property
@@ -66,6 +118,10 @@ class Command:
     def options(self) -> tuple[Option, ...]:
         return tuple(self._options)
 
+    @property
+    def inherited_options(self) -> tuple[Option, ...]:
+        return tuple(option for option, _ in self._inherited_options.values())
+
     @property
     def mutex_option_groups(self) -> tuple[MutexOptionGroup, ...]:
         return tuple(self._mutex_option_groups)
@@ -78,8 +134,33 @@ class Command:
     def operands(self) -> tuple[Operand, ...]:
         return tuple(self._operands)
 
+    @property
+    def has_subcommands(self) -> bool:
+        # Counts lazy subcommands without loading them.
+        return bool(self._subcommands_by_name)
+
     def add_option(self, option: Option) -> None:
+        # Checked before anything is indexed, so a conflict leaves the
+        # command unchanged.
+        for name in option.all_names:
+            indexed = self._options_by_name.get(name)
+            if indexed is not None and id(indexed) not in self._inherited_options:
+                from cliargparser.exceptions import OptionConflictError
+
+                raise OptionConflictError(name, indexed, option)
+
+        self._claim_namespace_key(option.store_name, option)
+
         self._options.append(option)
+        self._index_option(option)
+
+        if option.env_var is not None or option.default_factory is not None:
+            self._lazy_default_options.append(option)
+            Command._lazy_defaults_registered = True
+
+        if option.inherited:
+            self._inheritable_own_options.append(option)
+            self._pass_down_options([(option, self)])
 
     def option(
         self,
@@ -92,9 +173,14 @@ class Command:
         nargs: int | NArgs | None = None,
         present: Any | None = None,
         default: Any | None = None,
+        default_factory: DefaultFactory | None = None,
+        env_var: str | None = None,
         type_converter: Callable[[str], Any] | None = None,
+        batch_converter: BatchConverter | None = None,
         choices: Sequence[Any] | None = None,
         required: bool = False,
+        decoder: Callable[[bytes], Any] | None = None,
+        inherited: bool = False,
     ) -> Option:
 
         option = Option.create(
@@ -106,25 +192,96 @@ class Command:
             nargs=nargs,
             present=present,
             default=default,
+            default_factory=default_factory,
+            env_var=env_var,
             type_converter=type_converter,
+            batch_converter=batch_converter,
             choices=choices,
-            required=required
+            required=required,
+            decoder=decoder,
+            inherited=inherited
         )
-        self._options.append(option)
+        self.add_option(option)
 
         return option
 
-    def get_option(self, name: str) -> Option | None:
-        return next(
-            (option for option in self.options if name in option.all_names),
-            None
-        )
+    def _index_option(self, option: Option, *, inherited: bool = False) -> None:
+        entries: list[tuple[dict[Any, Option], str | bytes | int]] = []
+        for name in option.all_names:
+            long_token = f"{OptionPrefix.LONG}{name}"
+            entries += (
+                (self._options_by_name, name),
+                (self._options_by_name, os.fsencode(name)),
+                (self._long_options_by_token, long_token),
+                (self._long_options_by_token, os.fsencode(long_token)),
+            )
+
+        # Any single-character name works in a cluster, as `-q` for an alias
+        # or a long name `q`, not only the short names.
+        for name in option.all_names:
+            if len(name) == 1:
+                entries.append((self._short_options_by_char, name))
+
+                encoded_name = os.fsencode(name)
+                if len(encoded_name) == 1:
+                    entries.append((self._short_options_by_char, encoded_name[0]))
+
+        # A command's own options shadow inherited ones; otherwise the first
+        # registration wins.
+        for index, key in entries:
+            indexed = index.get(key)
+            if indexed is None or (
+                not inherited and id(indexed) in self._inherited_options
+            ):
+                index[key] = option
+
+        self._mark_mutated()
+
+    def _inheritable_options(self) -> list[tuple[Option, Command]]:
+        return [
+            *((option, self) for option in self._inheritable_own_options),
+            *self._inherited_options.values(),
+        ]
+
+    def _pass_down_options(self, options: list[tuple[Option, Command]]) -> None:
+        for subcommand in self._subcommands:
+            subcommand._inherit_options(options)
+
+    def _inherit_options(self, options: list[tuple[Option, Command]]) -> None:
+        inherited: list[tuple[Option, Command]] = []
+        for option, owner in options:
+            if owner is self or id(option) in self._inherited_options:
+                continue
+
+            self._inherited_options[id(option)] = (option, owner)
+            self._index_option(option, inherited=True)
+            inherited.append((option, owner))
+
+        if inherited:
+            self._pass_down_options(inherited)
+
+    def get_option(self, name: str | bytes) -> Option | None:
+        return self._options_by_name.get(name)
+
+    def get_option_owner(self, option: Option) -> Command:
+        entry = self._inherited_options.get(id(option))
+        return self if entry is None else entry[1]
+
+    def get_long_option(self, token: str | bytes) -> Option | None:
+        return self._long_options_by_token.get(token)
+
+    def get_short_option(self, char: str | int) -> Option | None:
+        return self._short_options_by_char.get(char)
 
     def add_mutex_option_group(self, mutex_option_group: MutexOptionGroup) -> None:
         self._mutex_option_groups.append(mutex_option_group)
+        self._mark_mutated()
 
     def add_subcommand(self, subcommand: Command) -> None:
+        self._index_subcommand(subcommand)
         self._subcommands.append(subcommand)
+        subcommand._parents.append(self)
+        subcommand._inherit_options(self._inheritable_options())
 
     def subcommand(
         self,
@@ -134,6 +291,8 @@ class Command:
         subcommand_required: bool = False
     ) -> Command:
         if self.parse_mode is not ParseMode.COMMAND:
+            from cliargparser.exceptions import ParseModeError
+
             raise ParseModeError(
                 f"Subcommands are not allowed in {self.parse_mode.name} parse mode"
             )
@@ -143,21 +302,111 @@ class Command:
             parse_mode=parse_mode,
             subcommand_required=subcommand_required
         )
-        self._subcommands.append(subcommand)
+        self.add_subcommand(subcommand)
 
         return subcommand
 
-    def get_subcommand(self, name: str) -> Command | None:
-        return next(
-            (
-                subcommand for subcommand in self.subcommands
-                if name in subcommand.all_names
-            ),
-            None
+    def lazy_subcommand(
+        self,
+        name: str,
+        loader: Callable[[], Command],
+        *,
+        aliases: str | Sequence[str] | None = None,
+    ) -> LazySubcommand:
+        if self.parse_mode is not ParseMode.COMMAND:
+            from cliargparser.exceptions import ParseModeError
+
+            raise ParseModeError(
+                f"Subcommands are not allowed in {self.parse_mode.name} parse mode"
+            )
+
+        from .lazy_subcommand import LazySubcommand
+
+        lazy_subcommand = LazySubcommand(
+            name=name,
+            aliases=(aliases,) if isinstance(aliases, str) else tuple(aliases or ()),
+            loader=loader,
         )
+        self._index_subcommand(lazy_subcommand)
+
+        return lazy_subcommand
+
+    def _index_subcommand(self, subcommand: Command | LazySubcommand) -> None:
+        for name in subcommand.all_names:
+            indexed = self._subcommands_by_name.get(name)
+            if indexed is not None:
+                from cliargparser.exceptions import SubcommandConflictError
+
+                raise SubcommandConflictError(name, indexed, subcommand)
+
+        self._claim_namespace_key(subcommand.name, subcommand)
+
+        for name in subcommand.all_names:
+            self._subcommands_by_name.setdefault(name, subcommand)
+            self._subcommands_by_name.setdefault(os.fsencode(name), subcommand)
+
+        self._mark_mutated()
+
+    def _claim_namespace_key(
+        self, key: str, argument: Option | Operand | Command | LazySubcommand
+    ) -> None:
+        claimed = self._namespace_keys.get(key)
+        if claimed is None:
+            self._namespace_keys[key] = argument
+            return
+
+        if isinstance(claimed, Option) and isinstance(argument, Option):
+            if argument.default is None or claimed.default == argument.default:
+                return
+
+            # Kept as the key's claimant from now on, so every later option
+            # is compared with the one default the key has.
+            if claimed.default is None:
+                self._namespace_keys[key] = argument
+                return
+
+        from cliargparser.exceptions import StoreNameConflictError
+
+        raise StoreNameConflictError(key, claimed, argument)
+
+    def get_subcommand(self, name: str | bytes) -> Command | None:
+        subcommand = self._subcommands_by_name.get(name)
+        # Anything else indexed is a `LazySubcommand`, which is only imported
+        # once one is registered.
+        if subcommand is not None and not isinstance(subcommand, Command):
+            subcommand = self._load_subcommand(subcommand)
+
+        return subcommand
+
+    def _load_subcommand(self, lazy_subcommand: LazySubcommand) -> Command:
+        subcommand = lazy_subcommand.loader()
+        self._subcommands.append(subcommand)
+        subcommand._parents.append(self)
+        subcommand._inherit_options(self._inheritable_options())
+
+        for name, indexed in self._subcommands_by_name.items():
+            if indexed is lazy_subcommand:
+                self._subcommands_by_name[name] = subcommand
+
+        self._mark_mutated()
+
+        return subcommand
+
+    def _mark_mutated(self) -> None:
+        # Walks up every path to the roots; a command may have several parents.
+        pending = [self]
+        seen: set[int] = set()
+        while pending:
+            command = pending.pop()
+            if id(command) not in seen:
+                seen.add(id(command))
+                command._mutation_count += 1
+                pending.extend(command._parents)
 
     def add_operand(self, operand: Operand) -> None:
+        self._claim_namespace_key(operand.name, operand)
         self._operands.append(operand)
+        self._mark_mutated()
 
     def operand(
         self,
@@ -167,14 +416,22 @@ class Command:
         nargs: int | NArgs | None = None,
         default: Any | None = None,
         type_converter: Callable[[str], Any] | None = None,
-        choices: Sequence[Any] | None = None
+        batch_converter: BatchConverter | None = None,
+        choices: Sequence[Any] | None = None,
+        decoder: Callable[[bytes], Any] | None = None
     ) -> Operand:
         if self.parse_mode is not ParseMode.OPERAND:
+            from cliargparser.exceptions import ParseModeError
+
             raise ParseModeError(
                 f"Operands are not allowed in {self.parse_mode.name} parse mode"
             )
 
         if self.non_deterministic_operand:
+            from cliargparser.exceptions import (
+                OperandAfterNonDeterministicOperandError,
+            )
+
             raise OperandAfterNonDeterministicOperandError(
                 self.non_deterministic_operand
             )
@@ -185,9 +442,11 @@ class Command:
             nargs=nargs,
             default=default,
             type_converter=type_converter,
-            choices=choices
+            batch_converter=batch_converter,
+            choices=choices,
+            decoder=decoder
         )
-        self._operands.append(operand)
+        self.add_operand(operand)
 
         if isinstance(operand.nargs, NArgs):
             self.non_deterministic_operand = operand
@@ -203,12 +462,40 @@ class Command:
     def get_operand_by_index(self, index: int) -> Operand:
         return self._operands[index]
 
-    def parse_arguments(self, arguments: str | Iterable[str]) -> Namespace:
+    def parse_arguments(
+        self,
+        arguments: str | bytes | Iterable[str | bytes],
+        *,
+        limits: ParseLimits | None = None,
+    ) -> Namespace:
         from cliargparser import (
             ArgumentParser,  # Until only Python `3.15+` is supported.
         )
 
-        return ArgumentParser.parse_arguments(arguments, self)
+        return ArgumentParser.parse_arguments(arguments, self, limits=limits)
+
+    def try_parse_arguments(
+        self,
+        arguments: str | bytes | Iterable[str | bytes],
+        *,
+        collect_all: bool = False,
+        limits: ParseLimits | None = None,
+    ) -> ParseResult:
+        from cliargparser import ArgumentParser
+
+        return ArgumentParser.try_parse_arguments(
+            arguments, self, collect_all=collect_all, limits=limits
+        )
+
+    def route_arguments(
+        self,
+        arguments: str | bytes | Iterable[str | bytes],
+        *,
+        limits: ParseLimits | None = None,
+    ) -> RouteResult:
+        from cliargparser import ArgumentParser
+
+        return ArgumentParser.route_arguments(arguments, self, limits=limits)
 
     def __repr__(self) -> str:
         return (
@@ -220,3 +507,4 @@ class Command:
             f"non_deterministic_operand={self.non_deterministic_operand}"
             ")"
         )
+
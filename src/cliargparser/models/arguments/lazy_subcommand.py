@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from .command import Command
+
+
+@dataclass(frozen=True, slots=True)
+class LazySubcommand:
+    name: str
+    aliases: tuple[str, ...]
+
+    loader: Callable[[], Command]
+
+    @property
+    def all_names(self) -> tuple[str, ...]:
+        return (self.name, *self.aliases)
@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from collections.abc import Callable, Sequence
 from dataclasses import KW_ONLY, dataclass
+import os
 from typing import Any
 
 from cliargparser.actions import store_value_action
 from cliargparser.enums import NArgs
-from cliargparser.hints import Action
+from cliargparser.hints import Action, BatchConverter
 
 
 @dataclass(frozen=True, slots=True)
@@ -21,8 +22,17 @@ class Operand:
     default: Any
 
     type_converter: Callable[[str], Any]
+
+    # Replaces `type_converter` when set; called with the decoded values.
+    batch_converter: BatchConverter | None
+
     choices: tuple[Any, ...]
 
+    # Called with each `bytes` value as it is consumed; `str` values are
+    # never encoded. `os.fsdecode` by default, so both give the same
+    # namespace. `decoder=bytes` leaves the decoding to the application.
+    decoder: Callable[[bytes], Any]
+
     @property
     def takes_arguments(self) -> bool:
         if isinstance(self.nargs, int):
@@ -41,7 +51,9 @@ class Operand:
         nargs: int | NArgs | None = None,
         default: Any | None = None,
         type_converter: Callable[[str], Any] | None = None,
-        choices: Sequence[Any] | None = None
+        batch_converter: BatchConverter | None = None,
+        choices: Sequence[Any] | None = None,
+        decoder: Callable[[bytes], Any] | None = None
     ) -> Operand:
         if action is None:
             action = store_value_action
@@ -52,11 +64,16 @@ class Operand:
         if isinstance(nargs, int) and nargs == 0:
             raise ValueError("Operand's nargs cannot be zero")
 
+        if type_converter is not None and batch_converter is not None:
+            raise ValueError("type_converter and batch_converter are exclusive")
+
         return cls(
             name=name,
             action=action,
             nargs=nargs,
             default=default,
             type_converter=type_converter or str,
-            choices=tuple(choices or ())
+            batch_converter=batch_converter,
+            choices=tuple(choices or ()),
+            decoder=decoder or os.fsdecode
         )
\ No newline at end of file
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Sequence
 from dataclasses import KW_ONLY, dataclass
+import os
 from typing import Any
 
 from cliargparser.actions import (
@@ -13,7 +14,7 @@ from cliargparser.actions import (
     store_value_action,
 )
 from cliargparser.enums import NArgs
-from cliargparser.hints import Action
+from cliargparser.hints import Action, BatchConverter, DefaultFactory
 
 
 @dataclass(frozen=True, slots=True)
@@ -31,12 +32,32 @@ class Option:
     nargs: int | NArgs
 
     default: Any
+
+    # Resolved after parsing, only when the option was not given: the
+    # environment variable first, then the factory.
+    default_factory: DefaultFactory | None
+    env_var: str | None
+
     present: Any
 
     type_converter: Callable[[str], Any]
+
+    # Replaces `type_converter` when set; called with the decoded values.
+    batch_converter: BatchConverter | None
+
     choices: tuple[Any, ...]
+
+    # Called with each `bytes` value as it is consumed; `str` values are
+    # never encoded. `os.fsdecode` by default, so both give the same
+    # namespace. `decoder=bytes` leaves the decoding to the application.
+    decoder: Callable[[bytes], Any]
+
     required: bool
 
+    # Also accepted by every descendant command; values are stored in the
+    # namespace of the command the option is registered on.
+    inherited: bool
+
     @property
     def all_names(self) -> tuple[str, ...]:
         return self.short_names + self.long_names + self.aliases
@@ -60,9 +81,14 @@ class Option:
         nargs: int | NArgs | None = None,
         present: Any | None = None,
         default: Any | None = None,
+        default_factory: DefaultFactory | None = None,
+        env_var: str | None = None,
         type_converter: Callable[[str], Any] | None = None,
+        batch_converter: BatchConverter | None = None,
         choices: Sequence[Any] | None = None,
         required: bool = False,
+        decoder: Callable[[bytes], Any] | None = None,
+        inherited: bool = False,
     ) -> Option:
         long_names = (
             (long_names,) if isinstance(long_names, str) else tuple(long_names or ())
@@ -102,6 +128,12 @@ class Option:
             else:
                 nargs = 1
 
+        if type_converter is not None and batch_converter is not None:
+            raise ValueError("type_converter and batch_converter are exclusive")
+
+        if default is not None and default_factory is not None:
+            raise ValueError("default and default_factory are exclusive")
+
         if action is append_present_action and present is None:
             raise ValueError(
                 f"Missing 'present' value for action: "
@@ -117,7 +149,12 @@ class Option:
             nargs=nargs,
             present=present,
             default=default,
+            default_factory=default_factory,
+            env_var=env_var,
             type_converter=type_converter or str,
+            batch_converter=batch_converter,
             choices=tuple(choices or ()),
-            required=required
+            required=required,
+            decoder=decoder or os.fsdecode,
+            inherited=inherited
         )
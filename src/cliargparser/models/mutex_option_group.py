@@ -3,7 +3,8 @@ from dataclasses import dataclass, field
 from typing import Any
 
 from ..enums import NArgs
-from ..hints import Action
+from ..exceptions import OptionConflictError
+from ..hints import Action, BatchConverter, DefaultFactory
 from .arguments.option import Option
 
 
@@ -12,12 +13,23 @@ class MutexOptionGroup:
     required: bool = False
 
     _options: list[Option] = field(default_factory=list[Option], init=False)
+    _options_by_name: dict[str, Option] = field(
+        default_factory=dict[str, Option], init=False, repr=False, compare=False
+    )
 
     @property
     def options(self) -> tuple[Option, ...]:
         return tuple(self._options)
 
     def add_option(self, option: Option) -> None:
+        for name in option.all_names:
+            indexed = self._options_by_name.get(name)
+            if indexed is not None:
+                raise OptionConflictError(name, indexed, option)
+
+        for name in option.all_names:
+            self._options_by_name[name] = option
+
         self._options.append(option)
 
     def option(
@@ -30,8 +42,12 @@ class MutexOptionGroup:
         nargs: int | NArgs | None = None,
         present: Any | None = None,
         default: Any | None = None,
+        default_factory: DefaultFactory | None = None,
+        env_var: str | None = None,
         type_converter: Callable[[str], Any] | None = None,
-        choices: Sequence[Any] | None = None
+        batch_converter: BatchConverter | None = None,
+        choices: Sequence[Any] | None = None,
+        decoder: Callable[[bytes], Any] | None = None
     ) -> Option:
         option = Option.create(
             long_names=long_names,
@@ -42,9 +58,13 @@ class MutexOptionGroup:
             nargs=nargs,
             present=present,
             default=default,
+            default_factory=default_factory,
+            env_var=env_var,
             type_converter=type_converter,
-            choices=choices
+            batch_converter=batch_converter,
+            choices=choices,
+            decoder=decoder
         )
-        self._options.append(option)
+        self.add_option(option)
 
         return option
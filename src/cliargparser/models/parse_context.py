@@ -1,14 +1,63 @@
-from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 from .arguments.command import Command
 from .namespace import Namespace
 from .token_stream import TokenStream
 
 
-@dataclass(slots=True)
+if TYPE_CHECKING:
+    from .parse_limits import ParseLimits
+    from .parse_result import ParseIssue
+
+
+# (namespace, key, had_key, previous_value)
+type JournalEntry = tuple[Namespace, str, bool, Any]
+
+
+# A plain class rather than a dataclass, which would cost about half a
+# millisecond of every CLI's startup to build.
 class ParseContext:
-    command: Command
-    namespace: Namespace
-    token_stream: TokenStream
-    end_of_options: bool = False
-    operand_index: int = 0
\ No newline at end of file
+    __slots__ = (
+        "collect_all_issues",
+        "command",
+        "command_path",
+        "end_of_options",
+        "issues",
+        "journal",
+        "limits",
+        "namespace",
+        "namespace_path",
+        "operand_index",
+        "token_stream",
+    )
+
+    def __init__(
+        self,
+        command: Command,
+        namespace: Namespace,
+        token_stream: TokenStream,
+        end_of_options: bool = False,
+        operand_index: int = 0,
+        command_path: list[Command] | None = None,
+        namespace_path: list[Namespace] | None = None,
+        journal: list[JournalEntry] | None = None,
+        issues: list[ParseIssue] | None = None,
+        collect_all_issues: bool = False,
+        limits: ParseLimits | None = None,
+    ) -> None:
+        self.command = command
+        self.namespace = namespace
+        self.token_stream = token_stream
+        self.end_of_options = end_of_options
+        self.operand_index = operand_index
+        self.command_path = [] if command_path is None else command_path
+        # Namespace of each command in `command_path`.
+        self.namespace_path = [] if namespace_path is None else namespace_path
+        self.journal = journal
+
+        # When set, parse errors are recorded here instead of raised. Unless
+        # `collect_all_issues`, parsing stops at the first one.
+        self.issues = issues
+        self.collect_all_issues = collect_all_issues
+
+        self.limits = limits
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+
+# `None` leaves a limit unchecked.
+@dataclass(frozen=True, slots=True)
+class ParseLimits:
+    # Characters of a `str` input, bytes of a `bytes` input, or the sum of
+    # token lengths of a token iterable.
+    max_input_length: int | None = None
+
+    max_tokens: int | None = None
+    max_token_length: int | None = None
+
+    # Subcommands entered below the root command.
+    max_subcommand_depth: int | None = None
+
+    # Values taken by a single option or operand occurrence.
+    max_values: int | None = None
+
+    # Options in one short option cluster (`-xvf`).
+    max_cluster_length: int | None = None
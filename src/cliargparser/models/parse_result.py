@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from cliargparser.enums import NArgs, ParseIssueKind
+from cliargparser.exceptions import (
+    ExtraOperandError,
+    InvalidArgumentValueError,
+    MissingOperandArgumentsError,
+    MissingOptionArgumentsError,
+    OptionTakesNoArgumentError,
+    ParseLimitError,
+    ParserError,
+    UnknownCommandError,
+    UnknownLongOptionError,
+    UnknownShortOptionError,
+    UnknownShortOptionInGroupError,
+)
+
+from .namespace import Namespace
+
+
+_ISSUE_KINDS: dict[type[ParserError], ParseIssueKind] = {
+    UnknownLongOptionError: ParseIssueKind.UNKNOWN_LONG_OPTION,
+    UnknownShortOptionError: ParseIssueKind.UNKNOWN_SHORT_OPTION,
+    UnknownShortOptionInGroupError: ParseIssueKind.UNKNOWN_SHORT_OPTION,
+    OptionTakesNoArgumentError: ParseIssueKind.OPTION_TAKES_NO_ARGUMENT,
+    MissingOptionArgumentsError: ParseIssueKind.MISSING_OPTION_ARGUMENTS,
+    UnknownCommandError: ParseIssueKind.UNKNOWN_COMMAND,
+    ExtraOperandError: ParseIssueKind.EXTRA_OPERAND,
+    MissingOperandArgumentsError: ParseIssueKind.MISSING_OPERAND_ARGUMENTS,
+    InvalidArgumentValueError: ParseIssueKind.INVALID_VALUE,
+    ParseLimitError: ParseIssueKind.LIMIT_EXCEEDED,
+}
+
+
+# Not frozen: these are created per parse, and frozen dataclasses are several
+# times slower to construct.
+@dataclass(slots=True)
+class ParseIssue:
+    # Created but never raised, so it carries no traceback.
+    error: ParserError
+
+    # The argument that caused the issue and its index in the arguments.
+    token: str | bytes
+    position: int
+
+    @property
+    def kind(self) -> ParseIssueKind:
+        for error_type in type(self.error).__mro__:
+            kind = _ISSUE_KINDS.get(error_type)
+            if kind is not None:
+                return kind
+
+        raise TypeError(f"No issue kind for {type(self.error).__name__}")
+
+    @property
+    def expected_nargs(self) -> int | NArgs | None:
+        if isinstance(
+            self.error, (MissingOptionArgumentsError, MissingOperandArgumentsError)
+        ):
+            return self.error.nargs
+
+        return None
+
+    @property
+    def received_nargs(self) -> int | None:
+        if isinstance(
+            self.error, (MissingOptionArgumentsError, MissingOperandArgumentsError)
+        ):
+            return self.error.received_nargs
+
+        return None
+
+    @property
+    def message(self) -> str:
+        return str(self.error)
+
+
+@dataclass(slots=True)
+class ParseResult:
+    # `None` when there are issues.
+    namespace: Namespace | None
+
+    issues: tuple[ParseIssue, ...]
+
+    @property
+    def ok(self) -> bool:
+        return not self.issues
+
+    def unwrap(self) -> Namespace:
+        if self.namespace is None:
+            raise self.issues[0].error
+
+        return self.namespace
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .arguments.command import Command
+
+
+# Not frozen: one is created per routed invocation.
+@dataclass(slots=True)
+class RouteResult:
+    # The root command followed by each subcommand entered.
+    command_path: tuple[Command, ...]
+
+    # Tokens after the last subcommand name, as they were given.
+    remaining: list[str | bytes]
+
+    # Tokens consumed while routing, so `remaining` starts at this index of
+    # the split arguments.
+    position: int
+
+    # Whether `--` was consumed while routing, in which case nothing in
+    # `remaining` is an option.
+    end_of_options: bool
+
+    @property
+    def command(self) -> Command:
+        return self.command_path[-1]
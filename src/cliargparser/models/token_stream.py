@@ -1,17 +1,39 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+
+from cliargparser.enums import ParseLimit
+from cliargparser.exceptions import ParseLimitError
+
+
+if TYPE_CHECKING:
+    from .parse_limits import ParseLimits
 
 
 class TokenStream:
-    __slots__ = ("_buffer", "_iter")
+    __slots__ = ("_buffer", "_iter", "position")
+
+    def __init__(
+        self, iterable: Iterable[str | bytes], limits: ParseLimits | None = None
+    ) -> None:
+        self._iter = (
+            iter(iterable)
+            if limits is None
+            or (
+                limits.max_tokens is None
+                and limits.max_token_length is None
+                and limits.max_input_length is None
+            )
+            else _limit_tokens(iterable, limits)
+        )
 
-    def __init__(self, iterable: Iterable[str]) -> None:
-        self._iter = iter(iterable)
+        self._buffer: str | bytes | None = None
 
-        self._buffer: str | None = None
+        # Number of tokens consumed so far.
+        self.position = 0
 
-    def peek(self) -> str | None:
+    def peek(self) -> str | bytes | None:
         if self._buffer is None:
             try:
                 self._buffer = next(self._iter)
@@ -20,19 +42,54 @@ class TokenStream:
 
         return self._buffer
 
-    def consume(self) -> str | None:
+    def consume(self) -> str | bytes | None:
         token = self.peek()
-        self._buffer = None
+        if token is not None:
+            self._buffer = None
+            self.position += 1
+
         return token
 
+    def discard(self) -> None:
+        self._iter = iter(())
+        self._buffer = None
+
     def __iter__(self) -> TokenStream:
         return self
 
-    def __next__(self) -> str:
+    def __next__(self) -> str | bytes:
         token = self.peek()
         if token is None:
             raise StopIteration
 
         self._buffer = None
+        self.position += 1
 
         return token
+
+
+def _limit_tokens(
+    iterable: Iterable[str | bytes], limits: ParseLimits
+) -> Iterator[str | bytes]:
+    # Checked as each token is pulled, so a lazy source is never read past
+    # the limit.
+    max_tokens = limits.max_tokens
+    max_token_length = limits.max_token_length
+    max_input_length = limits.max_input_length
+
+    count = 0
+    input_length = 0
+    for token in iterable:
+        count += 1
+        if max_tokens is not None and count > max_tokens:
+            raise ParseLimitError(ParseLimit.TOKEN_COUNT, max_tokens, token)
+
+        length = len(token)
+        if max_token_length is not None and length > max_token_length:
+            raise ParseLimitError(ParseLimit.TOKEN_LENGTH, max_token_length, token)
+
+        input_length += length
+        if max_input_length is not None and input_length > max_input_length:
+            raise ParseLimitError(ParseLimit.INPUT_LENGTH, max_input_length, token)
+
+        yield token
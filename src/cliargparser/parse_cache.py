@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable
+import copy
+from dataclasses import dataclass
+from pathlib import PurePath
+from typing import Any
+
+from .argument_parser import ArgumentParser
+from .defaults import apply_lazy_defaults
+from .models import Namespace, ParseContext, TokenStream
+from .models.arguments import Command, Operand, Option
+from .purity import is_pure
+
+
+# Values of these types are shared between copies of a cached result.
+_IMMUTABLE_TYPES: frozenset[type] = frozenset(
+    {str, bytes, int, float, complex, bool, type(None)}
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStatistics:
+    hits: int
+    misses: int
+
+    # Misses whose result was not stored because an impure converter or
+    # action was involved.
+    uncacheable: int
+
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ParseCache:
+    __slots__ = (
+        "_entries",
+        "_hits",
+        "_misses",
+        "_mutation_count",
+        "_pure_commands",
+        "_uncacheable",
+        "command",
+        "maxsize",
+    )
+
+    def __init__(self, command: Command, *, maxsize: int = 128) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive (got: {maxsize})")
+
+        self.command = command
+        self.maxsize = maxsize
+
+        # Least recently used first. Entries are private copies, and every
+        # hit hands out a fresh copy, so callers may modify what they get.
+        self._entries: dict[Hashable, Namespace] = {}
+
+        # id(command) -> whether all of its arguments are pure.
+        self._pure_commands: dict[int, bool] = {}
+
+        self._mutation_count = command._mutation_count
+        self._hits = 0
+        self._misses = 0
+        self._uncacheable = 0
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        return CacheStatistics(
+            hits=self._hits,
+            misses=self._misses,
+            uncacheable=self._uncacheable,
+            size=len(self._entries),
+            maxsize=self.maxsize,
+        )
+
+    def parse_arguments(
+        self, arguments: str | bytes | Iterable[str | bytes]
+    ) -> Namespace:
+        if self._mutation_count != self.command._mutation_count:
+            self.clear()
+
+        # Strings are keyed as given, so an identical command line skips
+        # tokenizing too.
+        key: str | bytes | tuple[str | bytes, ...] = (
+            arguments if isinstance(arguments, (str, bytes)) else tuple(arguments)
+        )
+
+        entries = self._entries
+        namespace = entries.pop(key, None)
+        if namespace is not None:
+            entries[key] = namespace
+            self._hits += 1
+            return _copy_namespace(namespace)
+
+        self._misses += 1
+
+        parsed_namespace = Namespace()
+        context = ParseContext(
+            command=self.command,
+            namespace=parsed_namespace,
+            token_stream=TokenStream(ArgumentParser._split_arguments(key)),
+            command_path=[self.command],
+            namespace_path=[parsed_namespace],
+        )
+        ArgumentParser._parse_tokens(context)
+
+        if Command._lazy_defaults_registered:
+            apply_lazy_defaults(self.command, parsed_namespace)
+
+        # Loading a lazy subcommand while parsing is a mutation of its own.
+        if self._mutation_count != self.command._mutation_count:
+            self.clear()
+
+        if not all(map(self._is_pure_command, context.command_path)):
+            self._uncacheable += 1
+            return parsed_namespace
+
+        if len(entries) >= self.maxsize:
+            del entries[next(iter(entries))]
+
+        entries[key] = _copy_namespace(parsed_namespace)
+        return parsed_namespace
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._pure_commands.clear()
+        self._mutation_count = self.command._mutation_count
+
+    def _is_pure_command(self, command: Command) -> bool:
+        pure = self._pure_commands.get(id(command))
+        if pure is None:
+            arguments: tuple[Option | Operand, ...] = (
+                *command.options,
+                *command.operands,
+            )
+            pure = self._pure_commands[id(command)] = all(
+                is_pure(argument.action)
+                and is_pure(argument.type_converter)
+                and (
+                    argument.batch_converter is None
+                    or is_pure(argument.batch_converter)
+                )
+                and is_pure(argument.decoder)
+                for argument in arguments
+            ) and all(
+                # The environment may change between parses.
+                option.env_var is None
+                and (option.default_factory is None or is_pure(option.default_factory))
+                for option in command._lazy_default_options
+            )
+
+        return pure
+
+
+def _copy_namespace(namespace: Namespace) -> Namespace:
+    return Namespace((key, _copy(value)) for key, value in namespace.items())
+
+
+def _copy(value: Any) -> Any:
+    # A deep copy, with shortcuts for what parsers usually store.
+    value_type = type(value)
+    if value_type in _IMMUTABLE_TYPES or isinstance(value, PurePath):
+        return value
+    elif value_type is list:
+        return [_copy(item) for item in value]
+    elif value_type is tuple:
+        return tuple(_copy(item) for item in value)
+    elif isinstance(value, Namespace):
+        return _copy_namespace(value)
+
+    return copy.deepcopy(value)
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+from importlib import import_module
+import json
+import os
+import sys
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from .models.arguments import Command
+
+
+INDEX_FORMAT_VERSION = 2
+
+
+@dataclass(frozen=True, slots=True)
+class PluginEntry:
+    name: str
+    aliases: tuple[str, ...]
+
+    # Entry point value: `module:attribute`.
+    target: str
+
+
+@dataclass(frozen=True, slots=True)
+class SkippedPlugin:
+    entry: PluginEntry
+    error: Exception
+
+
+@dataclass(frozen=True, slots=True)
+class PluginSubcommands:
+    added: tuple[PluginEntry, ...]
+
+    # Entries that could not be registered, such as on a name conflict. The
+    # other plugins are registered regardless.
+    skipped: tuple[SkippedPlugin, ...]
+
+
+def add_plugin_subcommands(
+    command: Command,
+    group: str,
+    *,
+    cache_path: str | os.PathLike[str] | None = None,
+) -> PluginSubcommands:
+    from .exceptions import ArgumentConflictError
+
+    added: list[PluginEntry] = []
+    skipped: list[SkippedPlugin] = []
+    for entry in load_plugin_index(group, cache_path=cache_path):
+        try:
+            command.lazy_subcommand(
+                entry.name,
+                _PluginLoader(entry.name, entry.target),
+                aliases=entry.aliases,
+            )
+        except ArgumentConflictError as error:
+            skipped.append(SkippedPlugin(entry, error))
+        else:
+            added.append(entry)
+
+    return PluginSubcommands(added=tuple(added), skipped=tuple(skipped))
+
+
+def load_plugin_index(
+    group: str, *, cache_path: str | os.PathLike[str] | None = None
+) -> tuple[PluginEntry, ...]:
+    if cache_path is None:
+        cache_path = default_cache_path(group)
+
+    fingerprint = environment_fingerprint(group)
+
+    entries = _read_index(cache_path, fingerprint)
+    if entries is None:
+        entries = discover_plugins(group)
+        _write_index(cache_path, fingerprint, entries)
+
+    return entries
+
+
+def discover_plugins(group: str) -> tuple[PluginEntry, ...]:
+    from importlib.metadata import entry_points  # Only on a cache miss.
+
+    # Read from the metadata alone; no plugin is imported. An entry point's
+    # name is the subcommand's name, and further entry points with the same
+    # target publish aliases of it.
+    names_by_target: dict[str, list[str]] = {}
+    for entry_point in entry_points(group=group):
+        names = names_by_target.setdefault(entry_point.value, [])
+        if entry_point.name not in names:
+            names.append(entry_point.name)
+
+    return tuple(
+        PluginEntry(name=name, aliases=tuple(aliases), target=target)
+        for target, (name, *aliases) in names_by_target.items()
+    )
+
+
+def load_plugin(target: str) -> Command:
+    from .models.arguments import Command
+
+    module_name, _, attribute = target.partition(":")
+    # Drop entry point extras: `module:attribute [extra]`.
+    attribute, *_ = attribute.partition("[")
+
+    value: Any = import_module(module_name.strip())
+    for part in filter(None, attribute.strip().split(".")):
+        value = getattr(value, part)
+
+    if not isinstance(value, Command):
+        value = value()
+
+    if not isinstance(value, Command):
+        raise TypeError(
+            f"Plugin {target!r} did not provide a Command "
+            f"(got: {type(value).__name__})"
+        )
+
+    return value
+
+
+def environment_fingerprint(group: str) -> str:
+    # Installing, upgrading or removing a distribution adds, renames or
+    # rewrites its `*.dist-info` directory. Listing those is far cheaper than
+    # reading every distribution's entry points.
+    digest = hashlib.sha256()
+    digest.update(f"{INDEX_FORMAT_VERSION}\0{group}\0{sys.executable}\0".encode())
+
+    for path in sys.path:
+        digest.update(f"{path}\0".encode("utf-8", "surrogateescape"))
+
+        try:
+            entries = os.scandir(path or ".")
+        except OSError:
+            continue
+
+        with entries:
+            for entry in entries:
+                if entry.name.endswith((".dist-info", ".egg-info")):
+                    try:
+                        mtime_ns = entry.stat().st_mtime_ns
+                    except OSError:
+                        mtime_ns = -1
+
+                    digest.update(
+                        f"{entry.name}\0{mtime_ns}\0".encode("utf-8", "surrogateescape")
+                    )
+
+    return digest.hexdigest()
+
+
+def default_cache_path(group: str) -> str:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    digest = hashlib.sha256(sys.executable.encode("utf-8", "surrogateescape"))
+
+    return os.path.join(
+        cache_home, "cliargparser", f"plugins-{group}-{digest.hexdigest()[:16]}.json"
+    )
+
+
+def _read_index(
+    cache_path: str | os.PathLike[str], fingerprint: str
+) -> tuple[PluginEntry, ...] | None:
+    try:
+        with open(cache_path, encoding="utf-8") as file:
+            index = json.load(file)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(index, dict) or index.get("fingerprint") != fingerprint:
+        return None
+
+    try:
+        return tuple(
+            PluginEntry(
+                name=name,
+                aliases=tuple(aliases),
+                target=target,
+            )
+            for name, aliases, target in index["plugins"]
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _write_index(
+    cache_path: str | os.PathLike[str],
+    fingerprint: str,
+    entries: tuple[PluginEntry, ...],
+) -> None:
+    index = {
+        "fingerprint": fingerprint,
+        "plugins": [
+            [entry.name, list(entry.aliases), entry.target] for entry in entries
+        ],
+    }
+
+    # Written to a temporary file and renamed, so concurrent starts never see
+    # a partial index. A missing or read-only cache only costs a rescan.
+    directory = os.path.dirname(os.fspath(cache_path)) or "."
+    temporary_path = f"{os.fspath(cache_path)}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(index, file, separators=(",", ":"))
+
+        os.replace(temporary_path, cache_path)
+    except OSError:
+        try:
+            os.unlink(temporary_path)
+        except OSError:
+            pass
+
+
+class _PluginLoader:
+    __slots__ = ("name", "target")
+
+    def __init__(self, name: str, target: str) -> None:
+        self.name = name
+        self.target = target
+
+    def __call__(self) -> Command:
+        subcommand = load_plugin(self.target)
+
+        # Parsed values are stored under the name the subcommand was
+        # registered with, which is the published entry point name.
+        subcommand.name = self.name
+        return subcommand
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r}, {self.target!r})"
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+import os
+from typing import Any
+
+from .actions import (
+    append_present_action,
+    append_value_action,
+    count_presence_action,
+    extend_value_action,
+    store_false_action,
+    store_present_action,
+    store_sequence_action,
+    store_true_action,
+    store_value_action,
+    store_values_action,
+)
+from .converters import convert_floats, convert_ints, convert_paths
+
+
+# Callables whose result depends only on their arguments. Parse results are
+# only reused when every converter and action involved is in here.
+_PURE_CALLABLES: set[Callable[..., Any]] = {
+    str,
+    int,
+    float,
+    os.fsdecode,
+    append_present_action,
+    append_value_action,
+    count_presence_action,
+    extend_value_action,
+    store_false_action,
+    store_present_action,
+    store_sequence_action,
+    store_true_action,
+    store_value_action,
+    store_values_action,
+    convert_floats,
+    convert_ints,
+    convert_paths,
+}
+
+
+def mark_pure[F: Callable[..., Any]](function: F) -> F:
+    _PURE_CALLABLES.add(function)
+    return function
+
+
+def is_pure(function: Callable[..., Any]) -> bool:
+    try:
+        return function in _PURE_CALLABLES
+    except TypeError:  # Unhashable callable objects are never pure.
+        return False
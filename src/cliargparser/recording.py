@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+import gzip
+import json
+import os
+import random
+from types import TracebackType
+from typing import Literal, Self, TextIO
+
+from .argument_parser import ArgumentParser
+from .exceptions import ParserError
+from .models import Namespace
+from .models.arguments import Command
+
+
+CORPUS_FORMAT = "cliargparser-invocations"
+CORPUS_VERSION = 1
+
+
+@dataclass(frozen=True, slots=True)
+class RecordedInvocation:
+    # Names of the commands entered, starting at the root.
+    command_path: tuple[str, ...]
+
+    # `bytes` tokens are stored `os.fsdecode`-ed.
+    arguments: tuple[str, ...]
+
+
+class InvocationRecorder:
+    # Parses like `Command.parse_arguments` and appends a sample of the
+    # invocations to a corpus file. A `.gz` path is gzip-compressed.
+    __slots__ = ("_file", "_random", "command", "sample_rate")
+
+    def __init__(
+        self,
+        command: Command,
+        path: str | os.PathLike[str],
+        *,
+        sample_rate: float = 1.0,
+        seed: int | None = None,
+    ) -> None:
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(
+                f"sample_rate must be within [0, 1] (got: {sample_rate})"
+            )
+
+        self.command = command
+        self.sample_rate = sample_rate
+
+        self._random = random.Random(seed)
+        self._file = _open_corpus(path, "at")
+        if self._file.tell() == 0:
+            self._file.write(_header())
+
+    def parse_arguments(
+        self, arguments: str | bytes | Iterable[str | bytes]
+    ) -> Namespace:
+        if self._random.random() >= self.sample_rate:
+            return self.command.parse_arguments(arguments)
+
+        # Split once, so the recorded tokens are exactly what was parsed.
+        tokens = list(ArgumentParser._split_arguments(arguments))
+        try:
+            return self.command.parse_arguments(tokens)
+        finally:
+            # Failed invocations are part of the workload too.
+            self.record(tokens)
+
+    def record(self, arguments: Iterable[str | bytes]) -> None:
+        tokens = [os.fsdecode(token) for token in arguments]
+        try:
+            command_path = self.command.route_arguments(tokens).command_path
+        except ParserError:
+            command_path = (self.command,)
+
+        self._file.write(
+            _json_line([[command.name for command in command_path], tokens])
+        )
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def write_corpus(
+    path: str | os.PathLike[str], invocations: Iterable[RecordedInvocation]
+) -> None:
+    with _open_corpus(path, "wt") as file:
+        file.write(_header())
+        file.writelines(
+            _json_line([list(invocation.command_path), list(invocation.arguments)])
+            for invocation in invocations
+        )
+
+
+def read_corpus(path: str | os.PathLike[str]) -> Iterator[RecordedInvocation]:
+    with _open_corpus(path, "rt") as file:
+        header = json.loads(file.readline() or "null")
+        if (
+            not isinstance(header, dict)
+            or header.get("format") != CORPUS_FORMAT
+            or header.get("version") != CORPUS_VERSION
+        ):
+            raise ValueError(
+                f"{os.fspath(path)!r} is not a version {CORPUS_VERSION} "
+                "invocation corpus"
+            )
+
+        for line in file:
+            # Appended headers mark where another recorder session started.
+            if line.startswith("{"):
+                continue
+
+            command_path, arguments = json.loads(line)
+            yield RecordedInvocation(
+                command_path=tuple(command_path), arguments=tuple(arguments)
+            )
+
+
+def _open_corpus(
+    path: str | os.PathLike[str], mode: Literal["rt", "wt", "at"]
+) -> TextIO:
+    if os.fspath(path).endswith(".gz"):
+        return gzip.open(path, mode, encoding="utf-8")
+
+    return open(path, mode, encoding="utf-8")
+
+
+def _header() -> str:
+    return _json_line({"format": CORPUS_FORMAT, "version": CORPUS_VERSION})
+
+
+def _json_line(value: object) -> str:
+    # Lone surrogates from `os.fsdecode` survive as `\udcXX` escapes.
+    return json.dumps(value, separators=(",", ":")) + "\n"
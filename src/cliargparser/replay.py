@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+import gc
+import json
+import os
+import platform
+import time
+from typing import Any
+
+from .models.arguments import Command
+from .recording import RecordedInvocation
+
+
+BASELINE_FORMAT = "cliargparser-replay-baseline"
+BASELINE_VERSION = 1
+
+# Throughput may drop by this fraction of the baseline before the gate fails.
+DEFAULT_THRESHOLD = 0.10
+
+
+@dataclass(frozen=True, slots=True)
+class PathMeasurement:
+    command_path: tuple[str, ...]
+    invocations: int
+    errors: int
+
+    # Percentiles of each invocation's best latency over the rounds.
+    p50_ns: int
+    p90_ns: int
+    p99_ns: int
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayReport:
+    invocations: int
+    errors: int
+
+    # Best of the timed rounds over the whole corpus.
+    seconds: float
+
+    paths: tuple[PathMeasurement, ...]
+
+    # Where the report was measured, so baselines can be told apart.
+    python_version: str
+    library_version: str | None
+
+    @property
+    def throughput(self) -> float:
+        return self.invocations / self.seconds if self.seconds else float("inf")
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "format": BASELINE_FORMAT,
+            "version": BASELINE_VERSION,
+            "invocations": self.invocations,
+            "errors": self.errors,
+            "seconds": self.seconds,
+            "python_version": self.python_version,
+            "library_version": self.library_version,
+            "paths": [
+                {
+                    "command_path": list(path.command_path),
+                    "invocations": path.invocations,
+                    "errors": path.errors,
+                    "p50_ns": path.p50_ns,
+                    "p90_ns": path.p90_ns,
+                    "p99_ns": path.p99_ns,
+                }
+                for path in self.paths
+            ],
+        }
+
+    @classmethod
+    def from_json(cls, value: dict[str, Any]) -> ReplayReport:
+        if (
+            value.get("format") != BASELINE_FORMAT
+            or value.get("version") != BASELINE_VERSION
+        ):
+            raise ValueError(f"Not a version {BASELINE_VERSION} replay baseline")
+
+        return cls(
+            invocations=value["invocations"],
+            errors=value["errors"],
+            seconds=value["seconds"],
+            python_version=value["python_version"],
+            library_version=value["library_version"],
+            paths=tuple(
+                PathMeasurement(
+                    command_path=tuple(path["command_path"]),
+                    invocations=path["invocations"],
+                    errors=path["errors"],
+                    p50_ns=path["p50_ns"],
+                    p90_ns=path["p90_ns"],
+                    p99_ns=path["p99_ns"],
+                )
+                for path in value["paths"]
+            ),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayComparison:
+    report: ReplayReport
+    baseline: ReplayReport
+    threshold: float
+
+    @property
+    def throughput_change(self) -> float:
+        # Relative to the baseline; negative is slower.
+        return self.report.throughput / self.baseline.throughput - 1
+
+    @property
+    def error_regressions(self) -> tuple[PathMeasurement, ...]:
+        # Paths failing more invocations than in the baseline. A path the
+        # baseline did not record had no errors there.
+        regressions: list[PathMeasurement] = []
+        for path in self.report.paths:
+            baseline_path = self._baseline_path(path)
+            baseline_errors = 0 if baseline_path is None else baseline_path.errors
+            if path.errors > baseline_errors:
+                regressions.append(path)
+
+        return tuple(regressions)
+
+    @property
+    def regressed(self) -> bool:
+        return (
+            self.throughput_change < -self.threshold
+            or self.report.errors > self.baseline.errors
+            or bool(self.error_regressions)
+        )
+
+    def p50_change(self, path: PathMeasurement) -> float | None:
+        baseline_path = self._baseline_path(path)
+        if baseline_path is None:
+            return None
+
+        return path.p50_ns / baseline_path.p50_ns - 1
+
+    def _baseline_path(self, path: PathMeasurement) -> PathMeasurement | None:
+        for baseline_path in self.baseline.paths:
+            if baseline_path.command_path == path.command_path:
+                return baseline_path
+
+        return None
+
+
+def run_replay(
+    command: Command,
+    invocations: Iterable[RecordedInvocation],
+    *,
+    rounds: int = 5,
+    parse: Callable[[list[str]], Any] | None = None,
+) -> ReplayReport:
+    if rounds < 1:
+        raise ValueError(f"rounds must be positive (got: {rounds})")
+
+    if parse is None:
+        parse = command.parse_arguments
+
+    recorded = list(invocations)
+    corpus = [list(invocation.arguments) for invocation in recorded]
+
+    failed = [False] * len(corpus)
+    latencies = [0] * len(corpus)
+    best = float("inf")
+
+    for round_index in range(rounds):
+        gc.collect()
+        start = time.perf_counter()
+        for index, arguments in enumerate(corpus):
+            start_ns = time.perf_counter_ns()
+            try:
+                parse(arguments)
+            except Exception:
+                failed[index] = True
+            elapsed_ns = time.perf_counter_ns() - start_ns
+
+            if round_index == 0 or elapsed_ns < latencies[index]:
+                latencies[index] = elapsed_ns
+        best = min(best, time.perf_counter() - start)
+
+    # Grouped by the recorded path, so corpora replay against changed trees.
+    grouped: dict[tuple[str, ...], list[int]] = {}
+    errors_by_path: dict[tuple[str, ...], int] = {}
+    for invocation, latency, invocation_failed in zip(
+        recorded, latencies, failed, strict=True
+    ):
+        grouped.setdefault(invocation.command_path, []).append(latency)
+        errors_by_path[invocation.command_path] = (
+            errors_by_path.get(invocation.command_path, 0) + invocation_failed
+        )
+
+    paths: list[PathMeasurement] = []
+    for command_path, path_latencies in sorted(grouped.items()):
+        path_latencies.sort()
+        paths.append(
+            PathMeasurement(
+                command_path=command_path,
+                invocations=len(path_latencies),
+                errors=errors_by_path[command_path],
+                p50_ns=_percentile(path_latencies, 0.50),
+                p90_ns=_percentile(path_latencies, 0.90),
+                p99_ns=_percentile(path_latencies, 0.99),
+            )
+        )
+
+    return ReplayReport(
+        invocations=len(corpus),
+        errors=sum(failed),
+        seconds=best if corpus else 0.0,
+        paths=tuple(paths),
+        python_version=platform.python_version(),
+        library_version=_library_version(),
+    )
+
+
+def load_baseline(path: str | os.PathLike[str]) -> ReplayReport:
+    with open(path, encoding="utf-8") as file:
+        return ReplayReport.from_json(json.load(file))
+
+
+def save_baseline(report: ReplayReport, path: str | os.PathLike[str]) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(report.to_json(), file, indent=2)
+        file.write("\n")
+
+
+def format_report(
+    report: ReplayReport, comparison: ReplayComparison | None = None
+) -> str:
+    lines = [
+        f"{'command path':<32}{'count':>9}{'errors':>8}"
+        f"{'p50 us':>9}{'p90 us':>9}{'p99 us':>9}"
+        + ("" if comparison is None else f"{'p50 vs base':>13}")
+    ]
+    for path in report.paths:
+        line = (
+            f"{' '.join(path.command_path):<32}"
+            f"{path.invocations:>9,}"
+            f"{path.errors:>8,}"
+            f"{path.p50_ns / 1000:>9.1f}"
+            f"{path.p90_ns / 1000:>9.1f}"
+            f"{path.p99_ns / 1000:>9.1f}"
+        )
+        if comparison is not None:
+            change = comparison.p50_change(path)
+            line += f"{'new':>13}" if change is None else f"{change:>+12.1%} "
+
+        lines.append(line.rstrip())
+
+    lines.append("")
+    lines.append(
+        f"{report.invocations:,} invocations, {report.errors:,} errors, "
+        f"{report.throughput:,.0f} inv/s"
+    )
+
+    if comparison is not None:
+        baseline = comparison.baseline
+        lines.append(
+            f"baseline: {baseline.throughput:,.0f} inv/s "
+            f"(library {baseline.library_version or 'unknown'}, "
+            f"Python {baseline.python_version}); "
+            f"{baseline.errors:,} errors; "
+            f"change {comparison.throughput_change:+.1%}, "
+            f"threshold -{comparison.threshold:.0%}: "
+            + ("REGRESSED" if comparison.regressed else "ok")
+        )
+
+        error_regressions = comparison.error_regressions
+        if error_regressions:
+            lines.append(
+                "more errors than the baseline: "
+                + ", ".join(" ".join(path.command_path) for path in error_regressions)
+            )
+
+    return "\n".join(lines)
+
+
+def _percentile(sorted_values: Sequence[int], fraction: float) -> int:
+    if not sorted_values:
+        return 0
+
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * fraction))
+    return sorted_values[index]
+
+
+def _library_version() -> str | None:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("cliargparser")
+    except PackageNotFoundError:
+        return None
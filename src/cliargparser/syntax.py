@@ -0,0 +1,48 @@
+import os
+from typing import Any
+
+from .enums import OptionPrefix, OptionToken, ParsingSentinel
+
+
+# A plain class: built on every import, where a dataclass would cost about
+# a millisecond of CLI startup.
+class TokenSyntax[T: (str, bytes)]:
+    __slots__ = ("end_of_options", "explicit_argument", "long_prefix", "short_prefix")
+
+    end_of_options: T
+    long_prefix: T
+    short_prefix: T
+    explicit_argument: T
+
+    def __init__(
+        self,
+        *,
+        end_of_options: T,
+        long_prefix: T,
+        short_prefix: T,
+        explicit_argument: T,
+    ) -> None:
+        self.end_of_options = end_of_options
+        self.long_prefix = long_prefix
+        self.short_prefix = short_prefix
+        self.explicit_argument = explicit_argument
+
+
+STR_SYNTAX = TokenSyntax[str](
+    end_of_options=ParsingSentinel.END_OF_OPTIONS,
+    long_prefix=OptionPrefix.LONG,
+    short_prefix=OptionPrefix.SHORT,
+    explicit_argument=OptionToken.EXPLICIT_ARGUMENT,
+)
+
+BYTES_SYNTAX = TokenSyntax[bytes](
+    end_of_options=os.fsencode(ParsingSentinel.END_OF_OPTIONS),
+    long_prefix=os.fsencode(OptionPrefix.LONG),
+    short_prefix=os.fsencode(OptionPrefix.SHORT),
+    explicit_argument=os.fsencode(OptionToken.EXPLICIT_ARGUMENT),
+)
+
+
+# `Any`, since a union would not tie the syntax to the token's own type.
+def syntax_for(token: str | bytes) -> TokenSyntax[Any]:
+    return BYTES_SYNTAX if isinstance(token, bytes) else STR_SYNTAX
@@ -0,0 +1,322 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, replace
+import mmap
+import os
+import re
+import shlex
+import time
+
+from .argument_parser import ArgumentParser
+from .compiled_parser import CompiledParser
+from .exceptions import ParserError
+from .models.arguments import Command
+from .plugins import load_plugin
+
+
+# Lines are handed out to workers in ranges of about this many bytes.
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Error kind for lines that fail to split, before the parser sees them.
+MALFORMED_LINE = "malformed_line"
+
+# Without these, `str.split` splits a line exactly like `shlex.split`.
+_SHELL_SYNTAX = re.compile("[\"'\\\\\x0b\x0c\x1c-\x1f]")
+
+
+@dataclass(frozen=True, slots=True)
+class LineError:
+    line_number: int
+
+    # A `ParseIssueKind` value or `MALFORMED_LINE`.
+    kind: str
+    message: str
+
+    # The offending token and its index in the line, when known.
+    token: str | None
+    position: int | None
+
+
+@dataclass(frozen=True, slots=True)
+class ChunkReport:
+    first_line: int
+    line_count: int
+    byte_count: int
+    blank_lines: int
+    invalid_lines: int
+    errors: tuple[LineError, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationSummary:
+    lines: int
+    blank_lines: int
+    invalid_lines: int
+    errors: int
+    byte_count: int
+    seconds: float
+
+    @property
+    def valid_lines(self) -> int:
+        return self.lines - self.blank_lines - self.invalid_lines
+
+    @property
+    def throughput(self) -> float:
+        return self.lines / self.seconds if self.seconds else float("inf")
+
+
+def iter_chunk_reports(
+    command: Command | str,
+    path: str | os.PathLike[str],
+    *,
+    jobs: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    collect_all: bool = False,
+) -> Iterator[ChunkReport]:
+    if jobs < 1:
+        raise ValueError(f"jobs must be positive (got: {jobs})")
+    elif chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive (got: {chunk_size})")
+
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if not size:
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            ranges = _iter_ranges(data, size, chunk_size)
+
+            if jobs == 1:
+                validator = _LineValidator(
+                    load_plugin(command) if isinstance(command, str) else command,
+                    collect_all,
+                )
+
+                first_line = 1
+                for start, end in ranges:
+                    report = _validate_range(validator, data, start, end, first_line)
+                    first_line += report.line_count
+                    yield report
+
+                return
+
+            if not isinstance(command, str):
+                raise ValueError(
+                    "jobs > 1 needs the command as a `module:attribute` target, "
+                    "so that every worker can load it"
+                )
+
+            yield from _iter_parallel_reports(
+                command, path, ranges, jobs, collect_all
+            )
+
+
+def validate_corpus(
+    command: Command | str,
+    path: str | os.PathLike[str],
+    *,
+    jobs: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    collect_all: bool = False,
+    on_error: Callable[[LineError], object] | None = None,
+) -> ValidationSummary:
+    start = time.perf_counter()
+
+    lines = blank_lines = invalid_lines = errors = byte_count = 0
+    for report in iter_chunk_reports(
+        command, path, jobs=jobs, chunk_size=chunk_size, collect_all=collect_all
+    ):
+        lines += report.line_count
+        blank_lines += report.blank_lines
+        invalid_lines += report.invalid_lines
+        errors += len(report.errors)
+        byte_count += report.byte_count
+
+        if on_error is not None:
+            for error in report.errors:
+                on_error(error)
+
+    return ValidationSummary(
+        lines=lines,
+        blank_lines=blank_lines,
+        invalid_lines=invalid_lines,
+        errors=errors,
+        byte_count=byte_count,
+        seconds=time.perf_counter() - start,
+    )
+
+
+def _iter_ranges(
+    data: mmap.mmap, size: int, chunk_size: int
+) -> Iterator[tuple[int, int]]:
+    # Ranges end right after a newline, so no line is split between two.
+    start = 0
+    while start < size:
+        end = start + chunk_size
+        if end < size:
+            newline = data.find(b"\n", end - 1)
+            end = size if newline == -1 else newline + 1
+        else:
+            end = size
+
+        yield start, end
+        start = end
+
+
+def _iter_parallel_reports(
+    target: str,
+    path: str | os.PathLike[str],
+    ranges: Iterator[tuple[int, int]],
+    jobs: int,
+    collect_all: bool,
+) -> Iterator[ChunkReport]:
+    # Workers map the file themselves; only byte offsets cross processes.
+    # At most two ranges per worker are in flight, which bounds memory.
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_initialize_worker,
+        initargs=(target, os.fspath(path), collect_all),
+    ) as executor:
+        pending: deque[Future[ChunkReport]] = deque()
+        first_line = 1
+
+        for start, end in ranges:
+            pending.append(executor.submit(_validate_range_in_worker, start, end))
+            if len(pending) >= jobs * 2:
+                report = _rebase(pending.popleft().result(), first_line)
+                first_line += report.line_count
+                yield report
+
+        while pending:
+            report = _rebase(pending.popleft().result(), first_line)
+            first_line += report.line_count
+            yield report
+
+
+def _rebase(report: ChunkReport, first_line: int) -> ChunkReport:
+    # Workers number lines from 1 within their range.
+    offset = first_line - 1
+    return replace(
+        report,
+        first_line=first_line,
+        errors=tuple(
+            replace(error, line_number=error.line_number + offset)
+            for error in report.errors
+        ),
+    )
+
+
+_worker_state: tuple[_LineValidator, mmap.mmap] | None = None
+
+
+def _initialize_worker(target: str, path: str, collect_all: bool) -> None:
+    global _worker_state
+
+    with open(path, "rb") as file:
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    _worker_state = (_LineValidator(load_plugin(target), collect_all), data)
+
+
+def _validate_range_in_worker(start: int, end: int) -> ChunkReport:
+    assert _worker_state is not None
+    validator, data = _worker_state
+
+    return _validate_range(validator, data, start, end, 1)
+
+
+def _validate_range(
+    validator: _LineValidator,
+    data: mmap.mmap,
+    start: int,
+    end: int,
+    first_line: int,
+) -> ChunkReport:
+    line_number = first_line
+    blank_lines = invalid_lines = 0
+    errors: list[LineError] = []
+
+    position = start
+    while position < end:
+        newline = data.find(b"\n", position, end)
+        if newline == -1:
+            newline = end
+
+        line = data[position:newline].decode("utf-8", "surrogateescape")
+        position = newline + 1
+
+        if not line or line.isspace():
+            blank_lines += 1
+        else:
+            line_errors = validator.validate(line, line_number)
+            if line_errors:
+                invalid_lines += 1
+                errors.extend(line_errors)
+
+        line_number += 1
+
+    return ChunkReport(
+        first_line=first_line,
+        line_count=line_number - first_line,
+        byte_count=end - start,
+        blank_lines=blank_lines,
+        invalid_lines=invalid_lines,
+        errors=tuple(errors),
+    )
+
+
+class _LineValidator:
+    __slots__ = ("collect_all", "command", "compiled_parser")
+
+    def __init__(self, command: Command, collect_all: bool) -> None:
+        self.command = command
+        self.collect_all = collect_all
+
+        # Almost every line is valid; only failures are parsed again for
+        # structured issues.
+        self.compiled_parser = CompiledParser(command)
+
+    def validate(self, line: str, line_number: int) -> list[LineError]:
+        if line.isascii() and _SHELL_SYNTAX.search(line) is None:
+            tokens = line.split()
+        else:
+            try:
+                tokens = shlex.split(line)
+            except ValueError as error:
+                return [
+                    LineError(line_number, MALFORMED_LINE, str(error), None, None)
+                ]
+
+        try:
+            self.compiled_parser.parse_arguments(tokens, lazy_defaults=False)
+        except (ParserError, TypeError, ValueError):
+            # Rejected values raise whatever their converter raises.
+            pass
+        else:
+            return []
+
+        # Defaults come from the environment, not the line being checked.
+        result = ArgumentParser.try_parse_arguments(
+            tokens,
+            self.command,
+            collect_all=self.collect_all,
+            lazy_defaults=False,
+        )
+
+        return [
+            LineError(
+                line_number,
+                issue.kind.value,
+                issue.message,
+                (
+                    issue.token
+                    if isinstance(issue.token, str)
+                    else os.fsdecode(issue.token)
+                ),
+                issue.position,
+            )
+            for issue in result.issues
+        ]
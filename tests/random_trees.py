@@ -0,0 +1,144 @@
+from collections.abc import Callable, Sequence
+import random
+from typing import Any
+
+from cliargparser import Command
+from cliargparser.actions import (
+    append_present_action,
+    append_value_action,
+    count_presence_action,
+    extend_value_action,
+    store_false_action,
+    store_present_action,
+    store_true_action,
+)
+from cliargparser.defaults import KeyedDefault
+from cliargparser.enums import NArgs, ParseMode
+from cliargparser.exceptions import (
+    ArgumentConflictError,
+    OperandAfterNonDeterministicOperandError,
+)
+
+
+def _sum_lengths_action(argument: Any, values: Sequence[Any], current: Any) -> Any:
+    return (current or 0) + len(values)
+
+
+def _settings() -> dict[str, Any]:
+    return {"foo": "S"}
+
+
+ACTIONS = (
+    None,
+    store_true_action,
+    store_false_action,
+    count_presence_action,
+    append_value_action,
+    extend_value_action,
+    store_present_action,
+    append_present_action,
+    _sum_lengths_action,
+)
+DEFAULT_FACTORIES = (
+    lambda: "D",
+    KeyedDefault(_settings, "foo"),
+    KeyedDefault(_settings, "bar", "F"),
+)
+# Set by tests through `monkeypatch`; `ENV_VALUES` are the values to draw from.
+ENV_VARS = ("CLIARGPARSER_TEST_A", "CLIARGPARSER_TEST_B")
+ENV_VALUES = ("", "1", "0", "yes", "Off", "v1")
+OPTION_NARGS = (
+    None, 0, 1, 2, 3, NArgs.OPTIONAL, NArgs.ZERO_OR_MORE, NArgs.ONE_OR_MORE
+)
+OPERAND_NARGS = (
+    None, 1, 2, NArgs.OPTIONAL, NArgs.ZERO_OR_MORE, NArgs.ONE_OR_MORE
+)
+
+LONG_NAMES = ("foo", "bar", "baz", "qux", "a", "b")
+SHORT_NAMES = "abcdefgh"
+SUBCOMMAND_NAMES = ("x", "y", "z")
+
+# Drawn from to build command lines: known and unknown options, clusters,
+# explicit arguments, subcommand names, values, `-` and `--`.
+TOKENS = (
+    "--foo", "--bar", "--baz=1", "--qux", "--a", "--b=", "--nope", "--al",
+    "--foo=x=y", "-a", "-ab", "-abc", "-c=1", "-hx", "-d", "-e", "-fg", "-=",
+    "-", "--", "x", "y", "z", "v1", "v2",
+)
+
+
+def random_command(
+    rng: random.Random,
+    depth: int = 0,
+    *,
+    inherited: bool = False,
+    lazy_defaults: bool = False,
+) -> Command:
+    parse_mode = (
+        ParseMode.COMMAND if depth < 2 and rng.random() < 0.6 else ParseMode.OPERAND
+    )
+    command = Command(f"c{depth}", parse_mode=parse_mode)
+
+    for _ in range(rng.randint(0, 5)):
+        long_names = [rng.choice(LONG_NAMES)] if rng.random() < 0.8 else []
+        short_names = (
+            [rng.choice(SHORT_NAMES)]
+            if rng.random() < 0.7 or not long_names
+            else []
+        )
+        action = rng.choice(ACTIONS)
+
+        options: dict[str, Any] = {
+            "action": action,
+            "nargs": rng.choice(OPTION_NARGS),
+        }
+        if action in (append_present_action, store_present_action):
+            options["present"] = "P"
+        if rng.random() < 0.2:
+            options["type_converter"] = str.upper
+        if rng.random() < 0.1:
+            options["aliases"] = ["al"]
+        if inherited and rng.random() < 0.35:
+            options["inherited"] = True
+        if lazy_defaults and rng.random() < 0.3:
+            options["env_var"] = rng.choice((None, *ENV_VARS))
+            options["default_factory"] = rng.choice((None, *DEFAULT_FACTORIES))
+
+        try:
+            command.option(long_names, short_names, **options)
+        except (ArgumentConflictError, ValueError):
+            pass
+
+    if parse_mode is ParseMode.COMMAND:
+        for name in rng.sample(SUBCOMMAND_NAMES, rng.randint(0, 2)):
+            subcommand = random_command(
+                rng, depth + 1, inherited=inherited, lazy_defaults=lazy_defaults
+            )
+            subcommand.name = name
+            command.add_subcommand(subcommand)
+    else:
+        for index in range(rng.randint(0, 3)):
+            try:
+                command.operand(
+                    f"o{index}",
+                    nargs=rng.choice(OPERAND_NARGS),
+                    action=rng.choice(
+                        (None, append_value_action, extend_value_action)
+                    ),
+                )
+            except OperandAfterNonDeterministicOperandError:
+                break
+
+    return command
+
+
+def random_arguments(rng: random.Random) -> list[str]:
+    return [rng.choice(TOKENS) for _ in range(rng.randint(0, 8))]
+
+
+def outcome(parse: Callable[..., Any], *arguments: Any) -> tuple[Any, ...]:
+    # Comparable results: the value, or the type and arguments of the error.
+    try:
+        return ("ok", parse(*arguments))
+    except Exception as error:
+        return ("error", type(error), error.args)
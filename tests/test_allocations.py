@@ -0,0 +1,114 @@
+from collections.abc import Callable, Iterator
+import gc
+import sys
+import tracemalloc
+from types import CodeType, FunctionType
+
+import pytest
+
+from cliargparser import ArgumentParser, Command, argument_parser
+from cliargparser.actions import (
+    count_presence_action,
+    store_true_action,
+    store_value_action,
+)
+
+
+TOKENS = 2_000
+
+# Bytes allocated per parsed token, temporaries included, with the fixed cost
+# of a parse taken out. What remains is each option's lookup result, the
+# bound classmethods the parser calls and the values it stores; a temporary
+# string or tuple per token costs at least 50 more.
+BUDGETS_PER_TOKEN = {
+    "--verbose": 330,
+    "-v": 235,
+    "-vq": 265,
+    "--output=file": 470,
+    "--output file": 205,
+    "-ofile": 420,
+    "-vo file": 220,
+}
+
+_TOOL_ID = sys.monitoring.PROFILER_ID
+
+
+class AllocationCounter:
+    # Traced memory only shows what is alive, so temporaries are counted from
+    # how far the peak rises above it during each line of `argument_parser`.
+    # LINE events pass no frame objects, so counting allocates nothing itself.
+    def __init__(self) -> None:
+        self.allocated = 0
+        self._current = 0
+
+    def count(self, parse: Callable[[], object]) -> int:
+        codes = list(_parser_code())
+        sys.monitoring.use_tool_id(_TOOL_ID, "allocation test")
+        sys.monitoring.register_callback(
+            _TOOL_ID, sys.monitoring.events.LINE, self._on_line
+        )
+        for code in codes:
+            sys.monitoring.set_local_events(_TOOL_ID, code, sys.monitoring.events.LINE)
+
+        gc.disable()
+        tracemalloc.start()
+        try:
+            self.allocated = 0
+            self._current = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            parse()
+        finally:
+            tracemalloc.stop()
+            gc.enable()
+            for code in codes:
+                sys.monitoring.set_local_events(_TOOL_ID, code, 0)
+            sys.monitoring.register_callback(_TOOL_ID, sys.monitoring.events.LINE, None)
+            sys.monitoring.free_tool_id(_TOOL_ID)
+
+        return self.allocated
+
+    def _on_line(self, code: CodeType, line: int) -> None:
+        # Read before anything here allocates; the tuple is freed again before
+        # the peak is reset, so the next line starts from `self._current`.
+        memory = tracemalloc.get_traced_memory()
+        self.allocated += memory[1] - self._current
+        self._current = memory[0]
+        del memory
+        tracemalloc.reset_peak()
+
+
+def _parser_code() -> Iterator[CodeType]:
+    for value in (*vars(argument_parser).values(), *vars(ArgumentParser).values()):
+        function = getattr(value, "__func__", value)
+        if (
+            isinstance(function, FunctionType)
+            and function.__code__.co_filename == argument_parser.__file__
+        ):
+            yield function.__code__
+
+
+@pytest.fixture(scope="module")
+def command() -> Command:
+    command = Command("tool")
+    command.option("verbose", "v", action=count_presence_action)
+    command.option("quiet", "q", action=store_true_action)
+    command.option("output", "o", action=store_value_action, nargs=1)
+    return command
+
+
+@pytest.mark.parametrize("case", BUDGETS_PER_TOKEN)
+def test_happy_path_allocations_within_budget(command: Command, case: str) -> None:
+    tokens = case.split()
+    arguments = tokens * (TOKENS // len(tokens))
+
+    # Warmed up first, so lazy imports and caches are not counted.
+    ArgumentParser.parse_arguments(arguments, command)
+
+    counter = AllocationCounter()
+    single = counter.count(lambda: ArgumentParser.parse_arguments(tokens, command))
+    repeated = counter.count(
+        lambda: ArgumentParser.parse_arguments(arguments, command)
+    )
+
+    per_token = (repeated - single) / (len(arguments) - len(tokens))
+    assert per_token < BUDGETS_PER_TOKEN[case]
@@ -0,0 +1,32 @@
+import argparse
+
+from cliargparser.argparse_compat import import_argparse_parser
+
+
+def test_unenforced_fields_are_reported() -> None:
+    parser = argparse.ArgumentParser(prog="tool", add_help=False, allow_abbrev=False)
+    parser.add_argument("--level", choices=["low", "high"], required=True)
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--json", action="store_true")
+    group.add_argument("--yaml", action="store_true")
+
+    subparsers = parser.add_subparsers(required=True)
+    run = subparsers.add_parser("run", add_help=False, allow_abbrev=False)
+    run.add_argument("mode", choices=["fast", "slow"])
+
+    imported = import_argparse_parser(parser)
+
+    assert {
+        (unmapped.command_path, unmapped.argument, unmapped.reason)
+        for unmapped in imported.unmapped
+    } == {
+        (("tool",), "--level", "required is recorded but not enforced"),
+        (("tool",), "--level", "choices are recorded but not enforced"),
+        (("tool",), "--json --yaml", "mutual exclusion is recorded but not enforced"),
+        (("tool",), "subcommands", "required is recorded but not enforced"),
+        (("tool", "run"), "mode", "choices are recorded but not enforced"),
+    }
+    assert imported.command.parse_arguments(["--level", "other", "run", "x"]) == {
+        "level": "other",
+        "run": {"mode": "x"},
+    }
@@ -0,0 +1,94 @@
+import os
+
+import pytest
+
+from cliargparser import ArgumentParser, Command, CompiledParser, IncrementalParser
+from cliargparser.actions import count_presence_action, store_value_action
+from cliargparser.enums import ParseMode
+from cliargparser.models import Namespace
+
+
+DEPLOY = os.fsdecode(b"d\xe9ploy")
+
+
+@pytest.fixture
+def command() -> Command:
+    command = Command("tool")
+    command.option("verbose", "v", action=count_presence_action)
+    command.option("output", "o", action=store_value_action, nargs=1)
+    command.option(
+        "raw", "r", action=store_value_action, nargs=1, decoder=bytes
+    )
+    command.option(
+        "name",
+        action=store_value_action,
+        nargs=1,
+        decoder=lambda value: value.decode("latin-1"),
+    )
+    command.option(
+        "level",
+        action=store_value_action,
+        nargs=1,
+        type_converter=int,
+        decoder=lambda value: value.decode("ascii").strip(),
+    )
+    deploy = command.subcommand(DEPLOY, parse_mode=ParseMode.OPERAND)
+    deploy.operand("target")
+    return command
+
+
+def test_cluster_value(command: Command) -> None:
+    expected = {"verbose": 1, "output": os.fsdecode(b"\xff")}
+
+    assert ArgumentParser.parse_arguments([b"-vo\xff"], command) == expected
+    assert CompiledParser(command).parse_arguments([b"-vo\xff"]) == expected
+    assert ArgumentParser.parse_arguments(["-vo\udcff"], command) == expected
+
+
+def test_nul_separated_blob(command: Command) -> None:
+    blob = b"-v\0--output\0f\xff\0-v\0"
+
+    assert ArgumentParser.parse_arguments(blob, command) == {
+        "verbose": 2,
+        "output": os.fsdecode(b"f\xff"),
+    }
+    assert ArgumentParser.parse_arguments(b"", command) == {}
+
+
+def test_non_utf8_subcommand_name(command: Command) -> None:
+    expected = {DEPLOY: {"target": os.fsdecode(b"\xff")}}
+
+    assert ArgumentParser.parse_arguments([b"d\xe9ploy", b"\xff"], command) == (
+        expected
+    )
+    assert ArgumentParser.parse_arguments([DEPLOY, "\udcff"], command) == expected
+    assert ArgumentParser.parse_arguments(b"d\xe9ploy\0\xff\0", command) == (
+        expected
+    )
+
+
+def test_pass_through_decoder_keeps_bytes(command: Command) -> None:
+    namespace = ArgumentParser.parse_arguments([b"-r\xff", b"--raw=\xfe"], command)
+
+    # `str` tokens are never encoded.
+    assert namespace == {"raw": b"\xfe"}
+    assert ArgumentParser.parse_arguments(["-r", "x"], command) == {"raw": "x"}
+
+
+def test_custom_decoder(command: Command) -> None:
+    namespace = ArgumentParser.parse_arguments(
+        [b"--name", b"\xe9", b"--level", b" 3 "], command
+    )
+
+    assert namespace == {"name": "é", "level": 3}
+
+
+def test_incremental_parser_decodes_like_the_parser(command: Command) -> None:
+    arguments = [b"-vo\xff", b"--name=\xe9", b"-r", b"\xfe", b"d\xe9ploy", b"x"]
+    parser = IncrementalParser(command)
+    for token in arguments:
+        parser.feed(token)
+
+    namespace: Namespace = parser.finish()
+    assert namespace == ArgumentParser.parse_arguments(arguments, command)
+    assert namespace["raw"] == b"\xfe"
@@ -0,0 +1,62 @@
+from array import array
+
+import pytest
+
+from cliargparser import Command
+from cliargparser.actions import count_presence_action
+from cliargparser.columnar import iter_column_chunks, parse_columns
+
+
+@pytest.fixture
+def command() -> Command:
+    command = Command("tool")
+    command.option("verbose", "v", action=count_presence_action, default=0)
+
+    deploy = command.subcommand("deploy")
+    deploy.option("region", "r", default="eu")
+    deploy.option("replicas", "n", type_converter=int, default=1)
+
+    command.subcommand("status")
+    return command
+
+
+def test_defaults_only_fill_rows_entering_the_command(command: Command) -> None:
+    chunk = parse_columns(
+        command, ["-v deploy -r us -n 3", "status", "deploy", "-vv"]
+    )
+
+    assert chunk.columns["verbose"] == array("q", [1, 0, 0, 2])
+    assert chunk.columns["deploy.region"] == ["us", None, "eu", None]
+    assert chunk.columns["deploy.replicas"] == [3, None, 1, None]
+    assert chunk.columns["command_path"] == [
+        "tool deploy", "tool status", "tool deploy", "tool"
+    ]
+
+
+def test_entered_rows_reset_per_chunk(command: Command) -> None:
+    first, second = iter_column_chunks(
+        command, ["status", "deploy", "deploy -n 2", "deploy"], chunk_size=2
+    )
+
+    assert first.columns["deploy.replicas"] == [None, 1]
+    assert second.columns["deploy.replicas"] == [2, 1]
+
+
+def test_column_types_are_the_same_in_every_chunk(command: Command) -> None:
+    command.option("size", type_converter=int, nargs=1, default=0)
+
+    chunks = list(
+        iter_column_chunks(
+            command,
+            ["deploy", "--size 1", "deploy -n 2", f"--size {1 << 70}", "-v", "-v"],
+            chunk_size=2,
+        )
+    )
+
+    # Every row enters the root command, so its integer columns are packed.
+    assert [type(chunk.columns["verbose"]) for chunk in chunks] == [array] * 3
+    assert [type(chunk.columns["deploy.replicas"]) for chunk in chunks] == [list] * 3
+
+    # Once a value does not fit, the column stays a list.
+    assert [type(chunk.columns["size"]) for chunk in chunks] == [array, list, list]
+    assert chunks[1].columns["size"] == [0, 1 << 70]
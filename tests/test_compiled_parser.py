@@ -0,0 +1,90 @@
+import random
+import string
+
+import pytest
+from random_trees import outcome, random_arguments, random_command
+
+from cliargparser import ArgumentParser, Command, CompiledParser
+from cliargparser.actions import count_presence_action, store_true_action
+from cliargparser.compiled_parser import _FACTORY_CACHE_SIZE, _factory_cache
+from cliargparser.enums import ParseMode
+from cliargparser.exceptions import UnknownLongOptionError
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_interpreter(seed: int) -> None:
+    rng = random.Random(seed)
+    for _ in range(15):
+        command = random_command(rng)
+        compiled_parser = CompiledParser(command)
+
+        for _ in range(60):
+            arguments = random_arguments(rng)
+            assert outcome(compiled_parser.parse_arguments, arguments) == outcome(
+                ArgumentParser.parse_arguments, arguments, command
+            ), (arguments, compiled_parser.source)
+
+
+def test_regenerates_after_mutation() -> None:
+    command = Command("tool")
+    compiled_parser = CompiledParser(command)
+
+    with pytest.raises(UnknownLongOptionError):
+        compiled_parser.parse_arguments(["--verbose"])
+
+    command.option("verbose", action=store_true_action)
+    assert compiled_parser.parse_arguments(["--verbose"]) == {"verbose": True}
+
+
+def test_compiles_loaded_lazy_subcommand() -> None:
+    def load_remote() -> Command:
+        remote = Command("remote", parse_mode=ParseMode.OPERAND)
+        remote.operand("url")
+        return remote
+
+    command = Command("tool")
+    command.lazy_subcommand("remote", load_remote)
+
+    compiled_parser = CompiledParser(command)
+    assert "resume_interpreted" in compiled_parser.source
+
+    expected = {"remote": {"url": "origin"}}
+    assert compiled_parser.parse_arguments(["remote", "origin"]) == expected
+    assert compiled_parser.parse_arguments(["remote", "origin"]) == expected
+    assert "resume_interpreted" not in compiled_parser.source
+
+
+def test_factory_cache_is_bounded() -> None:
+    for count in range(_FACTORY_CACHE_SIZE + 10):
+        command = Command("tool")
+        for index in range(count):
+            command.option(f"option{index}")
+
+        CompiledParser(command)
+
+    assert len(_factory_cache) <= _FACTORY_CACHE_SIZE
+
+
+def test_matches_interpreter_on_wide_tree() -> None:
+    command = Command("tool")
+    for index in range(100):
+        command.option(f"option{index}", aliases=f"alias{index}")
+    for char in string.ascii_letters:
+        command.option(f"flag-{char}", char, action=count_presence_action)
+    for index in range(30):
+        command.subcommand(f"command{index}").option("region")
+    compiled_parser = CompiledParser(command)
+
+    rng = random.Random(0)
+    tokens = [
+        *(f"--option{index}" for index in range(0, 101, 7)),
+        *(f"--alias{index}=x" for index in range(0, 101, 9)),
+        *(f"-{char}" for char in "aAmMzZ-"),
+        "-zZ", "-aq", "-a1", "--nope", "--nope=x", "--flag-Z", "value",
+    ]
+    for _ in range(300):
+        arguments = rng.choices(tokens, k=rng.randrange(4))
+        arguments.append(f"command{rng.randrange(32)}")
+        assert outcome(compiled_parser.parse_arguments, arguments) == outcome(
+            ArgumentParser.parse_arguments, arguments, command
+        ), arguments
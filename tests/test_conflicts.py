@@ -0,0 +1,132 @@
+import time
+
+import pytest
+
+from cliargparser import Command
+from cliargparser.enums import ParseMode
+from cliargparser.exceptions import (
+    OptionConflictError,
+    StoreNameConflictError,
+    SubcommandConflictError,
+)
+from cliargparser.models import MutexOptionGroup
+
+
+def test_option_name_conflict() -> None:
+    command = Command("tool")
+    verbose = command.option("verbose", "v")
+
+    with pytest.raises(OptionConflictError) as raised:
+        command.option("version", "v")
+
+    assert raised.value.name == "v"
+    assert raised.value.existing is verbose
+    assert command.options == (verbose,)
+    assert command.get_option("version") is None
+
+
+def test_option_alias_conflicts_with_long_name() -> None:
+    command = Command("tool")
+    command.option("verbose")
+
+    with pytest.raises(OptionConflictError):
+        command.option("loud", aliases="verbose")
+
+
+def test_own_option_may_shadow_inherited_option() -> None:
+    command = Command("tool")
+    command.option("verbose", "v", inherited=True)
+    deploy = command.subcommand("deploy")
+
+    own = deploy.option("version", "v")
+
+    assert deploy.get_short_option("v") is own
+
+
+def test_shared_store_name_with_one_default() -> None:
+    command = Command("tool")
+    command.option("color", store_name="color", default=True)
+    command.option("no-color", store_name="color")
+    command.option("colour", store_name="color", default=True)
+
+    with pytest.raises(StoreNameConflictError) as raised:
+        command.option("monochrome", store_name="color", default=False)
+
+    assert raised.value.name == "color"
+
+
+def test_store_name_default_compared_with_later_default() -> None:
+    command = Command("tool")
+    command.option("verbose")
+    command.option("vv", store_name="verbose", default=1)
+
+    with pytest.raises(StoreNameConflictError) as raised:
+        command.option("vvv", store_name="verbose", default=2)
+
+    assert raised.value.existing is command.get_option("vv")
+
+
+def test_store_name_conflicts_across_argument_kinds() -> None:
+    command = Command("tool")
+    command.option("target")
+
+    with pytest.raises(StoreNameConflictError):
+        command.subcommand("target")
+
+    command = Command("tool", parse_mode=ParseMode.OPERAND)
+    command.operand("target")
+
+    with pytest.raises(StoreNameConflictError):
+        command.option("target")
+
+
+def test_subcommand_alias_conflicts_with_name() -> None:
+    command = Command("tool")
+    deploy = command.subcommand("deploy")
+
+    with pytest.raises(SubcommandConflictError) as raised:
+        command.add_subcommand(Command("ship", aliases="deploy"))
+
+    assert raised.value.name == "deploy"
+    assert raised.value.existing is deploy
+    assert command.subcommands == (deploy,)
+    assert command.get_subcommand("ship") is None
+
+
+def test_lazy_subcommand_conflicts_with_name() -> None:
+    command = Command("tool")
+    command.lazy_subcommand("deploy", lambda: Command("deploy"))
+
+    with pytest.raises(SubcommandConflictError):
+        command.subcommand("deploy")
+
+
+def test_mutex_option_group_conflict() -> None:
+    group = MutexOptionGroup()
+    json = group.option("json", "j")
+
+    with pytest.raises(OptionConflictError) as raised:
+        group.option("jsonl", "j")
+
+    assert raised.value.existing is json
+    assert group.options == (json,)
+
+
+def _build(size: int) -> float:
+    start = time.perf_counter()
+    command = Command("tool")
+    operands = command.subcommand("operands", parse_mode=ParseMode.OPERAND)
+    for index in range(size):
+        command.option(f"option-{index}", aliases=f"alias-{index}")
+        command.add_subcommand(Command(f"command-{index}", aliases=f"c{index}"))
+        operands.operand(f"operand-{index}")
+
+    return time.perf_counter() - start
+
+
+def test_build_time_is_linear() -> None:
+    # A quadratic check would make the larger tree take 64 times as long.
+    small = min(_build(1_000) for _ in range(3))
+    large = min(_build(8_000) for _ in range(3))
+
+    assert large < small * 24
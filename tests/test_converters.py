@@ -0,0 +1,42 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from cliargparser import Command
+from cliargparser.actions import store_sequence_action
+from cliargparser.converters import convert_existing_paths
+from cliargparser.enums import NArgs, ParseMode
+
+
+def test_existing_paths(tmp_path: Path) -> None:
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "a.csv").touch()
+    (tmp_path / "link").symlink_to(tmp_path / "data")
+    values = [
+        str(tmp_path / "data" / "a.csv"),
+        str(tmp_path / "data"),
+        str(tmp_path / "link" / "a.csv"),
+        str(tmp_path / "data" / "." / "a.csv"),
+        os.curdir,
+    ]
+
+    command = Command("tool", parse_mode=ParseMode.OPERAND)
+    command.operand(
+        "files",
+        nargs=NArgs.ONE_OR_MORE,
+        batch_converter=convert_existing_paths,
+        action=store_sequence_action,
+    )
+
+    assert command.parse_arguments(values) == {"files": list(map(Path, values))}
+
+
+def test_missing_path(tmp_path: Path) -> None:
+    (tmp_path / "a.csv").touch()
+    missing = str(tmp_path / "b.csv")
+
+    with pytest.raises(FileNotFoundError) as error:
+        convert_existing_paths([str(tmp_path / "a.csv"), missing])
+
+    assert error.value.filename == missing
@@ -0,0 +1,71 @@
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+import cliargparser
+
+
+SOURCE_ROOT = Path(cliargparser.__file__).parents[1]
+
+# Microseconds a CLI spends importing `Command` and parsing its arguments,
+# best of `STARTUP_RUNS` once bytecode is cached, as it is for installed
+# packages.
+STARTUP_BUDGET_US = 15_000
+STARTUP_RUNS = 5
+
+# `typing` and `dataclasses` are imported before timing: the models need
+# them either way, and they would dominate the measurement.
+STARTUP_CODE = (
+    "import dataclasses, sys, time, typing\n"
+    "start = time.perf_counter()\n"
+    "from cliargparser import Command\n"
+    "from cliargparser.enums import ParseMode\n"
+    "command = Command('tool', parse_mode=ParseMode.OPERAND)\n"
+    "command.option('verbose', 'v', nargs=0)\n"
+    "command.operand('path')\n"
+    "command.parse_arguments(['-v', 'file'])\n"
+    "elapsed = time.perf_counter() - start\n"
+)
+
+# Loaded only by the features that need them.
+NOT_NEEDED_AT_STARTUP = (
+    "cliargparser.defaults",
+    "cliargparser.models.arguments.lazy_subcommand",
+    "cliargparser.models.mutex_option_group",
+    "cliargparser.models.parse_limits",
+    "cliargparser.models.parse_result",
+    "cliargparser.models.route_result",
+    "shlex",
+)
+
+
+def run_python(*arguments: str, **env: str) -> subprocess.CompletedProcess[str]:
+    env = {**os.environ, "PYTHONPATH": str(SOURCE_ROOT), **env}
+    return subprocess.run(
+        [sys.executable, *arguments],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+
+
+def test_startup_time_within_budget(tmp_path: Path) -> None:
+    code = STARTUP_CODE + "sys.stdout.write(str(int(elapsed * 1e6)))\n"
+    # An empty value lets bytecode be written even where it is disabled.
+    env = {"PYTHONPYCACHEPREFIX": str(tmp_path), "PYTHONDONTWRITEBYTECODE": ""}
+    run_python("-c", code, **env)
+
+    best = min(
+        int(run_python("-c", code, **env).stdout) for _ in range(STARTUP_RUNS)
+    )
+    assert best < STARTUP_BUDGET_US
+
+
+def test_startup_imports_only_what_parsing_needs() -> None:
+    code = STARTUP_CODE + (
+        f"loaded = {NOT_NEEDED_AT_STARTUP!r}\n"
+        "sys.stdout.write(' '.join(name for name in loaded if name in sys.modules))\n"
+    )
+    assert run_python("-c", code).stdout == ""
@@ -0,0 +1,94 @@
+import pytest
+
+from cliargparser import Command, IncrementalParser
+from cliargparser.actions import (
+    count_presence_action,
+    store_true_action,
+    store_value_action,
+)
+
+
+@pytest.fixture
+def command() -> Command:
+    command = Command("tool")
+    command.option("verbose", "v", action=count_presence_action)
+    command.option("output", "o", action=store_value_action, nargs=1)
+    deploy = command.subcommand("deploy")
+    deploy.option("force", "f", action=store_true_action)
+    command.subcommand("build")
+    return command
+
+
+def test_rollback_undoes_fed_tokens(command: Command) -> None:
+    parser = IncrementalParser(command)
+    parser.feed("-v")
+    checkpoint = parser.checkpoint()
+    parser.feed("-v")
+    parser.feed("--output=file")
+
+    parser.rollback(checkpoint)
+
+    assert parser.namespace == {"verbose": 1}
+
+
+def test_checkpoints_taken_back_to_back_are_distinct(command: Command) -> None:
+    parser = IncrementalParser(command)
+    first = parser.checkpoint()
+    second = parser.checkpoint()
+    parser.feed("-v")
+
+    parser.rollback(second)
+    assert parser.namespace == {}
+
+    # Rolling back to `second` kept it, and releasing it keeps `first`.
+    parser.feed("-v")
+    parser.release(second)
+    parser.rollback(first)
+    assert parser.namespace == {}
+
+    parser.feed("-v")
+    parser.rollback(first)
+    assert parser.namespace == {}
+
+
+def test_rollback_discards_later_checkpoints(command: Command) -> None:
+    parser = IncrementalParser(command)
+    first = parser.checkpoint()
+    parser.feed("-v")
+    second = parser.checkpoint()
+
+    parser.rollback(first)
+
+    with pytest.raises(ValueError):
+        parser.rollback(second)
+    with pytest.raises(ValueError):
+        parser.release(second)
+
+
+def test_rollback_across_subcommand_entry(command: Command) -> None:
+    parser = IncrementalParser(command)
+    parser.feed("-v")
+    checkpoint = parser.checkpoint()
+    parser.feed("deploy")
+    parser.feed("-f")
+
+    parser.rollback(checkpoint)
+
+    assert parser.command_path == (command,)
+    assert parser.namespace == {"verbose": 1}
+
+    parser.feed("build")
+    assert parser.finish() == {"verbose": 1, "build": {}}
+
+
+def test_rollback_restores_pending_option(command: Command) -> None:
+    parser = IncrementalParser(command)
+    parser.feed("-o")
+    checkpoint = parser.checkpoint()
+    parser.feed("first")
+
+    parser.rollback(checkpoint)
+
+    assert parser.pending_option is command.get_short_option("o")
+    parser.feed("second")
+    assert parser.finish() == {"output": "second"}
@@ -0,0 +1,48 @@
+import random
+
+import pytest
+from random_trees import outcome, random_arguments, random_command
+
+from cliargparser import ArgumentParser, Command, CompiledParser, IncrementalParser
+from cliargparser.actions import count_presence_action
+from cliargparser.models import Namespace
+
+
+def parse_incrementally(command: Command, arguments: list[str]) -> Namespace:
+    parser = IncrementalParser(command)
+    for token in arguments:
+        parser.feed(token)
+
+    return parser.finish()
+
+
+def test_stored_at_defining_command() -> None:
+    command = Command("tool")
+    command.option("verbose", "v", action=count_presence_action, inherited=True)
+    deploy = command.subcommand("deploy")
+    deploy.subcommand("run")
+
+    assert command.parse_arguments(["-v", "deploy", "-v", "run", "-v"]) == {
+        "verbose": 3,
+        "deploy": {"run": {}},
+    }
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_parsers_agree(seed: int) -> None:
+    rng = random.Random(seed)
+    for _ in range(15):
+        command = random_command(rng, inherited=True)
+        compiled_parser = CompiledParser(command)
+
+        for _ in range(60):
+            arguments = random_arguments(rng)
+            expected = outcome(ArgumentParser.parse_arguments, arguments, command)
+
+            assert outcome(compiled_parser.parse_arguments, arguments) == expected, (
+                arguments,
+                compiled_parser.source,
+            )
+            assert outcome(parse_incrementally, command, arguments) == expected, (
+                arguments
+            )
@@ -0,0 +1,101 @@
+import random
+
+import pytest
+from random_trees import (
+    ENV_VALUES,
+    ENV_VARS,
+    outcome,
+    random_arguments,
+    random_command,
+)
+
+from cliargparser import (
+    ArgumentParser,
+    Command,
+    CompiledParser,
+    IncrementalParser,
+    ParseCache,
+)
+from cliargparser.actions import store_true_action
+from cliargparser.exceptions import InvalidEnvironmentFlagError
+from cliargparser.models import Namespace
+
+
+def parse_incrementally(command: Command, arguments: list[str]) -> Namespace:
+    parser = IncrementalParser(command)
+    for token in arguments:
+        parser.feed(token)
+
+    return parser.finish()
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("1", {"verbose": True}),
+        ("Yes", {"verbose": True}),
+        (" on ", {"verbose": True}),
+        ("0", {}),
+        ("false", {}),
+        ("OFF", {}),
+        ("", {}),
+    ],
+)
+def test_environment_flag(
+    monkeypatch: pytest.MonkeyPatch, value: str, expected: dict[str, bool]
+) -> None:
+    monkeypatch.setenv("VERBOSE", value)
+    command = Command("tool")
+    command.option("verbose", nargs=0, action=store_true_action, env_var="VERBOSE")
+
+    assert command.parse_arguments([]) == expected
+    assert command.parse_arguments(["--verbose"]) == {"verbose": True}
+
+
+def test_invalid_environment_flag(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("VERBOSE", "maybe")
+    command = Command("tool")
+    command.option("verbose", nargs=0, action=store_true_action, env_var="VERBOSE")
+
+    with pytest.raises(InvalidEnvironmentFlagError) as error:
+        command.parse_arguments([])
+
+    assert (error.value.env_var, error.value.value) == ("VERBOSE", "maybe")
+
+
+def test_environment_value_is_converted(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("LEVEL", "3")
+    command = Command("tool")
+    command.option("level", nargs=1, type_converter=int, env_var="LEVEL")
+
+    assert command.parse_arguments([]) == {"level": 3}
+    assert command.parse_arguments(["--level", "3"]) == {"level": 3}
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_parsers_agree(monkeypatch: pytest.MonkeyPatch, seed: int) -> None:
+    rng = random.Random(seed)
+    for env_var in ENV_VARS:
+        monkeypatch.setenv(env_var, rng.choice(ENV_VALUES))
+
+    for _ in range(15):
+        command = random_command(rng, lazy_defaults=True)
+        compiled_parser = CompiledParser(command)
+        cache = ParseCache(command)
+
+        for _ in range(60):
+            arguments = random_arguments(rng)
+            expected = outcome(ArgumentParser.parse_arguments, arguments, command)
+
+            assert outcome(compiled_parser.parse_arguments, arguments) == expected, (
+                arguments,
+                compiled_parser.source,
+            )
+            assert outcome(parse_incrementally, command, arguments) == expected, (
+                arguments
+            )
+            assert outcome(cache.parse_arguments, arguments) == expected, arguments
+
+            if expected[0] == "ok":
+                result = ArgumentParser.try_parse_arguments(arguments, command)
+                assert result.namespace == expected[1], arguments
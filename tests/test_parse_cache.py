@@ -0,0 +1,69 @@
+from collections.abc import Sequence
+from typing import Any
+
+from cliargparser import Command, ParseCache
+from cliargparser.actions import extend_value_action, store_sequence_action
+from cliargparser.converters import convert_ints
+from cliargparser.enums import NArgs, ParseMode
+from cliargparser.models.arguments import Option
+
+
+def new_object_action(
+    argument: Option, values: Sequence[Any], current_value: Any = None
+) -> Any:
+    return object()
+
+
+def test_hits_are_independent_copies() -> None:
+    command = Command("tool")
+    command.option("tag", action=extend_value_action)
+    run = command.subcommand("run", parse_mode=ParseMode.OPERAND)
+    run.operand(
+        "numbers",
+        nargs=NArgs.ONE_OR_MORE,
+        batch_converter=convert_ints,
+        action=store_sequence_action,
+    )
+    cache = ParseCache(command)
+
+    arguments = ("--tag", "a", "run", "1", "2")
+    first = cache.parse_arguments(arguments)
+    first["tag"].append("b")
+    first["run"]["numbers"].append(99)
+    first["extra"] = True
+
+    second = cache.parse_arguments(arguments)
+    second["run"]["numbers"].append(98)
+
+    third = cache.parse_arguments(arguments)
+    assert third == {"tag": ["a"], "run": {"numbers": convert_ints(["1", "2"])}}
+    assert cache.statistics.hits == 2
+
+
+def test_invalidated_by_own_tree_only() -> None:
+    command = Command("tool")
+    deploy = command.subcommand("deploy")
+    other = Command("other")
+    cache = ParseCache(command)
+
+    cache.parse_arguments(["deploy"])
+    other.option("verbose")
+    cache.parse_arguments(["deploy"])
+    assert cache.statistics.hits == 1
+
+    deploy.option("region")
+    assert cache.parse_arguments(["deploy", "--region", "eu"]) == {
+        "deploy": {"region": "eu"}
+    }
+    assert cache.statistics.size == 1
+
+
+def test_impure_actions_are_not_cached() -> None:
+    command = Command("tool")
+    command.option("seen", action=new_object_action)
+    cache = ParseCache(command)
+
+    assert cache.parse_arguments(["--seen", "x"]) != cache.parse_arguments(
+        ["--seen", "x"]
+    )
+    assert cache.statistics.uncacheable == 2
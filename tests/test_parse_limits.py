@@ -0,0 +1,137 @@
+from collections.abc import Sequence
+
+import pytest
+
+from cliargparser import Command
+from cliargparser.actions import count_presence_action, extend_value_action
+from cliargparser.enums import NArgs, ParseIssueKind, ParseLimit
+from cliargparser.exceptions import ParseLimitError
+from cliargparser.models import ParseLimits
+
+
+# limit -> (limits, arguments, offending token, its position). Tokens read
+# from a `str` input count as positions in the split arguments.
+CASES: dict[
+    ParseLimit, tuple[ParseLimits, str | Sequence[str], str | None, int]
+] = {
+    ParseLimit.INPUT_LENGTH: (
+        ParseLimits(max_input_length=16),
+        ["-v", "--values", "abcdef", "xyz"],
+        "xyz",
+        3,
+    ),
+    ParseLimit.TOKEN_COUNT: (
+        ParseLimits(max_tokens=3),
+        "-v -v deploy -v",
+        "-v",
+        3,
+    ),
+    ParseLimit.TOKEN_LENGTH: (
+        ParseLimits(max_token_length=8),
+        ["-v", "--values", "short", "much-too-long"],
+        "much-too-long",
+        3,
+    ),
+    ParseLimit.SUBCOMMAND_DEPTH: (
+        ParseLimits(max_subcommand_depth=1),
+        ["-v", "deploy", "-v", "run"],
+        "run",
+        3,
+    ),
+    ParseLimit.VALUE_COUNT: (
+        ParseLimits(max_values=2),
+        ["-v", "--values", "a", "b", "c"],
+        "c",
+        4,
+    ),
+    ParseLimit.CLUSTER_LENGTH: (
+        ParseLimits(max_cluster_length=2),
+        ["-v", "-vq", "-vqv"],
+        "-vqv",
+        2,
+    ),
+}
+
+
+@pytest.fixture(scope="module")
+def command() -> Command:
+    command = Command("tool")
+    command.option("verbose", "v", action=count_presence_action, inherited=True)
+    command.option("quiet", "q", action=count_presence_action)
+    command.option("values", nargs=NArgs.ZERO_OR_MORE, action=extend_value_action)
+    command.subcommand("deploy").subcommand("run").subcommand("now")
+    return command
+
+
+@pytest.mark.parametrize("limit", CASES)
+def test_parse_arguments_raises(command: Command, limit: ParseLimit) -> None:
+    limits, arguments, token, _ = CASES[limit]
+
+    with pytest.raises(ParseLimitError) as raised:
+        command.parse_arguments(arguments, limits=limits)
+
+    assert raised.value.limit is limit
+    assert raised.value.token == token
+
+
+@pytest.mark.parametrize("collect_all", [False, True])
+@pytest.mark.parametrize("limit", CASES)
+def test_try_parse_arguments_records(
+    command: Command, limit: ParseLimit, collect_all: bool
+) -> None:
+    limits, arguments, token, position = CASES[limit]
+
+    result = command.try_parse_arguments(
+        arguments, limits=limits, collect_all=collect_all
+    )
+
+    [issue] = result.issues
+    assert issue.kind is ParseIssueKind.LIMIT_EXCEEDED
+    assert isinstance(issue.error, ParseLimitError)
+    assert issue.error.limit is limit
+    assert (issue.token, issue.position) == (token, position)
+
+
+@pytest.mark.parametrize("limit", CASES)
+def test_within_limits(command: Command, limit: ParseLimit) -> None:
+    limits, arguments, _, position = CASES[limit]
+    if isinstance(arguments, str):
+        arguments = arguments.split()
+
+    assert command.try_parse_arguments(arguments[:position], limits=limits).ok
+
+
+def test_input_length_of_string_input(command: Command) -> None:
+    limits = ParseLimits(max_input_length=4)
+
+    result = command.try_parse_arguments("-v -v", limits=limits)
+
+    [issue] = result.issues
+    assert issue.error.args == (ParseLimit.INPUT_LENGTH, 4, None)
+    assert (issue.token, issue.position) == ("", 0)
+
+
+def test_string_input_is_split_lazily(command: Command) -> None:
+    # Splitting all of it would fail on the unterminated quote.
+    arguments = "-v " * 10 + "'unterminated"
+
+    with pytest.raises(ParseLimitError) as raised:
+        command.parse_arguments(arguments, limits=ParseLimits(max_tokens=5))
+    assert raised.value.limit is ParseLimit.TOKEN_COUNT
+
+    with pytest.raises(ValueError, match="quotation"):
+        command.parse_arguments(arguments)
+
+
+def test_errors_before_the_limit_come_first(command: Command) -> None:
+    result = command.try_parse_arguments(
+        ["--nope", "-x", "-vqv"],
+        limits=ParseLimits(max_cluster_length=2),
+        collect_all=True,
+    )
+
+    assert [(issue.kind, issue.position) for issue in result.issues] == [
+        (ParseIssueKind.UNKNOWN_LONG_OPTION, 0),
+        (ParseIssueKind.UNKNOWN_SHORT_OPTION, 1),
+        (ParseIssueKind.LIMIT_EXCEEDED, 2),
+    ]
@@ -0,0 +1,121 @@
+import importlib.metadata
+import os
+from pathlib import Path
+import sys
+from typing import NoReturn
+
+import pytest
+
+from cliargparser import Command
+from cliargparser.enums import ParseMode
+from cliargparser.exceptions import SubcommandConflictError
+from cliargparser.plugins import (
+    add_plugin_subcommands,
+    discover_plugins,
+    environment_fingerprint,
+    load_plugin_index,
+)
+
+
+GROUP = "cliargparser_test.plugins"
+
+
+@pytest.fixture
+def plugin_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    dist_info = tmp_path / "demo_plugins-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(
+        "Metadata-Version: 2.1\nName: demo-plugins\nVersion: 1.0\n"
+    )
+    (dist_info / "entry_points.txt").write_text(
+        f"[{GROUP}]\n"
+        "remote = demo_remote:command\n"
+        "rm = demo_remote:command\n"
+        "status = demo_status:command\n"
+        "broken = demo_broken:command\n"
+    )
+
+    (tmp_path / "demo_remote.py").write_text(
+        "from cliargparser import Command\n"
+        "from cliargparser.enums import ParseMode\n"
+        "command = Command('remote', parse_mode=ParseMode.OPERAND)\n"
+        "command.operand('url')\n"
+    )
+    (tmp_path / "demo_status.py").write_text(
+        "from cliargparser import Command\n"
+        "command = Command('status')\n"
+    )
+    (tmp_path / "demo_broken.py").write_text("raise RuntimeError('broken')\n")
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for module in ("demo_remote", "demo_status", "demo_broken"):
+        monkeypatch.delitem(sys.modules, module, raising=False)
+
+    return tmp_path
+
+
+def test_discovery_imports_no_plugin(plugin_path: Path) -> None:
+    entries = {entry.name: entry for entry in discover_plugins(GROUP)}
+
+    assert entries["remote"].aliases == ("rm",)
+    assert entries["remote"].target == "demo_remote:command"
+    assert set(entries) == {"remote", "status", "broken"}
+    assert "demo_broken" not in sys.modules
+    assert "demo_remote" not in sys.modules
+
+
+def test_conflicting_plugin_is_skipped(plugin_path: Path) -> None:
+    command = Command("tool")
+    command.subcommand("status", parse_mode=ParseMode.OPERAND)
+
+    result = add_plugin_subcommands(
+        command, GROUP, cache_path=plugin_path / "index.json"
+    )
+
+    assert [entry.name for entry in result.added] == ["remote", "broken"]
+    [skipped] = result.skipped
+    assert skipped.entry.name == "status"
+    assert isinstance(skipped.error, SubcommandConflictError)
+
+    assert (plugin_path / "index.json").exists()
+    assert command.parse_arguments(["rm", "origin"]) == {
+        "remote": {"url": "origin"}
+    }
+
+
+def test_index_is_reused(plugin_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache_path = plugin_path / "index.json"
+    entries = load_plugin_index(GROUP, cache_path=cache_path)
+
+    def entry_points(**kwargs: object) -> NoReturn:
+        raise AssertionError("entry points were read again")
+
+    monkeypatch.setattr(importlib.metadata, "entry_points", entry_points)
+
+    assert load_plugin_index(GROUP, cache_path=cache_path) == entries
+
+
+def test_changed_distribution_triggers_rescan(plugin_path: Path) -> None:
+    cache_path = plugin_path / "index.json"
+    fingerprint = environment_fingerprint(GROUP)
+    load_plugin_index(GROUP, cache_path=cache_path)
+
+    # An upgrade replaces the `*.dist-info` directory with one for the new
+    # version.
+    dist_info = plugin_path / "demo_plugins-1.0.dist-info"
+    with open(dist_info / "entry_points.txt", "a") as file:
+        file.write("st = demo_status:command\n")
+    dist_info = dist_info.rename(plugin_path / "demo_plugins-1.1.dist-info")
+
+    upgraded_fingerprint = environment_fingerprint(GROUP)
+    assert upgraded_fingerprint != fingerprint
+
+    entries = {
+        entry.name: entry for entry in load_plugin_index(GROUP, cache_path=cache_path)
+    }
+    assert entries["status"].aliases == ("st",)
+
+    # Rewritten in place, which only changes its modification time.
+    stat = dist_info.stat()
+    os.utime(dist_info, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert environment_fingerprint(GROUP) != upgraded_fingerprint
@@ -0,0 +1,50 @@
+import pytest
+
+from cliargparser.replay import (
+    PathMeasurement,
+    ReplayComparison,
+    ReplayReport,
+    format_report,
+)
+
+
+def report(*errors: int, seconds: float = 1.0) -> ReplayReport:
+    return ReplayReport(
+        invocations=100 * len(errors),
+        errors=sum(errors),
+        seconds=seconds,
+        paths=tuple(
+            PathMeasurement(
+                command_path=("tool", f"sub{index}"),
+                invocations=100,
+                errors=path_errors,
+                p50_ns=1000,
+                p90_ns=2000,
+                p99_ns=3000,
+            )
+            for index, path_errors in enumerate(errors)
+        ),
+        python_version="3.13.0",
+        library_version=None,
+    )
+
+
+@pytest.mark.parametrize(
+    ("current", "regressed"),
+    [
+        (report(1, 2), False),
+        (report(0, 1), False),
+        (report(1, 2, seconds=1.2), True),
+        (report(1, 3), True),
+        # Same total, but moved to another path.
+        (report(2, 1), True),
+        # A path missing from the baseline had no errors there.
+        (report(1, 2, 0), False),
+        (report(1, 1, 1), True),
+    ],
+)
+def test_regressed(current: ReplayReport, regressed: bool) -> None:
+    comparison = ReplayComparison(current, report(1, 2), threshold=0.1)
+
+    assert comparison.regressed is regressed
+    assert ("REGRESSED" in format_report(current, comparison)) is regressed
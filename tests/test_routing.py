@@ -0,0 +1,65 @@
+import os
+import random
+from typing import Any
+
+import pytest
+from random_trees import random_arguments, random_command
+
+from cliargparser import ArgumentParser, Command
+from cliargparser.enums import ParseMode
+from cliargparser.models import Namespace, ParseContext, TokenStream
+
+
+def parsed_command_path(arguments: Any, command: Command) -> list[str]:
+    namespace = Namespace()
+    context = ParseContext(
+        command=command,
+        namespace=namespace,
+        token_stream=TokenStream(ArgumentParser._split_arguments(arguments, None)),
+        command_path=[command],
+        namespace_path=[namespace],
+    )
+    ArgumentParser._parse_tokens(context)
+
+    return [entered.name for entered in context.command_path]
+
+
+def test_skips_option_values() -> None:
+    command = Command("tool")
+    command.option("config", nargs=2)
+    deploy = command.subcommand("deploy", parse_mode=ParseMode.OPERAND)
+    deploy.operand("target")
+
+    result = command.route_arguments(["--config", "deploy", "a", "deploy", "b"])
+
+    assert result.command_path == (command, deploy)
+    assert result.remaining == ["b"]
+    assert result.position == 4
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_parse_arguments(seed: int) -> None:
+    rng = random.Random(seed)
+    for _ in range(15):
+        command = random_command(rng)
+
+        for _ in range(60):
+            arguments: list[Any] = random_arguments(rng)
+            if rng.random() < 0.3:
+                arguments = [os.fsencode(argument) for argument in arguments]
+
+            try:
+                expected = parsed_command_path(arguments, command)
+            except Exception:
+                expected = None
+
+            try:
+                result = ArgumentParser.route_arguments(arguments, command)
+            except Exception:
+                assert expected is None, arguments
+                continue
+
+            assert result.remaining == arguments[result.position :], arguments
+            if expected is not None:
+                routed = [routed.name for routed in result.command_path]
+                assert routed == expected, arguments
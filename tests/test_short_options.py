@@ -0,0 +1,62 @@
+from collections.abc import Callable, Sequence
+
+import pytest
+
+from cliargparser import ArgumentParser, Command, CompiledParser, IncrementalParser
+from cliargparser.actions import store_true_action, store_value_action
+from cliargparser.models import Namespace
+
+
+def parse_incrementally(
+    command: Command, arguments: Sequence[str | bytes]
+) -> Namespace:
+    parser = IncrementalParser(command)
+    for token in arguments:
+        parser.feed(token)
+
+    return parser.finish()
+
+
+PARSERS: dict[str, Callable[[Command, Sequence[str | bytes]], Namespace]] = {
+    "interpreted": lambda command, arguments: ArgumentParser.parse_arguments(
+        arguments, command
+    ),
+    "compiled": lambda command, arguments: CompiledParser(command).parse_arguments(
+        arguments
+    ),
+    "incremental": parse_incrementally,
+}
+
+
+@pytest.fixture
+def command() -> Command:
+    command = Command("tool")
+    command.option("quiet", aliases="q", action=store_true_action)
+    command.option("x", action=store_true_action)
+    command.option("output", "o", action=store_value_action, nargs=1)
+    return command
+
+
+@pytest.mark.parametrize("parse", PARSERS.values(), ids=PARSERS)
+def test_single_character_names_parse_as_short_options(
+    command: Command,
+    parse: Callable[[Command, Sequence[str | bytes]], Namespace],
+) -> None:
+    expected = {"quiet": True, "x": True, "output": "file"}
+
+    assert parse(command, ["-q", "-x", "-o", "file"]) == expected
+    assert parse(command, ["-qxofile"]) == expected
+    assert parse(command, [b"-qxofile"]) == expected
+
+
+def test_own_short_name_shadows_inherited_single_character_name() -> None:
+    command = Command("tool")
+    command.option("x", action=store_true_action, inherited=True)
+    deploy = command.subcommand("deploy")
+    extract = deploy.option("extract", "x", action=store_true_action)
+
+    assert deploy.get_short_option("x") is extract
+    assert command.parse_arguments(["-x", "deploy", "-x"]) == {
+        "x": True,
+        "deploy": {"extract": True},
+    }
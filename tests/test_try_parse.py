@@ -0,0 +1,126 @@
+import random
+
+import pytest
+from random_trees import outcome, random_arguments, random_command
+
+from cliargparser import ArgumentParser, Command
+from cliargparser.enums import ParseIssueKind, ParseMode
+from cliargparser.exceptions import InvalidArgumentValueError
+from cliargparser.models import ParseIssue
+
+
+def describe(issue: ParseIssue) -> tuple[object, ...]:
+    # Issues hold distinct error instances, so they are compared by value.
+    return type(issue.error), issue.error.args, issue.token, issue.position
+
+
+def test_collects_every_issue() -> None:
+    command = Command("tool")
+    command.option("foo", nargs=2)
+    sync = command.subcommand("sync", parse_mode=ParseMode.OPERAND)
+    sync.operand("source")
+
+    result = command.try_parse_arguments(
+        ["--nope", "--foo", "1", "-x", "sync", "a", "b"], collect_all=True
+    )
+
+    assert result.namespace is None
+    assert [(issue.token, issue.position) for issue in result.issues] == [
+        ("--nope", 0),
+        ("--foo", 1),
+        ("-x", 3),
+        ("b", 6),
+    ]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_parse_arguments(seed: int) -> None:
+    rng = random.Random(seed)
+    for _ in range(15):
+        command = random_command(rng)
+
+        for _ in range(60):
+            arguments = random_arguments(rng)
+            expected = outcome(ArgumentParser.parse_arguments, arguments, command)
+
+            result = ArgumentParser.try_parse_arguments(arguments, command)
+            collected = ArgumentParser.try_parse_arguments(
+                arguments, command, collect_all=True
+            )
+
+            if expected[0] == "ok":
+                assert result.ok and collected.ok, arguments
+                assert result.namespace == expected[1], arguments
+                continue
+
+            [issue] = result.issues
+            assert (type(issue.error), issue.error.args) == expected[1:], arguments
+            assert arguments[issue.position] == issue.token, arguments
+            assert describe(collected.issues[0]) == describe(issue), arguments
+
+
+def _reject(token: bytes) -> str:
+    raise ValueError(f"not accepted: {token!r}")
+
+
+def test_records_invalid_values() -> None:
+    command = Command("tool")
+    command.option("level", "l", nargs=1, type_converter=int)
+    command.option(
+        "sizes", nargs=2, batch_converter=lambda values: list(map(int, values))
+    )
+    command.option("name", nargs=1, decoder=_reject)
+
+    result = command.try_parse_arguments(
+        ["--level", "abc", "-l3", "--sizes", "1", "x", b"--name=\xff"],
+        collect_all=True,
+    )
+
+    assert [
+        (issue.kind, issue.token, issue.position) for issue in result.issues
+    ] == [
+        (ParseIssueKind.INVALID_VALUE, "abc", 1),
+        (ParseIssueKind.INVALID_VALUE, "--sizes", 3),
+        (ParseIssueKind.INVALID_VALUE, b"--name=\xff", 6),
+    ]
+    error = result.issues[0].error
+    assert isinstance(error, InvalidArgumentValueError)
+    assert error.argument is command.get_option("level")
+    assert error.value == "abc"
+    assert isinstance(error.error, ValueError)
+    assert result.issues[1].error.args[1] == ["1", "x"]
+
+
+def test_invalid_operand_value_keeps_later_operands_in_place() -> None:
+    command = Command("tool", parse_mode=ParseMode.OPERAND)
+    command.operand("name", decoder=_reject)
+    command.operand("counts", nargs=2, type_converter=int)
+    command.operand("path")
+
+    result = command.try_parse_arguments(
+        [b"\xff", "1", "x", "2", "file", "extra"], collect_all=True
+    )
+
+    assert [
+        (issue.kind, issue.token, issue.position) for issue in result.issues
+    ] == [
+        (ParseIssueKind.INVALID_VALUE, b"\xff", 0),
+        (ParseIssueKind.INVALID_VALUE, "x", 2),
+        (ParseIssueKind.EXTRA_OPERAND, "extra", 5),
+    ]
+
+
+def test_invalid_value_stops_parsing_unless_collecting() -> None:
+    command = Command("tool")
+    command.option("level", nargs=1, type_converter=int)
+
+    result = command.try_parse_arguments(["--level", "abc", "--nope"])
+
+    [issue] = result.issues
+    assert issue.kind is ParseIssueKind.INVALID_VALUE
+    with pytest.raises(InvalidArgumentValueError):
+        result.unwrap()
+
+    # Only collected: raising keeps the converter's own error.
+    with pytest.raises(ValueError, match="invalid literal"):
+        command.parse_arguments(["--level", "abc"])
@@ -0,0 +1,232 @@
+import json
+from pathlib import Path
+import random
+import shlex
+
+import pytest
+
+from cliargparser import Command
+from cliargparser.__main__ import main
+from cliargparser.actions import count_presence_action
+from cliargparser.enums import ParseIssueKind, ParseMode
+from cliargparser.validation import (
+    _SHELL_SYNTAX,
+    MALFORMED_LINE,
+    LineError,
+    iter_chunk_reports,
+    validate_corpus,
+)
+
+
+# Loaded by worker processes through this module.
+COMMAND = Command("tool")
+COMMAND.option("verbose", "v", action=count_presence_action)
+COMMAND.option("level", nargs=1, type_converter=int)
+COMMAND.option("name", nargs=1)
+COMMAND.subcommand("deploy", parse_mode=ParseMode.OPERAND).operand("target")
+
+TARGET = f"{__name__}:COMMAND"
+
+VALID_LINES = (
+    "-vv --level 3",
+    "--name 'two words' deploy prod",
+    "--name=é deploy prod",
+    "deploy prod",
+)
+# Each with the kind of its first error.
+INVALID_LINES = {
+    "--nope": ParseIssueKind.UNKNOWN_LONG_OPTION.value,
+    "-vx": ParseIssueKind.UNKNOWN_SHORT_OPTION.value,
+    "--level abc": ParseIssueKind.INVALID_VALUE.value,
+    "deploy prod extra": ParseIssueKind.EXTRA_OPERAND.value,
+    "--name 'unterminated": MALFORMED_LINE,
+}
+
+
+def write_corpus(
+    path: Path, lines: list[str], *, newline: str = "\n"
+) -> Path:
+    path.write_bytes(newline.join(lines).encode() + newline.encode())
+    return path
+
+
+def random_corpus(rng: random.Random, count: int) -> tuple[list[str], list[int]]:
+    # Returns the lines and the numbers of the invalid ones.
+    lines: list[str] = []
+    invalid: list[int] = []
+    for line_number in range(1, count + 1):
+        choice = rng.random()
+        if choice < 0.1:
+            lines.append(rng.choice(("", "  ")))
+        elif choice < 0.4:
+            lines.append(rng.choice(list(INVALID_LINES)))
+            invalid.append(line_number)
+        else:
+            lines.append(rng.choice(VALID_LINES))
+
+    return lines, invalid
+
+
+def test_reports_errors_with_line_numbers(tmp_path: Path) -> None:
+    lines, invalid = random_corpus(random.Random(0), 300)
+    path = write_corpus(tmp_path / "corpus.txt", lines)
+
+    errors: list[LineError] = []
+    summary = validate_corpus(COMMAND, path, chunk_size=64, on_error=errors.append)
+
+    assert [error.line_number for error in errors] == invalid
+    assert [error.kind for error in errors] == [
+        INVALID_LINES[lines[line_number - 1]] for line_number in invalid
+    ]
+    assert summary.lines == len(lines)
+    assert summary.invalid_lines == len(invalid)
+    assert summary.blank_lines == sum(not line.strip() for line in lines)
+    assert summary.byte_count == path.stat().st_size
+
+
+@pytest.mark.parametrize("chunk_size", [1, 64, 1 << 20])
+def test_parallel_matches_serial(tmp_path: Path, chunk_size: int) -> None:
+    lines, _ = random_corpus(random.Random(chunk_size), 400)
+    path = write_corpus(tmp_path / "corpus.txt", lines)
+
+    serial: list[LineError] = []
+    parallel: list[LineError] = []
+    serial_summary = validate_corpus(
+        TARGET, path, chunk_size=chunk_size, on_error=serial.append
+    )
+    parallel_summary = validate_corpus(
+        TARGET, path, jobs=3, chunk_size=chunk_size, on_error=parallel.append
+    )
+
+    assert parallel == serial
+    assert (
+        parallel_summary.lines,
+        parallel_summary.blank_lines,
+        parallel_summary.invalid_lines,
+        parallel_summary.errors,
+        parallel_summary.byte_count,
+    ) == (
+        serial_summary.lines,
+        serial_summary.blank_lines,
+        serial_summary.invalid_lines,
+        serial_summary.errors,
+        serial_summary.byte_count,
+    )
+
+
+def test_ranges_end_at_line_ends(tmp_path: Path) -> None:
+    lines = ["-v", "--level 3", "deploy prod", "", "--nope"]
+    path = write_corpus(tmp_path / "corpus.txt", lines)
+
+    reports = list(iter_chunk_reports(COMMAND, path, chunk_size=1))
+
+    assert [report.first_line for report in reports] == [1, 2, 3, 4, 5]
+    assert [report.line_count for report in reports] == [1] * 5
+    assert sum(report.byte_count for report in reports) == path.stat().st_size
+    [error] = [error for report in reports for error in report.errors]
+    assert error.line_number == 5
+
+
+def test_crlf_lines(tmp_path: Path) -> None:
+    lines, _ = random_corpus(random.Random(1), 100)
+    unix = write_corpus(tmp_path / "unix.txt", lines)
+    windows = write_corpus(tmp_path / "windows.txt", lines, newline="\r\n")
+
+    unix_errors: list[LineError] = []
+    windows_errors: list[LineError] = []
+    unix_summary = validate_corpus(COMMAND, unix, on_error=unix_errors.append)
+    windows_summary = validate_corpus(
+        COMMAND, windows, on_error=windows_errors.append
+    )
+
+    assert windows_errors == unix_errors
+    assert windows_summary.invalid_lines == unix_summary.invalid_lines
+    assert windows_summary.blank_lines == unix_summary.blank_lines
+
+
+def test_malformed_line(tmp_path: Path) -> None:
+    path = write_corpus(tmp_path / "corpus.txt", ["-v", "--name 'unterminated"])
+
+    errors: list[LineError] = []
+    validate_corpus(COMMAND, path, on_error=errors.append)
+
+    [error] = errors
+    assert error.line_number == 2
+    assert error.kind == MALFORMED_LINE
+    assert error.token is None
+
+
+def test_empty_file(tmp_path: Path) -> None:
+    path = tmp_path / "corpus.txt"
+    path.write_bytes(b"")
+
+    summary = validate_corpus(TARGET, path, jobs=3)
+
+    assert (summary.lines, summary.invalid_lines, summary.errors) == (0, 0, 0)
+
+
+def test_quoted_values_are_split_like_a_shell(tmp_path: Path) -> None:
+    path = write_corpus(tmp_path / "corpus.txt", ["--level 'not a number'"])
+
+    errors: list[LineError] = []
+    validate_corpus(COMMAND, path, on_error=errors.append)
+
+    [error] = errors
+    assert error.token == "not a number"
+    assert error.position == 1
+
+
+def test_plain_split_matches_shlex() -> None:
+    rng = random.Random(0)
+    alphabet = "ab -=\t\r\x0b\x0c\x1f'\"\\#é"
+    checked = 0
+    for _ in range(5_000):
+        line = "".join(rng.choices(alphabet, k=rng.randrange(12)))
+        if line.isascii() and _SHELL_SYNTAX.search(line) is None:
+            assert line.split() == shlex.split(line), repr(line)
+            checked += 1
+
+    assert checked > 100
+
+
+def test_command_line_jsonl(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    path = write_corpus(tmp_path / "corpus.txt", ["-v", "--nope", "", "--level x"])
+
+    exit_code = main(["validate", TARGET, str(path), "--format", "jsonl"])
+
+    *errors, summary = map(json.loads, capsys.readouterr().out.splitlines())
+    assert exit_code == 1
+    assert [(error["line"], error["kind"], error["token"]) for error in errors] == [
+        (2, "unknown_long_option", "--nope"),
+        (4, "invalid_value", "x"),
+    ]
+    assert summary["summary"]["lines"] == 4
+    assert summary["summary"]["valid_lines"] == 1
+    assert summary["summary"]["invalid_lines"] == 2
+    assert summary["summary"]["blank_lines"] == 1
+
+
+def test_command_line_text(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    path = write_corpus(tmp_path / "corpus.txt", ["-v", "deploy prod"])
+
+    exit_code = main(["validate", TARGET, str(path), "--jobs", "2"])
+
+    assert exit_code == 0
+    assert capsys.readouterr().out.startswith("2 lines: 2 valid, 0 invalid")
+
+
+@pytest.mark.parametrize(
+    "arguments", [["--jobs", "-1"], ["--jobs", "x"], ["--chunk-size", "0"]]
+)
+def test_command_line_rejects_bad_counts(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], arguments: list[str]
+) -> None:
+    with pytest.raises(SystemExit) as raised:
+        main(["validate", TARGET, str(tmp_path / "corpus.txt"), *arguments])
+
+    assert raised.value.code == 2
+    assert f"argument {arguments[0]}:" in capsys.readouterr().err